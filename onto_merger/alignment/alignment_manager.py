@@ -1,19 +1,31 @@
 """Alignment process runner and helper methods."""
 
-from typing import List, Tuple
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from onto_merger.alignment import mapping_utils, merge_utils
+from onto_merger.alignment import delta_utils, mapping_utils, merge_utils, shard_utils
+from onto_merger.alignment.mapping_index import MappingIndex
+from onto_merger.alignment.membership_utils import (
+    filter_table_for_node_ids,
+    produce_node_id_index,
+)
+from onto_merger.alignment.merge_log import MergeLog
 from onto_merger.analyser import analysis_utils
 from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
     COLUMN_MAPPING_TYPE_GROUP,
     COLUMN_NAMESPACE,
     COLUMN_PROVENANCE,
     COLUMN_RELATION,
+    COLUMN_SOURCE_ID,
     COLUMN_SOURCE_ID_ALIGNED_TO,
     COLUMN_STEP_COUNTER,
+    COLUMN_TARGET_ID,
     MAPPING_TYPE_GROUP_EQV,
     MAPPING_TYPE_GROUP_XREF,
     ONTO_MERGER,
@@ -27,15 +39,18 @@ from onto_merger.data.constants import (
     TABLE_MERGES_WITH_META_DATA,
     TABLE_NODES,
     TABLE_NODES_OBSOLETE,
+    TABLE_NODES_REALIGNED,
 )
 from onto_merger.data.data_manager import DataManager
 from onto_merger.data.dataclasses import (
     AlignmentConfig,
+    AlignmentDelta,
     AlignmentStep,
     DataRepository,
     NamedTable,
     convert_alignment_steps_to_named_table,
 )
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
 from onto_merger.logger.log import get_logger
 
 logger = get_logger(__name__)
@@ -49,23 +64,38 @@ class AlignmentManager:
             alignment_config: AlignmentConfig,
             data_repo: DataRepository,
             data_manager: DataManager,
+            alignment_delta: Optional[AlignmentDelta] = None,
     ):
         """Initialise the AlignmentManager class.
 
         :param alignment_config: The alignment process configuration dataclass.
         :param data_repo: The data repository that stores the input tables.
         :param data_manager: The data manager instance.
+        :param alignment_delta: The input changes since the previous run, if given only the
+        nodes affected by the changes are aligned (incremental alignment).
         """
         self._alignment_config = alignment_config
         self._data_manager = data_manager
         self._data_repo_input = data_repo
+        self._alignment_delta = alignment_delta
 
         # store alignment steps data
         self._alignment_steps: List[AlignmentStep] = []
 
         # store produced data
         self._data_repo_output = DataRepository()
-        self._data_repo_output.update(table=DataManager.produce_empty_merge_table())
+        self._merge_log = MergeLog()
+        self._candidate_mappings: Dict[Tuple[str, str], DataFrame] = {}
+        self._sharded_step_results: Dict[Tuple[str, str], Tuple[int, DataFrame, DataFrame]] = {}
+
+        # track the unmapped (not yet merged) input nodes via their node ID dictionary codes, the
+        # dictionary only holds the input node IDs, as the aligned mappings only reference input nodes
+        self._node_id_dictionary = NodeIdDictionary(
+            node_ids=self._data_repo_input.get(TABLE_NODES).dataframe[COLUMN_DEFAULT_ID]
+        )
+        self._input_node_codes = np.arange(len(self._node_id_dictionary))
+        self._is_node_unmapped = np.zeros(len(self._node_id_dictionary), dtype=bool)
+        self._clear_merges()
 
     def align_nodes(self) -> Tuple[DataRepository, List[str]]:
         """Run the alignment pipeline.
@@ -76,18 +106,37 @@ class AlignmentManager:
         alignment order list.
         """
         # prepare for alignment
-        self._preprocess_mappings()
         source_alignment_order = _produce_source_alignment_priority_order(
             seed_ontology_name=self._alignment_config.base_config.seed_ontology_name,
             nodes=self._data_repo_input.get(TABLE_NODES).dataframe,
         )
+        if self._alignment_delta is not None and not self._is_source_alignment_order_unchanged(
+                source_alignment_order=source_alignment_order, alignment_delta=self._alignment_delta
+        ):
+            logger.info("The source alignment order changed since the previous run, all nodes are aligned.")
+            self._alignment_delta = None
+        self._preprocess_mappings()
+        self._produce_candidate_mappings(
+            sources_to_align=source_alignment_order,
+            mapping_type_groups={
+                MAPPING_TYPE_GROUP_EQV: self._alignment_config.mapping_type_groups.equivalence,
+                MAPPING_TYPE_GROUP_XREF: self._alignment_config.mapping_type_groups.database_reference,
+            },
+        )
 
         # (1) use the strongest relations: equivalence
         self._create_initial_step(mapping_type_group_name=MAPPING_TYPE_GROUP_EQV)
+        if self._alignment_config.base_config.sharded_alignment:
+            self._produce_step_results_in_shards(
+                steps=[
+                    (mapping_type_group_name, source_id)
+                    for mapping_type_group_name in [MAPPING_TYPE_GROUP_EQV, MAPPING_TYPE_GROUP_XREF]
+                    for source_id in source_alignment_order
+                ]
+            )
         self._align_sources(
             sources_to_align=source_alignment_order,
             mapping_type_group_name=MAPPING_TYPE_GROUP_EQV,
-            mapping_types=self._alignment_config.mapping_type_groups.equivalence,
             start_step=0,
         )
 
@@ -95,12 +144,11 @@ class AlignmentManager:
         self._align_sources(
             sources_to_align=source_alignment_order,
             mapping_type_group_name=MAPPING_TYPE_GROUP_XREF,
-            mapping_types=self._alignment_config.mapping_type_groups.database_reference,
             start_step=len(source_alignment_order)
         )
 
         # remove self merges
-        all_merges = self._data_repo_output.get(TABLE_MERGES_WITH_META_DATA).dataframe
+        all_merges = self._merge_log.produce_named_table_merges().dataframe
         filtered_merges = pd.concat([
             all_merges,
             self._data_repo_output.get("SEED_MERGES").dataframe]).drop_duplicates(keep=False)
@@ -116,18 +164,112 @@ class AlignmentManager:
 
         return self._data_repo_output, source_alignment_order
 
+    def _produce_candidate_mappings(
+            self,
+            sources_to_align: List[str],
+            mapping_type_groups: Dict[str, List[str]],
+    ) -> None:
+        """Produce the candidate mappings for each source and mapping type group in parallel.
+
+        The candidate mappings do not depend on the nodes mapped in the preceding steps,
+        so they are computed in a process pool ahead of the sequential alignment steps.
+
+        Results are stored in the internal candidate mapping dictionary.
+
+        :param sources_to_align: The source alignment priority order list.
+        :param mapping_type_groups: The mapping types for each mapping type group name.
+        :return:
+        """
+        logger.info(
+            f"Starting to produce candidate mappings for {len(sources_to_align)} sources and "
+            + f"{len(mapping_type_groups)} mapping type groups..."
+        )
+        mappings_for_sources = {
+            source_id: self._mapping_index.get_mappings_for_namespace(namespace=source_id)
+            for source_id in sources_to_align
+        }
+        with ProcessPoolExecutor(max_workers=self._alignment_config.base_config.worker_count) as executor:
+            futures = {
+                (mapping_type_group_name, source_id): executor.submit(
+                    mapping_utils.produce_candidate_mappings_for_source,
+                    source_id=source_id,
+                    mapping_type_group_name=mapping_type_group_name,
+                    mapping_types=mapping_types,
+                    mappings_for_ns=mappings_for_sources[source_id],
+                )
+                for mapping_type_group_name, mapping_types in mapping_type_groups.items()
+                for source_id in sources_to_align
+            }
+            self._candidate_mappings = {key: future.result() for key, future in futures.items()}
+        logger.info("Finished producing candidate mappings.")
+
+    def _produce_step_results_in_shards(self, steps: List[Tuple[str, str]]) -> None:
+        """Run the alignment steps on shards of the mapping graph in parallel.
+
+        Merges only interact within a connected component of the mapping graph, so the
+        steps can be run on groups of components (shards) independently, and the shard
+        results are combined into the results of the serial run. The step meta data and
+        the merges are recorded afterwards in the sequential alignment steps.
+
+        Results are stored in the internal sharded step result dictionary.
+
+        :param steps: The mapping type group name and source of each step, in the order of the steps.
+        :return:
+        """
+        worker_count = self._alignment_config.base_config.worker_count or os.cpu_count() or 1
+        shard_count = worker_count * shard_utils.SHARD_COUNT_PER_WORKER
+        node_shards = shard_utils.produce_node_shards(
+            node_id_dictionary=self._node_id_dictionary,
+            mappings=self._data_repo_output.get(TABLE_MAPPINGS_FOR_INPUT_NODES).dataframe,
+            shard_count=shard_count,
+        )
+        candidate_mappings_for_shards = {
+            step: shard_utils.split_table_into_shards(
+                table=self._candidate_mappings[step],
+                node_id_dictionary=self._node_id_dictionary,
+                node_shards=node_shards,
+                shard_count=shard_count,
+            )
+            for step in steps
+        }
+        unmapped_node_codes = np.flatnonzero(self._is_node_unmapped)
+        shards_to_align = [
+            shard for shard in range(shard_count)
+            if any(len(tables[shard]) > 0 for tables in candidate_mappings_for_shards.values())
+        ]
+        logger.info(f"Starting to align {len(shards_to_align)} shards of the mapping graph...")
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            futures = [
+                executor.submit(
+                    shard_utils.align_shard,
+                    candidate_mappings={step: tables[shard] for step, tables in candidate_mappings_for_shards.items()},
+                    unmapped_node_ids=self._node_id_dictionary.decode(
+                        unmapped_node_codes[node_shards[unmapped_node_codes] == shard]
+                    ),
+                    steps=steps,
+                )
+                for shard in shards_to_align
+            ]
+            shard_step_results = [future.result() for future in futures]
+        self._sharded_step_results = {
+            step: shard_utils.combine_shard_step_results(
+                candidate_mappings=self._candidate_mappings[step],
+                step_results=[step_results[step] for step_results in shard_step_results],
+            )
+            for step in steps
+        }
+        logger.info("Finished aligning shards.")
+
     def _align_sources(
             self,
             sources_to_align: List[str],
             mapping_type_group_name: str,
-            mapping_types: List[str],
             start_step: int,
     ) -> None:
         """Run the alignment for each source according to the priority order, for a given mapping type group.
 
         :param sources_to_align: The source alignment priority order list.
         :param mapping_type_group_name: The name of mapping type group.
-        :param mapping_types: The mapping types in the given type group.
 
         Results are stored in the internal data repository.
 
@@ -144,7 +286,6 @@ class AlignmentManager:
                 source_id=source_id,
                 step_counter=step_counter,
                 mapping_type_group_name=mapping_type_group_name,
-                mapping_types=mapping_types,
             )
             self._store_results_from_alignment_step(merges_for_source=merges_for_source, alignment_step=alignment_step)
 
@@ -153,68 +294,56 @@ class AlignmentManager:
             source_id: str,
             step_counter: int,
             mapping_type_group_name: str,
-            mapping_types: List[str],
     ) -> Tuple[NamedTable, AlignmentStep]:
         """Perform an alignment step to a source.
 
         :param source_id: The source the unmapped nodes are aligned to.
         :param step_counter: The step number.
         :param mapping_type_group_name: The name of mapping type group.
-        :param mapping_types: The mapping types in the given type group.
         :return: The merge named table for the step, and the step meta data dataclass.
         """
-        unmapped_nodes = merge_utils.produce_table_unmapped_nodes(
-            nodes=self._data_repo_input.get(TABLE_NODES).dataframe,
-            merges=self._data_repo_output.get(TABLE_MERGES_WITH_META_DATA).dataframe,
+        count_unmapped_nodes = self._count_unmapped_nodes
+        logger.info(
+            f"Out of {len(self._input_node_codes):,d} nodes, {count_unmapped_nodes:,d} "
+            + f"({((count_unmapped_nodes / len(self._input_node_codes)) * 100):.2f}%) are unmapped."
         )
 
-        # (1) get mappings for NS
-        mappings_for_ns = mapping_utils.get_mappings_for_namespace(
-            namespace=source_id,
-            edges=self._data_repo_output.get(TABLE_MAPPINGS_FOR_INPUT_NODES).dataframe,
-        )
         alignment_step = AlignmentStep(
             mapping_type_group=mapping_type_group_name,
             source=source_id,
             step_counter=step_counter,
-            count_unmapped_nodes=len(unmapped_nodes),
-        )
-
-        # (2) filter for permitted mapping types
-        mappings_for_permitted_type = mapping_utils.get_mappings_with_mapping_relations(
-            permitted_mapping_relations=mapping_types, mappings=mappings_for_ns
-        )
-
-        # (3) orient mappings towards NS
-        mapping_towards_ns = mapping_utils.orient_mappings_to_namespace(
-            required_target_id_namespace=source_id,
-            mappings=mappings_for_permitted_type,
+            count_unmapped_nodes=count_unmapped_nodes,
         )
 
-        # (4) get 1..n : 1 mappings for unmapped nodes
-        mappings_deduplicated = mapping_utils.deduplicate_mappings_for_type_group(
-            mapping_type_group_name=mapping_type_group_name, mappings=mapping_towards_ns
-        )
-        mappings_for_unmapped_nodes = mapping_utils.filter_mappings_for_node_set(
-            nodes=unmapped_nodes,
-            mappings=mappings_deduplicated,
-        )
-        mappings_one_or_many_source_to_one_target = mapping_utils.get_one_or_many_source_to_one_target_mappings(
-            mappings=mappings_for_unmapped_nodes,
-        )
-        mappings_one_source_to_many_target_mappings = mapping_utils.get_one_source_to_many_target_mappings(
-            mappings=mappings_for_unmapped_nodes,
-        )
+        # (1) get the candidate mappings (for NS, of permitted type, oriented towards NS, deduplicated)
+        # and (2) get 1..n : 1 mappings for unmapped nodes, unless already produced for the shards
+        step = (mapping_type_group_name, source_id)
+        if step in self._sharded_step_results:
+            (
+                count_mappings,
+                mappings_one_or_many_source_to_one_target,
+                mappings_one_source_to_many_target_mappings,
+            ) = self._sharded_step_results.pop(step)
+        else:
+            (
+                count_mappings,
+                mappings_one_or_many_source_to_one_target,
+                mappings_one_source_to_many_target_mappings,
+            ) = mapping_utils.produce_mappings_for_alignment_step(
+                node_id_dictionary=self._node_id_dictionary,
+                is_node_unmapped=self._is_node_unmapped,
+                candidate_mappings=self._candidate_mappings[step],
+            )
         self._data_manager.save_dropped_mappings_table(
             table=mappings_one_source_to_many_target_mappings,
             step_count=step_counter,
             source_id=source_id,
             mapping_type=mapping_type_group_name,
         )
-        alignment_step.count_mappings = len(mappings_for_unmapped_nodes)
+        alignment_step.count_mappings = count_mappings
         alignment_step.count_nodes_one_source_to_many_target = len(mappings_one_source_to_many_target_mappings)
 
-        # (5) produce return tables
+        # (3) produce return tables
         merge_table = merge_utils.produce_named_table_merges_with_alignment_meta_data(
             merges=mappings_one_or_many_source_to_one_target,
             source_id=source_id,
@@ -239,7 +368,7 @@ class AlignmentManager:
         # and have the correct mapping relation (e.g. xref could be too weak to merge)
         mappings_obsolete_to_current_node_id = mapping_utils.get_mappings_obsolete_to_current_node_id(
             nodes_obsolete=self._data_repo_input.get(TABLE_NODES_OBSOLETE).dataframe,
-            mappings=self._data_repo_input.get(TABLE_MAPPINGS).dataframe,
+            mappings=self._data_repo_input.get(TABLE_MAPPINGS),
         )
         mappings_obsolete_to_current_node_id_merge_strength = mapping_utils.get_mappings_with_mapping_relations(
             permitted_mapping_relations=self._alignment_config.mapping_type_groups.equivalence,
@@ -249,7 +378,7 @@ class AlignmentManager:
         # get the mappings without the internal code reassignment and update
         # any obsolete node IDs
         mappings_updated = mapping_utils.get_mappings_with_updated_node_ids(
-            mappings=self._data_repo_input.get(TABLE_MAPPINGS).dataframe,
+            mappings=self._data_repo_input.get(TABLE_MAPPINGS),
             mappings_obsolete_to_current_node_id=mappings_obsolete_to_current_node_id_merge_strength,
         )
         self._data_repo_output.update(table=NamedTable(name=TABLE_MAPPINGS_UPDATED, dataframe=mappings_updated))
@@ -262,6 +391,17 @@ class AlignmentManager:
         self._data_repo_output.update(
             table=NamedTable(name=TABLE_MAPPINGS_FOR_INPUT_NODES, dataframe=mappings_for_input_nodes)
         )
+        mappings_to_align = mappings_for_input_nodes
+        if self._alignment_delta is not None:
+            mappings_to_align = self._filter_mappings_for_nodes_to_realign(
+                alignment_delta=self._alignment_delta,
+                mappings_updated=mappings_updated,
+                mappings_for_input_nodes=mappings_for_input_nodes,
+                mappings_obsolete_to_current_node_id=mappings_obsolete_to_current_node_id_merge_strength,
+            )
+        self._mapping_index: MappingIndex = MappingIndex(
+            mappings=mappings_to_align, node_id_dictionary=self._node_id_dictionary
+        )
 
         #
         mappings_obsolete_to_current_node_id_applicable = mapping_utils.get_nodes_with_updated_node_ids(
@@ -280,15 +420,73 @@ class AlignmentManager:
         mappings_obsolete_to_current_node_id_applicable[COLUMN_STEP_COUNTER] = 0
         mappings_obsolete_to_current_node_id_applicable[COLUMN_SOURCE_ID_ALIGNED_TO] = "INTERNAL"
         mappings_obsolete_to_current_node_id_applicable[COLUMN_MAPPING_TYPE_GROUP] = MAPPING_TYPE_GROUP_EQV
+        self._add_merges(merges=mappings_obsolete_to_current_node_id_applicable[SCHEMA_MERGE_TABLE_WITH_META_DATA])
+
+        logger.info("Finished pre-processing mappings.")
+
+    def _is_source_alignment_order_unchanged(
+            self, source_alignment_order: List[str], alignment_delta: AlignmentDelta
+    ) -> bool:
+        """Check whether the source alignment order is the same as in the previous run.
+
+        :param source_alignment_order: The source alignment order of the current run.
+        :param alignment_delta: The input changes since the previous run.
+        :return: True if the order is unchanged.
+        """
+        return source_alignment_order == _produce_source_alignment_priority_order(
+            seed_ontology_name=self._alignment_config.base_config.seed_ontology_name,
+            nodes=delta_utils.produce_nodes_before_delta(
+                nodes=self._data_repo_input.get(TABLE_NODES).dataframe,
+                nodes_delta=alignment_delta.nodes,
+            ),
+        )
+
+    def _filter_mappings_for_nodes_to_realign(
+            self,
+            alignment_delta: AlignmentDelta,
+            mappings_updated: DataFrame,
+            mappings_for_input_nodes: DataFrame,
+            mappings_obsolete_to_current_node_id: DataFrame,
+    ) -> DataFrame:
+        """Filter the mappings for the nodes affected by the input changes, i.e. the nodes to be re-aligned.
+
+        Merges only interact within a connected component of the mapping graph, so the nodes in
+        the components of the changed nodes, their current node IDs and their mapped nodes (that
+        may have lost or gained mappings with the changed nodes) are re-aligned.
+
+        The re-aligned node IDs are stored in the internal data repository.
+
+        :param alignment_delta: The input changes since the previous run.
+        :param mappings_updated: The mappings with updated (current) node IDs.
+        :param mappings_for_input_nodes: The mappings that cover input nodes.
+        :param mappings_obsolete_to_current_node_id: The obsolete to current node ID mappings.
+        :return: The mappings of the nodes to be re-aligned.
+        """
+        changed_node_ids = alignment_delta.get_changed_node_ids()
+        affected_node_ids = [changed_node_ids]
+        for mappings in [mappings_obsolete_to_current_node_id, mappings_updated]:
+            for node_id_column in [COLUMN_SOURCE_ID, COLUMN_TARGET_ID]:
+                mappings_of_changed_nodes = filter_table_for_node_ids(
+                    table=mappings,
+                    node_id_index=produce_node_id_index(node_ids=changed_node_ids),
+                    node_id_columns=[node_id_column],
+                )
+                affected_node_ids.extend(
+                    [mappings_of_changed_nodes[COLUMN_SOURCE_ID], mappings_of_changed_nodes[COLUMN_TARGET_ID]]
+                )
+            changed_node_ids = pd.concat(affected_node_ids, ignore_index=True)
+        realigned_node_ids = delta_utils.get_node_ids_in_components_of_node_ids(
+            edge_tables=[mappings_for_input_nodes], node_ids=changed_node_ids,
+        )
         self._data_repo_output.update(
-            table=DataManager.merge_tables_of_same_type(
-                tables=[NamedTable(TABLE_MERGES_WITH_META_DATA,
-                                   mappings_obsolete_to_current_node_id_applicable[SCHEMA_MERGE_TABLE_WITH_META_DATA]),
-                        self._data_repo_output.get(TABLE_MERGES_WITH_META_DATA)]
+            table=NamedTable(
+                name=TABLE_NODES_REALIGNED, dataframe=pd.DataFrame({COLUMN_DEFAULT_ID: realigned_node_ids})
             )
         )
-
-        logger.info("Finished pre-processing mappings.")
+        logger.info(f"Re-aligning {len(realigned_node_ids):,d} nodes affected by the input changes.")
+        return filter_table_for_node_ids(
+            table=mappings_for_input_nodes, node_id_index=realigned_node_ids, node_id_columns=[COLUMN_SOURCE_ID]
+        )
 
     def _create_initial_step(self, mapping_type_group_name: str) -> None:
         """Produce and store the initial set of merges (self merges for the seed ontology) and the step meta data.
@@ -303,10 +501,11 @@ class AlignmentManager:
         # hence they appear mapped)
         self_merges_for_seed_nodes = mapping_utils.produce_self_merges_for_seed_nodes(
             seed_id=self._alignment_config.base_config.seed_ontology_name,
-            nodes=self._data_repo_input.get(TABLE_NODES).dataframe,
+            nodes=self._data_repo_input.get(TABLE_NODES),
             nodes_obsolete=self._data_repo_input.get(TABLE_NODES_OBSOLETE).dataframe,
         )
-        self._data_repo_output.update(table=self_merges_for_seed_nodes)
+        self._clear_merges()
+        self._add_merges(merges=self_merges_for_seed_nodes.dataframe)
         self._data_repo_output.update(table=NamedTable("SEED_MERGES", self_merges_for_seed_nodes.dataframe))
 
         # record start step meta data
@@ -332,11 +531,30 @@ class AlignmentManager:
         """
         alignment_step.task_finished()
         self._alignment_steps.append(alignment_step)
-        self._data_repo_output.update(
-            table=DataManager.merge_tables_of_same_type(
-                tables=[merges_for_source, self._data_repo_output.get(TABLE_MERGES_WITH_META_DATA)]
-            )
-        )
+        self._add_merges(merges=merges_for_source.dataframe)
+
+    def _add_merges(self, merges: DataFrame) -> None:
+        """Add merges to the merge log and flag their source nodes as mapped.
+
+        :param merges: The merges to be added.
+        :return:
+        """
+        self._merge_log.append(merges=merges)
+        merged_node_codes = np.unique(self._node_id_dictionary.encode(merges[COLUMN_SOURCE_ID]))
+        merged_node_codes = merged_node_codes[merged_node_codes >= 0]
+        newly_mapped_node_codes = merged_node_codes[self._is_node_unmapped[merged_node_codes]]
+        self._is_node_unmapped[newly_mapped_node_codes] = False
+        self._count_unmapped_nodes -= len(newly_mapped_node_codes)
+
+    def _clear_merges(self) -> None:
+        """Remove all merges from the merge log and reset the mapped node flags.
+
+        :return:
+        """
+        self._merge_log.clear()
+        self._is_node_unmapped[:] = False
+        self._is_node_unmapped[self._input_node_codes] = True
+        self._count_unmapped_nodes = len(self._input_node_codes)
 
 
 def _produce_source_alignment_priority_order(seed_ontology_name: str, nodes: DataFrame) -> List[str]:
@@ -0,0 +1,132 @@
+"""Helper methods to find the nodes affected by input changes, and combine the re-computed and previous results."""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Index, Series
+
+from onto_merger.alignment.membership_utils import (
+    filter_table_for_node_ids,
+    produce_node_id_index,
+)
+from onto_merger.alignment.union_find_utils import UnionFind
+from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
+    COLUMN_PROVENANCE,
+    COLUMN_SOURCE_ID,
+    COLUMN_TARGET_ID,
+    ONTO_MERGER,
+)
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
+from onto_merger.logger.log import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_node_ids_in_components_of_node_ids(edge_tables: List[DataFrame], node_ids: Series) -> Index:
+    """Get the node IDs that are in a connected component (of the graph formed by the edges) with any given node.
+
+    :param edge_tables: The tables (mappings, merges or hierarchy edges) that form the graph.
+    :param node_ids: The node IDs whose components are returned.
+    :return: The node IDs of the components, including the given node IDs.
+    """
+    node_id_dictionary = NodeIdDictionary.from_tables(
+        tables=edge_tables + [pd.DataFrame({COLUMN_DEFAULT_ID: node_ids})]
+    )
+    union_find = UnionFind(size=len(node_id_dictionary))
+    for edges in edge_tables:
+        union_find.union(
+            nodes_a=node_id_dictionary.encode(edges[COLUMN_SOURCE_ID]),
+            nodes_b=node_id_dictionary.encode(edges[COLUMN_TARGET_ID]),
+        )
+    components = union_find.get_components()
+    is_affected_component = np.zeros(len(node_id_dictionary), dtype=bool)
+    is_affected_component[components[node_id_dictionary.encode(node_ids)]] = True
+    node_codes = np.flatnonzero(is_affected_component[components])
+    logger.info(f"Found {len(node_codes):,d} nodes in the components of {len(node_ids):,d} nodes.")
+    return pd.Index(node_id_dictionary.decode(node_codes=node_codes))
+
+
+def produce_nodes_before_delta(nodes: DataFrame, nodes_delta: DataFrame) -> DataFrame:
+    """Produce the node table of the previous run from the current node table and the node delta.
+
+    Delta nodes that are in the current table are added nodes, the rest are removed nodes.
+
+    :param nodes: The current node table.
+    :param nodes_delta: The added and removed nodes.
+    :return: The previous node table.
+    """
+    delta_node_id_index = produce_node_id_index(node_ids=nodes_delta[COLUMN_DEFAULT_ID])
+    removed_nodes = filter_table_for_node_ids(
+        table=nodes_delta,
+        node_id_index=produce_node_id_index(node_ids=nodes[COLUMN_DEFAULT_ID]),
+        node_id_columns=[COLUMN_DEFAULT_ID],
+        is_member=False,
+    )
+    return pd.concat(
+        [
+            filter_table_for_node_ids(
+                table=nodes, node_id_index=delta_node_id_index, node_id_columns=[COLUMN_DEFAULT_ID], is_member=False
+            )[[COLUMN_DEFAULT_ID]],
+            removed_nodes[[COLUMN_DEFAULT_ID]],
+        ],
+        ignore_index=True,
+    )
+
+
+def produce_table_merges_aggregated_with_delta(
+    merges_aggregated_previous: DataFrame, merges_aggregated_realigned: DataFrame, realigned_node_ids: Index
+) -> DataFrame:
+    """Produce the aggregated merges from the previous merges and the merges of the re-aligned nodes.
+
+    The previous merges of the re-aligned nodes are replaced, and the merges are sorted as
+    in a full run.
+
+    :param merges_aggregated_previous: The aggregated merges of the previous run.
+    :param merges_aggregated_realigned: The aggregated merges of the re-aligned nodes.
+    :param realigned_node_ids: The re-aligned node IDs.
+    :return: The aggregated merges.
+    """
+    merges_aggregated_kept = filter_table_for_node_ids(
+        table=merges_aggregated_previous,
+        node_id_index=realigned_node_ids,
+        node_id_columns=[COLUMN_SOURCE_ID],
+        is_member=False,
+    )
+    logger.info(
+        f"Kept {len(merges_aggregated_kept):,d} (of {len(merges_aggregated_previous):,d}) previous merges, "
+        + f"added {len(merges_aggregated_realigned):,d} merges of the re-aligned nodes."
+    )
+    return pd.concat(
+        [merges_aggregated_kept[merges_aggregated_realigned.columns], merges_aggregated_realigned],
+        ignore_index=True,
+    ).sort_values([COLUMN_TARGET_ID, COLUMN_SOURCE_ID], ignore_index=True)
+
+
+def produce_table_hierarchy_edges_with_delta(
+    edges_hierarchy_post_previous: DataFrame, edges_hierarchy_reconnected: DataFrame, reconnected_node_ids: Index
+) -> DataFrame:
+    """Produce the connectivity hierarchy edges from the previous edges and the edges of the re-connected nodes.
+
+    Only the edges produced by the connectivity process are taken from the previous run, the
+    ones of the re-connected nodes are replaced.
+
+    :param edges_hierarchy_post_previous: The post connectivity hierarchy edges of the previous run.
+    :param edges_hierarchy_reconnected: The connectivity hierarchy edges of the re-connected nodes.
+    :param reconnected_node_ids: The re-connected node IDs.
+    :return: The connectivity hierarchy edges.
+    """
+    edges_hierarchy_kept = filter_table_for_node_ids(
+        table=edges_hierarchy_post_previous[edges_hierarchy_post_previous[COLUMN_PROVENANCE] == ONTO_MERGER],
+        node_id_index=reconnected_node_ids,
+        node_id_columns=[COLUMN_SOURCE_ID],
+        is_member=False,
+    )
+    logger.info(
+        f"Kept {len(edges_hierarchy_kept):,d} previous connectivity hierarchy edges, "
+        + f"added {len(edges_hierarchy_reconnected):,d} edges of the re-connected nodes."
+    )
+    return pd.concat(
+        [edges_hierarchy_kept[edges_hierarchy_reconnected.columns], edges_hierarchy_reconnected], ignore_index=True
+    )
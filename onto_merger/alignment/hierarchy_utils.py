@@ -1,13 +1,17 @@
 """Methods to produce node hierarchy and analyse node connectivity status."""
 
 import itertools
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 import pandas as pd
 from pandas import DataFrame
 from tqdm import tqdm
 
-from onto_merger.alignment import networkx_utils
+from onto_merger.alignment import delta_utils, networkx_utils
+from onto_merger.alignment.membership_utils import (
+    filter_table_for_node_ids,
+    produce_node_id_index,
+)
 from onto_merger.alignment.networkit_utils import NetworkitGraph
 from onto_merger.analyser.analysis_utils import (
     filter_nodes_for_namespace,
@@ -19,6 +23,7 @@ from onto_merger.data.constants import (
     COLUMN_RELATION,
     COLUMN_SOURCE_ID,
     COLUMN_TARGET_ID,
+    CONNECTIVITY_MODE_NEAREST_TERMINUS,
     ONTO_MERGER,
     RELATION_RDFS_SUBCLASS_OF,
     SCHEMA_HIERARCHY_EDGE_TABLE,
@@ -31,12 +36,14 @@ from onto_merger.data.constants import (
     TABLE_NODES_CONNECTED,
     TABLE_NODES_CONNECTED_EXC_SEED,
     TABLE_NODES_DANGLING,
+    TABLE_NODES_REALIGNED,
     TABLE_NODES_SEED,
     TABLE_NODES_UNMAPPED,
 )
 from onto_merger.data.data_manager import DataManager
 from onto_merger.data.dataclasses import (
     AlignmentConfig,
+    AlignmentDelta,
     ConnectivityStep,
     DataRepository,
     NamedTable,
@@ -62,13 +69,20 @@ class HierarchyManager:
                      + "index_of_first_merged_node_in_org_path,first_merged_node_canonical_id\n")
 
     def connect_nodes(
-            self, alignment_config: AlignmentConfig, source_alignment_order: List[str], data_repo: DataRepository
+            self,
+            alignment_config: AlignmentConfig,
+            source_alignment_order: List[str],
+            data_repo: DataRepository,
+            alignment_delta: Optional[AlignmentDelta] = None,
     ) -> List[NamedTable]:
         """Run the connectivity process to establish a hierarchy between the domain nodes.
 
         :param source_alignment_order: The source alignment order.
         :param alignment_config: The alignment process configuration dataclass.
         :param data_repo: The data repository containing the input data.
+        :param alignment_delta: The input changes since the previous run, if given only the
+        nodes affected by the changes (or by the re-alignment) are connected, and the previous
+        hierarchy edges of the rest of the nodes are kept (incremental connectivity).
         :return: The produced hierarchy edge table.
         """
         logger.info(f"{('* ' * 20)}")
@@ -78,17 +92,48 @@ class HierarchyManager:
         # (1) get the seed hierarchy as main scaffolding
         seed_hierarchy_df = _produce_table_seed_ontology_hierarchy(
             seed_ontology_name=alignment_config.base_config.seed_ontology_name,
-            nodes=data_repo.get(TABLE_NODES).dataframe,
+            nodes=data_repo.get(TABLE_NODES),
             hierarchy_edges=data_repo.get(TABLE_EDGES_HIERARCHY).dataframe,
         )
 
         # (2) connect unmapped nodes to the seed hierarchy
+        unmapped_nodes = data_repo.get(TABLE_NODES_UNMAPPED)
+        merges = data_repo.get(TABLE_MERGES_AGGREGATED).dataframe
+        hierarchy_edges = data_repo.get(TABLE_EDGES_HIERARCHY).dataframe
+        if alignment_delta is not None:
+            # the hierarchy path of a node only depends on the nodes that are connected to it
+            # via hierarchy edges and merges (before or after the changes)
+            reconnected_node_ids = delta_utils.get_node_ids_in_components_of_node_ids(
+                edge_tables=[hierarchy_edges, alignment_delta.edges_hierarchy,
+                             alignment_delta.merges_aggregated_previous, merges],
+                node_ids=pd.concat([
+                    alignment_delta.get_changed_node_ids(),
+                    data_repo.get(TABLE_NODES_REALIGNED).dataframe[COLUMN_DEFAULT_ID],
+                ], ignore_index=True),
+            )
+            logger.info(f"Re-connecting {len(reconnected_node_ids):,d} nodes affected by the input changes.")
+            unmapped_nodes_df, merges, hierarchy_edges = [
+                filter_table_for_node_ids(table=table, node_id_index=reconnected_node_ids, node_id_columns=[column])
+                for table, column in [
+                    (unmapped_nodes.dataframe, COLUMN_DEFAULT_ID),
+                    (merges, COLUMN_SOURCE_ID),
+                    (hierarchy_edges, COLUMN_SOURCE_ID),
+                ]
+            ]
+            unmapped_nodes = NamedTable(name=TABLE_NODES_UNMAPPED, dataframe=unmapped_nodes_df)
         unmapped_node_hierarchy_df, connectivity_steps = self._produce_hierarchy_edges_for_unmapped_nodes(
-            unmapped_nodes=data_repo.get(TABLE_NODES_UNMAPPED).dataframe,
-            merges=data_repo.get(TABLE_MERGES_AGGREGATED).dataframe,
+            unmapped_nodes=unmapped_nodes,
+            merges=merges,
             source_alignment_order=source_alignment_order,
-            hierarchy_edges=data_repo.get(TABLE_EDGES_HIERARCHY).dataframe,
+            hierarchy_edges=hierarchy_edges,
+            connectivity_mode=alignment_config.base_config.connectivity_mode,
         )
+        if alignment_delta is not None:
+            unmapped_node_hierarchy_df = delta_utils.produce_table_hierarchy_edges_with_delta(
+                edges_hierarchy_post_previous=alignment_delta.edges_hierarchy_post_previous,
+                edges_hierarchy_reconnected=unmapped_node_hierarchy_df,
+                reconnected_node_ids=reconnected_node_ids,
+            )
 
         # (4) return the merged hierarchy and node tables
         return [
@@ -100,8 +145,8 @@ class HierarchyManager:
         ]
 
     def _produce_hierarchy_edges_for_unmapped_nodes(
-            self, unmapped_nodes: DataFrame, merges: DataFrame, source_alignment_order: List[str],
-            hierarchy_edges: DataFrame
+            self, unmapped_nodes: NamedTable, merges: DataFrame, source_alignment_order: List[str],
+            hierarchy_edges: DataFrame, connectivity_mode: str,
     ) -> Tuple[DataFrame, List[ConnectivityStep]]:
         # contains all merges; iteratively extended with connected nodes (where the node will "merge" to itself)
         # this provides a single data structure to identify terminus nodes in hierarchy paths, i.e. where
@@ -122,6 +167,7 @@ class HierarchyManager:
                 unmapped_nodes=unmapped_nodes,
                 hierarchy_edges=hierarchy_edges,
                 merge_and_connectivity_map=merge_and_connectivity_map,
+                connectivity_mode=connectivity_mode,
             )
             connectivity_step.step_counter = connectivity_order.index(node_namespace)
             connectivity_steps.append(connectivity_step)
@@ -137,15 +183,15 @@ class HierarchyManager:
         connected_nodes = produce_table_node_ids_from_edge_table(edges=new_hierarchy_edges)
 
         logger.info(
-            f"Out of {len(unmapped_nodes):,d} unmapped nodes, "
+            f"Out of {len(unmapped_nodes.dataframe):,d} unmapped nodes, "
             + f"{len(connected_nodes):,d} are now connected, "
             + f"via {len(new_hierarchy_edges):,d} hierarchy edges."
         )
         return new_hierarchy_edges, connectivity_steps
 
     def _produce_hierarchy_edges_for_unmapped_nodes_of_namespace(
-            self, node_namespace: str, unmapped_nodes: DataFrame, hierarchy_edges: DataFrame,
-            merge_and_connectivity_map: dict,
+            self, node_namespace: str, unmapped_nodes: NamedTable, hierarchy_edges: DataFrame,
+            merge_and_connectivity_map: dict, connectivity_mode: str,
     ) -> Tuple[List[Tuple[str, str]], dict, ConnectivityStep]:
         merge_and_connectivity_map_for_ns = merge_and_connectivity_map.copy()
 
@@ -156,7 +202,8 @@ class HierarchyManager:
         logger.info(
             f"* * * Connectivity for {node_namespace} "
             + f"({len(unmapped_node_ids_for_namespace):,d} unmapped, "
-            + f"{(len(unmapped_node_ids_for_namespace) * 100) / len(unmapped_nodes):.2f}% of total) * * *"
+            + f"{(len(unmapped_node_ids_for_namespace) * 100) / max(len(unmapped_nodes.dataframe), 1):.2f}% "
+            + "of total) * * *"
         )
         connectivity_step = ConnectivityStep(
             source_id=node_namespace, count_unmapped_node_ids=len(unmapped_node_ids_for_namespace),
@@ -174,9 +221,8 @@ class HierarchyManager:
 
         # create the hierarchy graph for the namespace
         hierarchy_graph_for_ns = NetworkitGraph(edges=edges_for_ns)
-        reachable_nodes = list(hierarchy_graph_for_ns.node_id_to_index_map.keys())
         reachable_unmapped_nodes = [node_id for node_id in unmapped_node_ids_for_namespace if
-                                    node_id in reachable_nodes]
+                                    node_id in hierarchy_graph_for_ns.node_id_to_index_map]
         count_unmapped = len(reachable_unmapped_nodes)
         connectivity_step.count_reachable_unmapped_nodes = count_unmapped
         logger.info(
@@ -184,6 +230,17 @@ class HierarchyManager:
             + f"({(len(reachable_unmapped_nodes) * 100) / len(unmapped_node_ids_for_namespace):.2f}%)\n"
         )
 
+        # compute the shortest paths for all reachable nodes at once: either to the nearest
+        # terminus (merged or already connected node), or to the root (pruned for each node below)
+        if connectivity_mode == CONNECTIVITY_MODE_NEAREST_TERMINUS:
+            shortest_paths = hierarchy_graph_for_ns.get_paths_to_nearest_terminus(
+                node_ids=reachable_unmapped_nodes,
+                terminus_node_ids=merge_and_connectivity_map_for_ns.keys(),
+            )
+        else:
+            shortest_paths = hierarchy_graph_for_ns.get_paths_for_nodes(node_ids=reachable_unmapped_nodes)
+        unmapped_node_id_set_for_namespace = set(unmapped_node_ids_for_namespace)
+
         # connect each reachable node
         edges_for_namespace_nodes = []
         counter = 1
@@ -193,9 +250,9 @@ class HierarchyManager:
                 if node_to_connect not in merge_and_connectivity_map:
                     edges_for_node = self._produce_hierarchy_path_for_unmapped_node(
                         node_to_connect=node_to_connect,
-                        unmapped_node_ids=unmapped_node_ids_for_namespace,
+                        shortest_path=shortest_paths[node_to_connect],
+                        unmapped_node_ids=unmapped_node_id_set_for_namespace,
                         merge_and_connectivity_map_for_ns=merge_and_connectivity_map_for_ns,
-                        hierarchy_graph_for_ns=hierarchy_graph_for_ns,
                     )
                     if edges_for_node:
                         # update result and processing data structures
@@ -225,12 +282,10 @@ class HierarchyManager:
     def _produce_hierarchy_path_for_unmapped_node(
             self,
             node_to_connect: str,
-            unmapped_node_ids: List[str],
+            shortest_path: List[str],
+            unmapped_node_ids: Set[str],
             merge_and_connectivity_map_for_ns: dict,
-            hierarchy_graph_for_ns: NetworkitGraph,
     ) -> List[Tuple[str, str]]:
-        # get shortest path
-        shortest_path = hierarchy_graph_for_ns.get_path_for_node(node_id=node_to_connect)
         if not shortest_path:
             return []
 
@@ -263,7 +318,7 @@ class HierarchyManager:
 
 
 def _produce_table_seed_ontology_hierarchy(
-        seed_ontology_name: str, nodes: DataFrame, hierarchy_edges: DataFrame
+        seed_ontology_name: str, nodes: NamedTable, hierarchy_edges: DataFrame
 ) -> Optional[DataFrame]:
     """Produce the hierarchy edge table for the seed ontology nodes.
 
@@ -274,16 +329,16 @@ def _produce_table_seed_ontology_hierarchy(
     """
     # get hierarchy of the seed ontology, filter out any non seed nodes
     # (nodes only have the type 'correct' IDs, whereas the edges may contain other ones)
-    seed_node_list = list(
-        filter_nodes_for_namespace(
+    seed_node_id_index = produce_node_id_index(
+        node_ids=filter_nodes_for_namespace(
             nodes=nodes,
             namespace=seed_ontology_name,
         )[COLUMN_DEFAULT_ID]
     )
-    seed_hierarchy_table = hierarchy_edges.query(
-        f"{COLUMN_SOURCE_ID} in @node_ids & {COLUMN_TARGET_ID} in @node_ids",
-        local_dict={"node_ids": seed_node_list},
-        inplace=False,
+    seed_hierarchy_table = filter_table_for_node_ids(
+        table=hierarchy_edges,
+        node_id_index=seed_node_id_index,
+        node_id_columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID],
     )
 
     # check if the hierarchy is still one network (DAG)
@@ -0,0 +1,87 @@
+"""Namespace index over a mapping table for repeated per source lookups."""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from onto_merger.data.constants import (
+    COLUMN_SOURCE_ID,
+    COLUMN_TARGET_ID,
+    SCHEMA_MAPPING_TABLE,
+)
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
+from onto_merger.logger.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class MappingIndex:
+    """Data class for looking up the mappings of a namespace without re-scanning the mapping table.
+
+    Mapping row positions are grouped by source and by target node ID namespace in CSR
+    (compressed sparse row) form: the positions of a namespace are a contiguous slice of
+    the position array, delimited by the namespace offsets.
+    """
+
+    def __init__(self, mappings: DataFrame, node_id_dictionary: Optional[NodeIdDictionary] = None):
+        """Initialise the MappingIndex class.
+
+        :param mappings: The mapping table to be indexed.
+        :param node_id_dictionary: The node ID dictionary that provides the namespace codes,
+        if not given it is produced from the mapping table.
+        """
+        self._mappings = mappings[SCHEMA_MAPPING_TABLE]
+        if node_id_dictionary is None:
+            node_id_dictionary = NodeIdDictionary.from_tables(tables=[mappings])
+        self._node_id_dictionary = node_id_dictionary
+        namespace_count = len(node_id_dictionary.namespaces)
+
+        # node IDs missing from the dictionary are put in an extra (last) namespace group
+        source_namespace_codes, target_namespace_codes = [
+            node_id_dictionary.get_namespace_codes(node_codes=node_id_dictionary.encode(mappings[column]))
+            for column in [COLUMN_SOURCE_ID, COLUMN_TARGET_ID]
+        ]
+        source_namespace_codes[source_namespace_codes < 0] = namespace_count
+        target_namespace_codes[target_namespace_codes < 0] = namespace_count
+        self._source_positions, self._source_offsets = _produce_csr_positions(
+            namespace_codes=source_namespace_codes, namespace_count=namespace_count + 1
+        )
+        self._target_positions, self._target_offsets = _produce_csr_positions(
+            namespace_codes=target_namespace_codes, namespace_count=namespace_count + 1
+        )
+
+    def get_mappings_for_namespace(self, namespace: str) -> DataFrame:
+        """Get the mappings where either the source or the target node is from the specified namespace.
+
+        :param namespace: The ontology namespace.
+        :return: The mapping subset, in the original mapping table order.
+        """
+        code = self._node_id_dictionary.get_namespace_code(namespace=namespace)
+        if code < 0:
+            positions = np.array([], dtype=np.int64)
+        else:
+            positions = np.union1d(
+                self._source_positions[self._source_offsets[code]:self._source_offsets[code + 1]],
+                self._target_positions[self._target_offsets[code]:self._target_offsets[code + 1]],
+            )
+        mapping_subset = self._mappings.iloc[positions]
+        logger.info(
+            f"Found {len(mapping_subset):,d} edges (mapping or hierarchy edges) for namespace '{namespace}'"
+            + f" from total {len(self._mappings):,d}."
+        )
+        return mapping_subset
+
+
+def _produce_csr_positions(namespace_codes: np.ndarray, namespace_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Group the row positions by namespace code.
+
+    :param namespace_codes: The namespace code of each row.
+    :param namespace_count: The number of namespaces.
+    :return: The row positions ordered by namespace (and by position within a namespace),
+    and the start offset of each namespace (with the end offset appended).
+    """
+    positions = np.argsort(namespace_codes, kind="stable")
+    offsets = np.zeros(namespace_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(namespace_codes, minlength=namespace_count), out=offsets[1:])
+    return positions, offsets
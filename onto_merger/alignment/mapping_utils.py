@@ -1,12 +1,19 @@
 """Helper methods to work with mappings."""
 
-from typing import List
+from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Index, Series
 
+from onto_merger.alignment.membership_utils import (
+    filter_table_for_node_ids,
+    is_node_id_in_index,
+    produce_node_id_index,
+)
 from onto_merger.analyser.analysis_utils import (
     get_namespace_column_name_for_column,
+    get_namespaces_for_node_ids,
     produce_table_node_ids_from_edge_table,
     produce_table_with_namespace_column_for_node_ids,
 )
@@ -21,50 +28,58 @@ from onto_merger.data.constants import (
     TABLE_MERGES_WITH_META_DATA,
 )
 from onto_merger.data.dataclasses import NamedTable
+from onto_merger.data.derived_columns import produce_comparison_hash_column
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
 from onto_merger.logger.log import get_logger
 
 logger = get_logger(__name__)
 
 
-def get_mappings_internal_node_reassignment(mappings: DataFrame) -> DataFrame:
+def get_mappings_internal_node_reassignment(mappings: NamedTable) -> DataFrame:
     """Filter a mapping set so each remaining mapping is between nodes of the same ontology.
 
     :param mappings: The input mapping set ot be filtered.
     :return: The internal code re-assigment mappings table.
     """
-    query = (
-        f"{get_namespace_column_name_for_column(COLUMN_SOURCE_ID)} == "
-        + f"{get_namespace_column_name_for_column(COLUMN_TARGET_ID)}"
-    )
-    mapping_subset = produce_table_with_namespace_column_for_node_ids(table=mappings).query(expr=query, inplace=False)[
+    mapping_subset = mappings.dataframe[_is_mapping_internal_node_reassignment(mappings=mappings)][
         SCHEMA_MAPPING_TABLE
     ]
     logger.info(
-        f"Found {len(mapping_subset)} 'internal_node_reassignment' mappings from total " + f"{len(mappings)} mappings."
+        f"Found {len(mapping_subset)} 'internal_node_reassignment' mappings from total "
+        + f"{len(mappings.dataframe)} mappings."
     )
     return mapping_subset
 
 
-def filter_out_mappings_internal_node_reassignment(mappings: DataFrame) -> DataFrame:
+def filter_out_mappings_internal_node_reassignment(mappings: NamedTable) -> DataFrame:
     """Filter a mapping set so each remaining mapping is between nodes of the same ontology.
 
     :param mappings: The input mapping set ot be filtered.
     :return: The internal code re-assigment mappings table.
     """
-    query = (
-        f"{get_namespace_column_name_for_column(COLUMN_SOURCE_ID)} != "
-        + f"{get_namespace_column_name_for_column(COLUMN_TARGET_ID)}"
-    )
-    mapping_subset = produce_table_with_namespace_column_for_node_ids(table=mappings).query(expr=query, inplace=False)[
+    mapping_subset = mappings.dataframe[~_is_mapping_internal_node_reassignment(mappings=mappings)][
         SCHEMA_MAPPING_TABLE
     ]
     logger.info(
-        f"Filtered out {len(mappings) - len(mapping_subset)} mappings from total " + f"{len(mappings)} mappings."
+        f"Filtered out {len(mappings.dataframe) - len(mapping_subset)} mappings from total "
+        + f"{len(mappings.dataframe)} mappings."
     )
     return mapping_subset
 
 
-def get_mappings_obsolete_to_current_node_id(nodes_obsolete: DataFrame, mappings: DataFrame) -> DataFrame:
+def _is_mapping_internal_node_reassignment(mappings: NamedTable) -> np.ndarray:
+    """Check for each mapping if it is between nodes of the same ontology (namespace).
+
+    :param mappings: The mapping set, the namespaces are derived (and memoised) by the named table.
+    :return: The boolean mask of the internal code re-assignment mappings.
+    """
+    return (
+        mappings.get_column(get_namespace_column_name_for_column(COLUMN_SOURCE_ID)).values
+        == mappings.get_column(get_namespace_column_name_for_column(COLUMN_TARGET_ID)).values
+    )
+
+
+def get_mappings_obsolete_to_current_node_id(nodes_obsolete: DataFrame, mappings: NamedTable) -> DataFrame:
     """Return the internal node ID re-assingment mappings.
 
     Given a set of internal_node_reassignment mappings, ensures that the obsolete
@@ -75,42 +90,27 @@ def get_mappings_obsolete_to_current_node_id(nodes_obsolete: DataFrame, mappings
     :param mappings: The input that contains internal_node_reassignment mappings.
     :return:
     """
-    nodes_obsolete_ids = list(nodes_obsolete[COLUMN_DEFAULT_ID])
     df = get_mappings_internal_node_reassignment(mappings=mappings)
+    nodes_obsolete_ids = pd.Index(nodes_obsolete[COLUMN_DEFAULT_ID].unique())
+    is_source_obsolete = df[COLUMN_SOURCE_ID].isin(nodes_obsolete_ids).values
+    is_target_obsolete = df[COLUMN_TARGET_ID].isin(nodes_obsolete_ids).values
 
-    df["has_obs_node"] = df.apply(
-        lambda x: True
-        if ((x[COLUMN_SOURCE_ID] in nodes_obsolete_ids) | (x[COLUMN_TARGET_ID] in nodes_obsolete_ids))
-        else False,
-        axis=1,
-    )
-    df.query("has_obs_node == True", inplace=True)
-
-    updated_src_id_column = f"updated_{COLUMN_SOURCE_ID}"
-    df[updated_src_id_column] = df.apply(
-        lambda x: x[COLUMN_SOURCE_ID] if x[COLUMN_SOURCE_ID] in nodes_obsolete_ids else x[COLUMN_TARGET_ID],
-        axis=1,
-    )
-
-    updated_trg_id_column = f"updated_{COLUMN_TARGET_ID}"
-    df[updated_trg_id_column] = df.apply(
-        lambda x: x[COLUMN_SOURCE_ID] if x[COLUMN_TARGET_ID] in nodes_obsolete_ids else x[COLUMN_TARGET_ID],
-        axis=1,
-    )
-
-    df.drop(columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID], inplace=True)
-    df.rename(
-        columns={updated_src_id_column: COLUMN_SOURCE_ID, updated_trg_id_column: COLUMN_TARGET_ID},
-        inplace=True,
+    # keep the mappings with an obsolete node and move the obsolete node ID to the source
+    has_obsolete_node = is_source_obsolete | is_target_obsolete
+    df = df[has_obsolete_node][SCHEMA_MAPPING_TABLE].copy()
+    source_ids = df[COLUMN_SOURCE_ID].values
+    target_ids = df[COLUMN_TARGET_ID].values
+    # both columns are produced before assigning them, the arrays may be views of the table
+    df[COLUMN_SOURCE_ID], df[COLUMN_TARGET_ID] = (
+        np.where(is_source_obsolete[has_obsolete_node], source_ids, target_ids),
+        np.where(is_target_obsolete[has_obsolete_node], source_ids, target_ids),
     )
 
-    df = df[SCHEMA_MAPPING_TABLE]
-
     return df
 
 
 def get_mappings_with_updated_node_ids(
-    mappings: DataFrame, mappings_obsolete_to_current_node_id: DataFrame
+    mappings: NamedTable, mappings_obsolete_to_current_node_id: DataFrame
 ) -> DataFrame:
     """Update the obsolete node IDs in a mapping set.
 
@@ -120,11 +120,12 @@ def get_mappings_with_updated_node_ids(
     :return: The updated mapping set.
     """
     # internal mappings that would apply
-    node_ids_in_mappings = produce_table_node_ids_from_edge_table(edges=mappings)[COLUMN_DEFAULT_ID].tolist()
-    mappings_obsolete_to_current_node_id_applicable = mappings_obsolete_to_current_node_id.query(
-        expr=(f"{COLUMN_SOURCE_ID} == @node_ids_in_mappings"),
-        local_dict={"node_ids_in_mappings": node_ids_in_mappings},
-        inplace=False,
+    mappings_obsolete_to_current_node_id_applicable = filter_table_for_node_ids(
+        table=mappings_obsolete_to_current_node_id,
+        node_id_index=produce_node_id_index(
+            node_ids=produce_table_node_ids_from_edge_table(edges=mappings.dataframe)[COLUMN_DEFAULT_ID]
+        ),
+        node_id_columns=[COLUMN_SOURCE_ID],
     )
     logger.info(f"Out of {len(mappings_obsolete_to_current_node_id)} obsolete_to_current_node_id mappings, "
                 + f"{len(mappings_obsolete_to_current_node_id_applicable)} can be applied to mappings.")
@@ -148,11 +149,11 @@ def get_nodes_with_updated_node_ids(
     :return: The updated node table.
     """
     # internal mappings that would apply
-    mappings_obsolete_to_current_node_id_applicable = mappings_obsolete_to_current_node_id.copy().query(
-        expr=(f"{COLUMN_SOURCE_ID} == @node_ids_in_mappings"),
-        local_dict={"node_ids_in_mappings": nodes[COLUMN_DEFAULT_ID].tolist()},
-        inplace=False,
-    )
+    mappings_obsolete_to_current_node_id_applicable = filter_table_for_node_ids(
+        table=mappings_obsolete_to_current_node_id,
+        node_id_index=produce_node_id_index(node_ids=nodes[COLUMN_DEFAULT_ID]),
+        node_id_columns=[COLUMN_SOURCE_ID],
+    ).copy()
     logger.info(f"Out of {len(mappings_obsolete_to_current_node_id)} obsolete_to_current_node_id mappings, "
                 + f"{len(mappings_obsolete_to_current_node_id_applicable)} can be applied to nodes.")
 
@@ -165,11 +166,11 @@ def add_comparison_column_for_reoriented_mappings(mappings: DataFrame):
     :param mappings: The input mapping set.
     :return: The mapping set appended with the comparison column.
     """
-    mappings[COLUMN_MAPPING_HASH] = mappings.apply(
-        lambda x: (
-            f"{sorted([x[COLUMN_SOURCE_ID], x[COLUMN_TARGET_ID]])}" + f"|{x[COLUMN_RELATION]}|{x[COLUMN_PROVENANCE]}"
-        ),
-        axis=1,
+    mappings[COLUMN_MAPPING_HASH] = produce_comparison_hash_column(
+        source_ids=mappings[COLUMN_SOURCE_ID],
+        target_ids=mappings[COLUMN_TARGET_ID],
+        relations=mappings[COLUMN_RELATION],
+        provenances=mappings[COLUMN_PROVENANCE],
     )
     return mappings
 
@@ -226,13 +227,14 @@ def get_source_to_target_mappings_for_multiplicity(mappings: DataFrame, is_one_o
 
     # drop non one to one mappings
     if is_one_or_many_to_one:
-        source_ids_to_drop = list(df_one_to_many[COLUMN_SOURCE_ID])
+        source_ids_to_drop = df_one_to_many[COLUMN_SOURCE_ID]
     else:
-        source_ids_to_drop = list(df_one_to_one[COLUMN_SOURCE_ID])
-    mapping_subset = mappings.query(
-        f"{COLUMN_SOURCE_ID} != @node_ids",
-        local_dict={"node_ids": source_ids_to_drop},
-        inplace=False,
+        source_ids_to_drop = df_one_to_one[COLUMN_SOURCE_ID]
+    mapping_subset = filter_table_for_node_ids(
+        table=mappings,
+        node_id_index=produce_node_id_index(node_ids=source_ids_to_drop),
+        node_id_columns=[COLUMN_SOURCE_ID],
+        is_member=False,
     )
     return mapping_subset
 
@@ -266,7 +268,7 @@ def get_one_source_to_many_target_mappings(mappings: DataFrame) -> DataFrame:
     logger.info(
         f"Found {len(mapping_subset)} one_or_many_source_to_one_target mappings from " + f"{len(mappings)} mappings."
     )
-    return mapping_subset.sort_values([COLUMN_SOURCE_ID, COLUMN_TARGET_ID])
+    return mapping_subset.sort_values([COLUMN_SOURCE_ID, COLUMN_TARGET_ID], kind="mergesort")
 
 
 def update_mappings_with_current_node_ids(
@@ -321,29 +323,23 @@ def orient_mappings_to_namespace(required_target_id_namespace: str, mappings: Da
     :param mappings: The input mapping set to be updated.
     :return: The updated mapping set.
     """
-    df = produce_table_with_namespace_column_for_node_ids(table=mappings)
-    if len(df) == 0:
+    if len(mappings) == 0:
         return mappings
-    updated_src_id_column = f"updated_{COLUMN_SOURCE_ID}"
-    updated_trg_id_column = f"updated_{COLUMN_TARGET_ID}"
-    df[updated_src_id_column] = df.apply(
-        lambda x: x[COLUMN_SOURCE_ID]
-        if x[get_namespace_column_name_for_column(COLUMN_SOURCE_ID)] != required_target_id_namespace
-        else x[COLUMN_TARGET_ID],
-        axis=1,
-    )
-    df[updated_trg_id_column] = df.apply(
-        lambda x: x[COLUMN_TARGET_ID]
-        if x[get_namespace_column_name_for_column(COLUMN_TARGET_ID)] == required_target_id_namespace
-        else x[COLUMN_SOURCE_ID],
-        axis=1,
-    )
-    df.drop([COLUMN_SOURCE_ID, COLUMN_TARGET_ID], axis=1, inplace=True)
-    df.rename(
-        columns={updated_src_id_column: COLUMN_SOURCE_ID, updated_trg_id_column: COLUMN_TARGET_ID},
-        inplace=True,
+    is_source_in_namespace = (
+        _get_namespace_column(table=mappings, node_id_column=COLUMN_SOURCE_ID) == required_target_id_namespace
+    ).values
+    is_target_in_namespace = (
+        _get_namespace_column(table=mappings, node_id_column=COLUMN_TARGET_ID) == required_target_id_namespace
+    ).values
+    df = mappings[SCHEMA_MAPPING_TABLE].copy()
+    source_ids = df[COLUMN_SOURCE_ID].values
+    target_ids = df[COLUMN_TARGET_ID].values
+    # both columns are produced before assigning them, the arrays may be views of the table
+    df[COLUMN_SOURCE_ID], df[COLUMN_TARGET_ID] = (
+        np.where(is_source_in_namespace, target_ids, source_ids),
+        np.where(is_target_in_namespace, target_ids, source_ids),
     )
-    return df[SCHEMA_MAPPING_TABLE]
+    return df
 
 
 def get_mappings_with_mapping_relations(permitted_mapping_relations: List[str], mappings: DataFrame) -> DataFrame:
@@ -385,6 +381,34 @@ def deduplicate_mappings_for_type_group(mapping_type_group_name: str, mappings:
     return mappings_deduplicated
 
 
+def produce_candidate_mappings_for_source(
+    source_id: str, mapping_type_group_name: str, mapping_types: List[str], mappings_for_ns: DataFrame
+) -> DataFrame:
+    """Produce the candidate mappings of an alignment step, prior to the unmapped node filtering.
+
+    The candidate mappings only depend on the source and the mapping type group, so they
+    can be computed ahead of the (sequential) alignment steps.
+
+    :param source_id: The source the nodes are aligned to.
+    :param mapping_type_group_name: The name of the mapping type group.
+    :param mapping_types: The mapping types in the given type group.
+    :param mappings_for_ns: The mappings where either the source or the target node is
+    from the source namespace.
+    :return: The deduplicated mapping set of the permitted mapping types, oriented
+    towards the source.
+    """
+    mappings_for_permitted_type = get_mappings_with_mapping_relations(
+        permitted_mapping_relations=mapping_types, mappings=mappings_for_ns
+    )
+    mapping_towards_ns = orient_mappings_to_namespace(
+        required_target_id_namespace=source_id,
+        mappings=mappings_for_permitted_type,
+    )
+    return deduplicate_mappings_for_type_group(
+        mapping_type_group_name=mapping_type_group_name, mappings=mapping_towards_ns
+    )
+
+
 def filter_mappings_for_input_node_set(input_nodes: DataFrame, mappings: DataFrame) -> DataFrame:
     """Filter a mapping set so it only contains mappings referencing nodes from the input set.
 
@@ -392,11 +416,10 @@ def filter_mappings_for_input_node_set(input_nodes: DataFrame, mappings: DataFra
     :param mappings: The mapping set to be filtered.
     :return: The filtered mapping set.
     """
-    node_ids_to_keep = list(input_nodes[COLUMN_DEFAULT_ID])
-    mapping_subset = mappings.query(
-        f"({COLUMN_SOURCE_ID} == @node_ids) and ({COLUMN_TARGET_ID} == @node_ids)",
-        local_dict={"node_ids": node_ids_to_keep},
-        inplace=False,
+    mapping_subset = filter_table_for_node_ids(
+        table=mappings,
+        node_id_index=produce_node_id_index(node_ids=input_nodes[COLUMN_DEFAULT_ID]),
+        node_id_columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID],
     )
     logger.info(
         f"Found {len(mapping_subset):,d} mappings (from total {len(mappings):,d}) "
@@ -405,6 +428,33 @@ def filter_mappings_for_input_node_set(input_nodes: DataFrame, mappings: DataFra
     return mapping_subset
 
 
+def filter_mappings_for_alignment_inputs(
+    mappings: DataFrame,
+    permitted_mapping_relations: List[str],
+    input_node_id_index: Index,
+    obsolete_node_id_index: Index,
+) -> DataFrame:
+    """Filter a mapping set for the mappings that can be used by the alignment process.
+
+    The mappings must have a permitted relation, and either an obsolete node (that may be
+    re-assigned to a current node ID), or input nodes on both ends.
+
+    :param mappings: The mapping set to be filtered.
+    :param permitted_mapping_relations: The mapping relations of the mapping type groups.
+    :param input_node_id_index: The input node ID index.
+    :param obsolete_node_id_index: The obsolete node ID index.
+    :return: The filtered mapping set.
+    """
+    has_obsolete_node = is_node_id_in_index(
+        node_ids=mappings[COLUMN_SOURCE_ID], node_id_index=obsolete_node_id_index
+    ) | is_node_id_in_index(node_ids=mappings[COLUMN_TARGET_ID], node_id_index=obsolete_node_id_index)
+    has_input_nodes = is_node_id_in_index(
+        node_ids=mappings[COLUMN_SOURCE_ID], node_id_index=input_node_id_index
+    ) & is_node_id_in_index(node_ids=mappings[COLUMN_TARGET_ID], node_id_index=input_node_id_index)
+    is_permitted_relation = mappings[COLUMN_RELATION].isin(permitted_mapping_relations).values
+    return mappings[is_permitted_relation & (has_obsolete_node | has_input_nodes)]
+
+
 def filter_mappings_for_node_set(nodes: DataFrame, mappings: DataFrame) -> DataFrame:
     """Filter a mapping set such that the source node IDs must belong to the specified node ID list.
 
@@ -412,11 +462,10 @@ def filter_mappings_for_node_set(nodes: DataFrame, mappings: DataFrame) -> DataF
     :param mappings: The input mapping set to be filtered.
     :return: The filtered mapping set.
     """
-    node_ids_to_keep = list(nodes[COLUMN_DEFAULT_ID])
-    mapping_subset = mappings.query(
-        f"{COLUMN_SOURCE_ID} == @node_ids",
-        local_dict={"node_ids": node_ids_to_keep},
-        inplace=False,
+    mapping_subset = filter_table_for_node_ids(
+        table=mappings,
+        node_id_index=produce_node_id_index(node_ids=nodes[COLUMN_DEFAULT_ID]),
+        node_id_columns=[COLUMN_SOURCE_ID],
     )
     logger.info(
         f"Found {len(mapping_subset):,d} mappings (from total {len(mappings):,d}) " + f"for {len(nodes):,d} nodes."
@@ -424,7 +473,49 @@ def filter_mappings_for_node_set(nodes: DataFrame, mappings: DataFrame) -> DataF
     return mapping_subset
 
 
-def produce_self_merges_for_seed_nodes(seed_id: str, nodes: DataFrame, nodes_obsolete: DataFrame) -> NamedTable:
+def filter_mappings_for_unmapped_nodes(
+    node_id_dictionary: NodeIdDictionary, is_node_unmapped: np.ndarray, mappings: DataFrame
+) -> DataFrame:
+    """Filter a mapping set such that the source node IDs must be input nodes that are not yet mapped.
+
+    :param node_id_dictionary: The node ID dictionary.
+    :param is_node_unmapped: The unmapped input node flag for each node, indexed by node code.
+    :param mappings: The input mapping set to be filtered.
+    :return: The filtered mapping set.
+    """
+    source_node_codes = node_id_dictionary.encode(mappings[COLUMN_SOURCE_ID])
+    is_source_unmapped = (source_node_codes >= 0) & is_node_unmapped[source_node_codes]
+    mapping_subset = mappings[is_source_unmapped]
+    logger.info(
+        f"Found {len(mapping_subset):,d} mappings (from total {len(mappings):,d}) for unmapped nodes."
+    )
+    return mapping_subset
+
+
+def produce_mappings_for_alignment_step(
+    node_id_dictionary: NodeIdDictionary, is_node_unmapped: np.ndarray, candidate_mappings: DataFrame
+) -> Tuple[int, DataFrame, DataFrame]:
+    """Produce the merge and the dropped mappings of an alignment step from its candidate mappings.
+
+    :param node_id_dictionary: The node ID dictionary.
+    :param is_node_unmapped: The unmapped input node flag for each node, indexed by node code.
+    :param candidate_mappings: The candidate mappings of the step.
+    :return: The number of mappings for unmapped nodes, the one or many source to one
+    target mappings (merges) and the one source to many target mappings (dropped).
+    """
+    mappings_for_unmapped_nodes = filter_mappings_for_unmapped_nodes(
+        node_id_dictionary=node_id_dictionary,
+        is_node_unmapped=is_node_unmapped,
+        mappings=candidate_mappings,
+    )
+    return (
+        len(mappings_for_unmapped_nodes),
+        get_one_or_many_source_to_one_target_mappings(mappings=mappings_for_unmapped_nodes),
+        get_one_source_to_many_target_mappings(mappings=mappings_for_unmapped_nodes),
+    )
+
+
+def produce_self_merges_for_seed_nodes(seed_id: str, nodes: NamedTable, nodes_obsolete: DataFrame) -> NamedTable:
     """Produce a set of (self) merges for the seed ontology.
 
     In the result each source and target node ID are the same.
@@ -436,27 +527,34 @@ def produce_self_merges_for_seed_nodes(seed_id: str, nodes: DataFrame, nodes_obs
     :return: The merged table.
     """
     # get only seed nodes
-    df = produce_table_with_namespace_column_for_node_ids(table=nodes)
-    df.query(
-        f"{get_namespace_column_name_for_column(COLUMN_DEFAULT_ID)} == '{seed_id}'",
-        inplace=True,
-    )
-    df.rename(
-        columns={COLUMN_DEFAULT_ID: COLUMN_SOURCE_ID},
-        inplace=True,
-    )
+    df = nodes.dataframe[
+        (nodes.get_column(get_namespace_column_name_for_column(COLUMN_DEFAULT_ID)) == seed_id).values
+    ].rename(columns={COLUMN_DEFAULT_ID: COLUMN_SOURCE_ID})
 
     # filter out obsolete nodes
-    nodes_obsolete_ids = list(nodes_obsolete[COLUMN_DEFAULT_ID])
-    df.query(
-        f"{COLUMN_SOURCE_ID} != @node_ids",
-        local_dict={"node_ids": nodes_obsolete_ids},
-        inplace=True,
+    df = filter_table_for_node_ids(
+        table=df,
+        node_id_index=produce_node_id_index(node_ids=nodes_obsolete[COLUMN_DEFAULT_ID]),
+        node_id_columns=[COLUMN_SOURCE_ID],
+        is_member=False,
     )
-    df = df[[COLUMN_SOURCE_ID]]
+    df = df[[COLUMN_SOURCE_ID]].copy()
 
     # produce self merges
     df[COLUMN_TARGET_ID] = df[COLUMN_SOURCE_ID].apply(lambda x: x)
 
     logger.info(f"Produced {len(df):,d} self merges for seed source '{seed_id}'.")
     return NamedTable(name=TABLE_MERGES_WITH_META_DATA, dataframe=df)
+
+
+def _get_namespace_column(table: DataFrame, node_id_column: str) -> Series:
+    """Get the namespace column of a node ID column, produce it if the table does not have it.
+
+    :param table: The table with the node ID column.
+    :param node_id_column: The name of the node ID column.
+    :return: The namespace column.
+    """
+    namespace_column_name = get_namespace_column_name_for_column(node_id_column=node_id_column)
+    if namespace_column_name in table:
+        return table[namespace_column_name]
+    return get_namespaces_for_node_ids(node_ids=table[node_id_column])
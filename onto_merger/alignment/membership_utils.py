@@ -0,0 +1,51 @@
+"""Helper methods to filter tables for node ID set membership with a reusable hashed node ID index."""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Index, Series
+
+
+def produce_node_id_index(node_ids: Series) -> Index:
+    """Produce a hashed node ID index that can be reused for membership lookups.
+
+    The hash table of the index is built on the first lookup and kept for the
+    subsequent ones.
+
+    :param node_ids: The node IDs (may contain duplicates).
+    :return: The unique node ID index.
+    """
+    return pd.Index(pd.unique(node_ids))
+
+
+def is_node_id_in_index(node_ids: Series, node_id_index: Index) -> np.ndarray:
+    """Check for each node ID whether it is in the node ID index.
+
+    :param node_ids: The node IDs to be checked.
+    :param node_id_index: The (unique) node ID index.
+    :return: The membership mask.
+    """
+    return node_id_index.get_indexer(node_ids) >= 0
+
+
+def filter_table_for_node_ids(
+    table: DataFrame,
+    node_id_index: Index,
+    node_id_columns: List[str],
+    is_member: bool = True,
+) -> DataFrame:
+    """Filter a table for the rows where the node IDs of all given columns are (or are not) in the node ID index.
+
+    :param table: The table to be filtered.
+    :param node_id_index: The (unique) node ID index.
+    :param node_id_columns: The node ID columns that are checked.
+    :param is_member: If True the rows with node IDs in the index are kept, if False
+    the rows with node IDs not in the index are kept.
+    :return: The filtered table.
+    """
+    mask = np.ones(len(table), dtype=bool)
+    for node_id_column in node_id_columns:
+        is_in_index = is_node_id_in_index(node_ids=table[node_id_column], node_id_index=node_id_index)
+        mask &= is_in_index if is_member else ~is_in_index
+    return table[mask]
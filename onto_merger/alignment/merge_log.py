@@ -0,0 +1,56 @@
+"""Append-only log of the merges produced during the alignment process."""
+
+from typing import List
+
+import pandas as pd
+from pandas import DataFrame
+
+from onto_merger.data.constants import (
+    SCHEMA_MERGE_TABLE_WITH_META_DATA,
+    TABLE_MERGES_WITH_META_DATA,
+)
+from onto_merger.data.dataclasses import NamedTable
+
+
+class MergeLog:
+    """Data class for collecting merges step by step without re-concatenating the full merge table.
+
+    Merge tables are stored as chunks (in the order they were added), and are materialised into
+    a single table only when requested.
+    """
+
+    def __init__(self):
+        """Initialise the MergeLog class."""
+        self._chunks: List[DataFrame] = []
+
+    def append(self, merges: DataFrame) -> None:
+        """Add a set of merges to the log.
+
+        :param merges: The merges to be added.
+        :return:
+        """
+        self._chunks.append(merges)
+
+    def clear(self) -> None:
+        """Remove all merges from the log.
+
+        :return:
+        """
+        self._chunks.clear()
+
+    def produce_named_table_merges(self) -> NamedTable:
+        """Materialise the log into the merge table.
+
+        The most recently added merges come first, duplicates are dropped keeping the first occurrence.
+
+        :return: The merge named table.
+        """
+        if not self._chunks:
+            return NamedTable(
+                name=TABLE_MERGES_WITH_META_DATA,
+                dataframe=pd.DataFrame([], columns=list(SCHEMA_MERGE_TABLE_WITH_META_DATA)),
+            )
+        return NamedTable(
+            name=TABLE_MERGES_WITH_META_DATA,
+            dataframe=pd.concat(self._chunks[::-1]).drop_duplicates(keep="first"),
+        )
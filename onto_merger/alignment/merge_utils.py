@@ -4,10 +4,10 @@ from typing import List, Optional
 
 import numpy as np
 import pandas as pd
-from networkx import connected_components
-from pandas import DataFrame
+from pandas import DataFrame, Index
 
-from onto_merger.alignment import networkx_utils
+from onto_merger.alignment import delta_utils
+from onto_merger.alignment.union_find_utils import UnionFind
 from onto_merger.analyser import analysis_utils
 from onto_merger.data.constants import (
     COLUMN_DEFAULT_ID,
@@ -32,10 +32,12 @@ from onto_merger.data.constants import (
     TABLE_NODES_MERGED,
     TABLE_NODES_MERGED_TO_OTHER,
     TABLE_NODES_MERGED_TO_SEED,
+    TABLE_NODES_REALIGNED,
     TABLE_NODES_SEED,
     TABLE_NODES_UNMAPPED,
 )
 from onto_merger.data.dataclasses import DataRepository, NamedTable
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
 from onto_merger.logger.log import get_logger
 
 logger = get_logger(__name__)
@@ -43,12 +45,16 @@ logger = get_logger(__name__)
 
 def post_process_alignment_results(data_repo: DataRepository,
                                    seed_id: str,
-                                   alignment_priority_order: List[str]) -> List[NamedTable]:
+                                   alignment_priority_order: List[str],
+                                   merges_aggregated_previous: Optional[DataFrame] = None) -> List[NamedTable]:
     """Produce tables for analysing the alignment results.
 
     :param data_repo: The data repository containing the produced tables.
     :param seed_id: The ID of the seed ontology.
     :param alignment_priority_order: The alignment priority order.
+    :param merges_aggregated_previous: The aggregated merges of the previous run, if given
+    the merges are only the merges of the re-aligned nodes (incremental alignment), and the
+    previous merges of the rest of the nodes are kept.
     :return: The produced named tables.
     """
     # aggregate merges
@@ -56,6 +62,15 @@ def post_process_alignment_results(data_repo: DataRepository,
         merges=data_repo.get(TABLE_MERGES_WITH_META_DATA).dataframe,
         alignment_priority_order=alignment_priority_order,
     )
+    if merges_aggregated_previous is not None:
+        table_aggregated_merges = NamedTable(
+            TABLE_MERGES_AGGREGATED,
+            delta_utils.produce_table_merges_aggregated_with_delta(
+                merges_aggregated_previous=merges_aggregated_previous,
+                merges_aggregated_realigned=table_aggregated_merges.dataframe,
+                realigned_node_ids=pd.Index(data_repo.get(TABLE_NODES_REALIGNED).dataframe[COLUMN_DEFAULT_ID]),
+            ),
+        )
     # nodes
     table_seed_nodes = _produce_named_table_seed_nodes(nodes=data_repo.get(TABLE_NODES).dataframe, seed_id=seed_id)
     table_merged_nodes = _produce_named_table_merged_nodes(merges_aggregated=table_aggregated_merges.dataframe)
@@ -76,7 +91,9 @@ def post_process_alignment_results(data_repo: DataRepository,
             table_unmapped_nodes, table_seed_nodes, table_merged_to_other_nodes]
 
 
-def _produce_named_table_aggregated_merges(merges: DataFrame, alignment_priority_order: List[str]) -> NamedTable:
+def _produce_named_table_aggregated_merges(
+        merges: DataFrame, alignment_priority_order: List[str], node_id_dictionary: Optional[NodeIdDictionary] = None
+) -> NamedTable:
     """Produce a named table with aggregated merges.
 
     In aggregated merges the target ID is always the canonical ID for a given merge cluster
@@ -85,27 +102,42 @@ def _produce_named_table_aggregated_merges(merges: DataFrame, alignment_priority
     :param merges: The set of input merges.
     :param alignment_priority_order: The alignment priority order that defines the
     canonical node.
+    :param node_id_dictionary: The node ID dictionary used to encode the merged node IDs,
+    if not given (or it does not contain all merged node IDs) it is produced from the merges.
     :return: The set of aggregated merges.
     """
-    graph = networkx_utils.create_networkx_graph(edges=merges[SCHEMA_EDGE_SOURCE_TO_TARGET_IDS])
-    sub_graphs = list(graph.subgraph(c) for c in connected_components(graph))
-    clusters = [list(sub.nodes) for sub in sub_graphs]
-    merges_aggregated = pd.DataFrame([[i] for i in np.array(clusters, dtype=object)])
-    merges_aggregated.columns = [COLUMN_SOURCE_ID]
+    # encode the node IDs with the dictionary
+    if node_id_dictionary is None:
+        node_id_dictionary = NodeIdDictionary.from_tables(tables=[merges])
+    node_codes = node_id_dictionary.encode(pd.concat([merges[COLUMN_SOURCE_ID], merges[COLUMN_TARGET_ID]]))
+    if (node_codes < 0).any():
+        node_id_dictionary = NodeIdDictionary.from_tables(tables=[merges])
+        node_codes = node_id_dictionary.encode(pd.concat([merges[COLUMN_SOURCE_ID], merges[COLUMN_TARGET_ID]]))
+
+    # local codes for the merged nodes (they follow the sorted node ID order), and cluster them
+    merged_node_codes, local_node_codes = np.unique(node_codes, return_inverse=True)
+    source_id_codes, target_id_codes = local_node_codes[:len(merges)], local_node_codes[len(merges):]
+    union_find = UnionFind(size=len(merged_node_codes))
+    union_find.union(nodes_a=source_id_codes, nodes_b=target_id_codes)
+    merge_clusters = union_find.get_components()
 
     # canonical node according to the priority order
-    merges_aggregated[COLUMN_TARGET_ID] = merges_aggregated.apply(
-        lambda x: _get_canonical_node_for_merge_cluster(
-            merge_cluster=x[COLUMN_SOURCE_ID],
-            alignment_priority_order=alignment_priority_order,
-        ),
-        axis=1,
+    canonical_node_codes = _get_canonical_node_codes_for_merge_clusters(
+        node_namespace_codes=node_id_dictionary.get_namespace_codes(node_codes=merged_node_codes),
+        namespaces=node_id_dictionary.namespaces,
+        merge_clusters=merge_clusters,
+        merge_source_node_codes=source_id_codes,
+        alignment_priority_order=alignment_priority_order,
     )
+    node_id_values = node_id_dictionary.decode(node_codes=merged_node_codes)
+    canonical_node_ids = np.full(len(merged_node_codes), None, dtype=object)
+    has_canonical_node = canonical_node_codes >= 0
+    canonical_node_ids[has_canonical_node] = node_id_values[canonical_node_codes[has_canonical_node]]
 
     # convert to merge table
-    merges_aggregated = merges_aggregated.explode(column=COLUMN_SOURCE_ID).sort_values(
-        [COLUMN_TARGET_ID, COLUMN_SOURCE_ID]
-    )[SCHEMA_EDGE_SOURCE_TO_TARGET_IDS]
+    merges_aggregated = pd.DataFrame({COLUMN_SOURCE_ID: node_id_values,
+                                      COLUMN_TARGET_ID: canonical_node_ids}) \
+        .sort_values([COLUMN_TARGET_ID, COLUMN_SOURCE_ID])[SCHEMA_EDGE_SOURCE_TO_TARGET_IDS]
     merges_aggregated.query(expr=f"{COLUMN_SOURCE_ID} != {COLUMN_TARGET_ID}", inplace=True)
 
     return NamedTable(TABLE_MERGES_AGGREGATED, merges_aggregated)
@@ -262,18 +294,48 @@ def produce_table_unmapped_nodes(nodes: DataFrame, merges: DataFrame) -> DataFra
     return df
 
 
-def _get_canonical_node_for_merge_cluster(
-        merge_cluster: List[str], alignment_priority_order: List[str]
-) -> Optional[str]:
-    """Return the canonical node ID for a given merge cluster.
+def _get_canonical_node_codes_for_merge_clusters(
+        node_namespace_codes: np.ndarray, namespaces: Index, merge_clusters: np.ndarray,
+        merge_source_node_codes: np.ndarray, alignment_priority_order: List[str]
+) -> np.ndarray:
+    """Return the canonical node code for each node, i.e. the canonical node of its merge cluster.
 
-    :param merge_cluster: The merge cluster, i.e. nodes that form a merge chain.
+    The canonical node is the node with the highest priority namespace in the cluster. Ties (nodes
+    from the same namespace, e.g. obsolete to current node ID merges) are resolved by preferring
+    nodes that are only merge targets, then the smallest node ID.
+
+    :param node_namespace_codes: The namespace code of each node, indexed by node code
+    (node codes follow the sorted node ID order).
+    :param namespaces: The namespaces, indexed by namespace code.
+    :param merge_clusters: The merge cluster label of each node.
+    :param merge_source_node_codes: The codes of the nodes that are merged to another node.
     :param alignment_priority_order: The alignment priority order that defines the
     canonical node.
-    :return: The canonical node ID if it can be determined, otherwise None.
+    :return: The canonical node code for each node, -1 if it cannot be determined.
     """
-    merge_cluster_ns_to_id = {analysis_utils.get_namespace_for_node_id(node_id): node_id for node_id in merge_cluster}
-    for source_id in alignment_priority_order:
-        if source_id in merge_cluster_ns_to_id:
-            return merge_cluster_ns_to_id.get(source_id)
-    return None
+    node_count = len(node_namespace_codes)
+
+    # priority rank for each node (via its namespace); unknown namespaces rank last
+    namespace_priority_ranks = np.array(
+        [
+            alignment_priority_order.index(namespace) if namespace in alignment_priority_order
+            else len(alignment_priority_order)
+            for namespace in namespaces
+        ],
+        dtype=np.int64,
+    )
+    node_priority_ranks = namespace_priority_ranks[node_namespace_codes]
+    is_merge_source = np.zeros(node_count, dtype=bool)
+    is_merge_source[merge_source_node_codes] = True
+
+    # the first node of each cluster in (cluster, rank, is merge source, node code) order
+    node_order = np.lexsort((np.arange(node_count), is_merge_source, node_priority_ranks, merge_clusters))
+    ordered_clusters = merge_clusters[node_order]
+    is_first_of_cluster = np.ones(node_count, dtype=bool)
+    is_first_of_cluster[1:] = ordered_clusters[1:] != ordered_clusters[:-1]
+    canonical_node_code_for_cluster = np.full(node_count, -1, dtype=np.int64)
+    canonical_node_code_for_cluster[ordered_clusters[is_first_of_cluster]] = node_order[is_first_of_cluster]
+
+    canonical_node_codes = canonical_node_code_for_cluster[merge_clusters]
+    canonical_node_codes[node_priority_ranks[canonical_node_codes] == len(alignment_priority_order)] = -1
+    return canonical_node_codes
@@ -2,12 +2,13 @@
 
 # mypy: ignore-errors
 
-from typing import Dict, List
+from typing import AbstractSet, Dict, List, Optional
 
 import networkit as nk
+import numpy as np
+import pandas as pd
 from networkit import Graph
 from pandas import DataFrame
-from tqdm import tqdm
 
 from onto_merger.data.constants import COLUMN_SOURCE_ID, COLUMN_TARGET_ID
 from onto_merger.logger.log import get_logger
@@ -22,20 +23,24 @@ class NetworkitGraph:
     node_id_to_index_map: Dict[str, int]
     node_index_to_id_map: Dict[int, str]
     root_nodes = List[str]
-    search_heuristic: List[int]
+    root_path_tree: Optional[List[Optional[int]]]
 
     def __init__(self, edges: DataFrame):
         """Initialise the Graph class."""
         logger.info(f"Started initialising hierarchy graph from {len(edges):,d} edges...")
-        src_ids = edges[COLUMN_SOURCE_ID].tolist()
-        trg_ids = edges[COLUMN_TARGET_ID].tolist()
-        node_ids = list(set(src_ids + trg_ids))
-        self.root_nodes = [node_id for node_id in node_ids if node_id not in src_ids]
+        # integer code the node IDs: source codes come first, followed by the target codes
+        node_id_codes, node_ids = pd.factorize(pd.concat([edges[COLUMN_SOURCE_ID], edges[COLUMN_TARGET_ID]]))
+        src_indices, trg_indices = node_id_codes[:len(edges)], node_id_codes[len(edges):]
+        self.root_nodes = node_ids[np.setdiff1d(trg_indices, src_indices)].tolist()
         logger.info("Producing node ID lookup maps..")
-        self.node_id_to_index_map, self.node_index_to_id_map = NetworkitGraph._produce_node_id_maps(node_ids=node_ids)
+        self.node_id_to_index_map, self.node_index_to_id_map = NetworkitGraph._produce_node_id_maps(
+            node_ids=node_ids.tolist()
+        )
         logger.info("Adding edges..")
-        self.graph = self._create_networkit_graph(edges=edges, node_id_to_index=self.node_id_to_index_map)
-        self.search_heuristic = [0 for _ in range(self.graph.upperNodeIdBound())]
+        self.graph = self._create_networkit_graph(
+            src_indices=src_indices, trg_indices=trg_indices, node_count=len(node_ids)
+        )
+        self.root_path_tree = None
         logger.info(
             f"Hierarchy graph initialised with {self.graph.numberOfNodes():,d} nodes "
             + f"({len(self.root_nodes)} possible root(s)) and {self.graph.numberOfEdges():,d} edges"
@@ -47,45 +52,112 @@ class NetworkitGraph:
         :param node_id: The node ID.
         :return: The shortest path.
         """
-        if node_id not in self.node_id_to_index_map:
+        return self.get_paths_for_nodes(node_ids=[node_id])[node_id]
+
+    def get_paths_for_nodes(self, node_ids: List[str]) -> Dict[str, List[str]]:
+        """Get the shortest path (to the nearest root) for each node of a node set.
+
+        The paths are read from a single shortest-path tree that is computed (once) from all
+        roots, instead of running a separate search for every node and root.
+
+        :param node_ids: The node IDs.
+        :return: The dictionary of node ID to shortest path (empty if there is no path).
+        """
+        if self.root_path_tree is None:
+            self.root_path_tree = self._produce_shortest_path_tree(
+                source_node_indices=[self.node_id_to_index_map[root_node_id] for root_node_id in self.root_nodes]
+            )
+        return self._get_paths_for_nodes_from_tree(node_ids=node_ids, path_tree=self.root_path_tree)
+
+    def get_paths_to_nearest_terminus(
+            self, node_ids: List[str], terminus_node_ids: AbstractSet[str]
+    ) -> Dict[str, List[str]]:
+        """Get the shortest path to the nearest terminus node (e.g. a merged node) for each node of a node set.
+
+        A single upward search is seeded from all terminus nodes, so the paths end at the first
+        terminus instead of walking up to a root.
+
+        :param node_ids: The node IDs.
+        :param terminus_node_ids: The node IDs where a path can be terminated.
+        :return: The dictionary of node ID to shortest path (empty if no terminus can be reached).
+        """
+        path_tree = self._produce_shortest_path_tree(
+            source_node_indices=[
+                node_index for node_id, node_index in self.node_id_to_index_map.items() if node_id in terminus_node_ids
+            ]
+        )
+        return self._get_paths_for_nodes_from_tree(node_ids=node_ids, path_tree=path_tree)
+
+    def _get_paths_for_nodes_from_tree(
+            self, node_ids: List[str], path_tree: List[Optional[int]]
+    ) -> Dict[str, List[str]]:
+        return {
+            node_id: [
+                self.node_index_to_id_map[node_index]
+                for node_index in self._get_path_for_node_index(
+                    node_index=self.node_id_to_index_map[node_id], path_tree=path_tree
+                )
+            ]
+            if node_id in self.node_id_to_index_map
+            else []
+            for node_id in node_ids
+        }
+
+    @staticmethod
+    def _get_path_for_node_index(node_index: int, path_tree: List[Optional[int]]) -> List[int]:
+        path = [node_index]
+        parent_index = path_tree[node_index]
+        while parent_index is not None:
+            path.append(parent_index)
+            parent_index = path_tree[parent_index]
+        # unreachable nodes and source (root or terminus) nodes have no path
+        if len(path) == 1:
             return []
-        return [
-            self.node_index_to_id_map[node_index]
-            for node_index in self._get_path_for_node_index(node_index=self.node_id_to_index_map[node_id])
-        ]
-
-    def _get_path_for_node_index(self, node_index: int) -> List[int]:
-        for root_node_id in self.root_nodes:
-            root_node_index = self.node_id_to_index_map[root_node_id]
-            a_star = nk.distance.AStar(self.graph, self.search_heuristic, node_index, root_node_index)
-            a_star.run()
-            path = a_star.getPath()
-            if path or (self.graph.hasEdge(node_index, root_node_index)):
-                return [node_index] + path + [root_node_index]
-        return []
+        return path
+
+    def _produce_shortest_path_tree(self, source_node_indices: List[int]) -> List[Optional[int]]:
+        """Produce the shortest-path tree of the graph from a set of source nodes (e.g. roots).
+
+        A BFS is run on the reversed graph from a virtual node that is connected to every source node,
+        i.e. each node gets the parent (next node towards its nearest source node) on its shortest path.
+
+        :param source_node_indices: The indices of the nodes where the paths end.
+        :return: The parent node index for each node index (None for source and unreachable nodes).
+        """
+        reversed_graph = nk.graphtools.transpose(self.graph)
+        virtual_source_index = reversed_graph.addNode()
+        for source_node_index in source_node_indices:
+            reversed_graph.addEdge(virtual_source_index, source_node_index)
+        bfs = nk.distance.BFS(reversed_graph, virtual_source_index, True)
+        bfs.run()
+        path_tree = []
+        for node_index in range(self.graph.upperNodeIdBound()):
+            predecessors = bfs.getPredecessors(node_index)
+            parent_index = predecessors[0] if predecessors else None
+            path_tree.append(None if parent_index == virtual_source_index else parent_index)
+        return path_tree
 
     @staticmethod
-    def _create_networkit_graph(edges: DataFrame, node_id_to_index: dict) -> Graph:
-        """Produce a networkit graph object from a hierarchy edge table.
+    def _create_networkit_graph(src_indices: np.ndarray, trg_indices: np.ndarray, node_count: int) -> Graph:
+        """Produce a networkit graph object from the integer coded hierarchy edges.
 
-        :param node_id_to_index:
-        :param edges: The hierarchy edge table.
-        :return: The network x graph.
+        :param src_indices: The source node index of each edge.
+        :param trg_indices: The target node index of each edge.
+        :param node_count: The number of nodes.
+        :return: The networkit graph.
         """
-        graph = nk.Graph(len(node_id_to_index), weighted=False, directed=True)
-        with tqdm(total=len(edges), desc="Adding edges to Networkit graph") as progress_bar:
-            for _, row in edges.iterrows():
-                graph.addEdge(node_id_to_index[row[COLUMN_SOURCE_ID]], node_id_to_index[row[COLUMN_TARGET_ID]])
-                progress_bar.update(1)
+        # bulk construction (networkit 11+)
+        if hasattr(nk, "GraphFromCoo"):
+            return nk.GraphFromCoo(
+                (src_indices.astype(np.int64), trg_indices.astype(np.int64)), n=node_count, directed=True
+            )
+        graph = nk.Graph(node_count, weighted=False, directed=True)
+        for src_index, trg_index in zip(src_indices.tolist(), trg_indices.tolist()):
+            graph.addEdge(src_index, trg_index)
         return graph
 
     @staticmethod
     def _produce_node_id_maps(node_ids: List[str]) -> (Dict[str, int], Dict[int, str]):
-        node_id_to_index_map = dict()
-        node_index_to_id_map = dict()
-        with tqdm(total=len(node_ids), desc="Producing node ID lookup maps") as progress_bar:
-            for idx, node_id in enumerate(node_ids):
-                node_id_to_index_map[node_id] = idx
-                node_index_to_id_map[idx] = node_id
-                progress_bar.update(1)
+        node_id_to_index_map = dict(zip(node_ids, range(len(node_ids))))
+        node_index_to_id_map = dict(enumerate(node_ids))
         return node_id_to_index_map, node_index_to_id_map
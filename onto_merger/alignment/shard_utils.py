@@ -0,0 +1,120 @@
+"""Helper methods to run the alignment steps on shards (groups of connected components) of the mapping graph."""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+from onto_merger.alignment import mapping_utils
+from onto_merger.alignment.union_find_utils import UnionFind
+from onto_merger.data.constants import COLUMN_SOURCE_ID, COLUMN_TARGET_ID
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
+
+# more shards than workers, so a worker that got a large shard does not hold up the others
+SHARD_COUNT_PER_WORKER = 4
+
+
+def produce_node_shards(node_id_dictionary: NodeIdDictionary, mappings: DataFrame, shard_count: int) -> np.ndarray:
+    """Assign each node to a shard, the nodes of a connected component of the mapping graph are in the same shard.
+
+    Components are ordered by their mapping count and dealt to the shards back and forth
+    (1..n, n..1, ...), so the shards get a similar number of mappings.
+
+    :param node_id_dictionary: The node ID dictionary.
+    :param mappings: The mappings that form the mapping graph.
+    :param shard_count: The number of shards.
+    :return: The shard of each node, indexed by node code, -1 for nodes without mappings.
+    """
+    source_node_codes = node_id_dictionary.encode(mappings[COLUMN_SOURCE_ID])
+    target_node_codes = node_id_dictionary.encode(mappings[COLUMN_TARGET_ID])
+    is_valid = (source_node_codes >= 0) & (target_node_codes >= 0)
+    union_find = UnionFind(size=len(node_id_dictionary))
+    union_find.union(source_node_codes[is_valid], target_node_codes[is_valid])
+    components = union_find.get_components()
+
+    mapping_counts = np.bincount(components[source_node_codes[is_valid]], minlength=len(node_id_dictionary))
+    component_labels = np.flatnonzero(mapping_counts)
+    component_labels = component_labels[np.argsort(-mapping_counts[component_labels], kind="mergesort")]
+    rounds, positions = np.divmod(np.arange(len(component_labels)), shard_count)
+    component_shards = np.full(len(node_id_dictionary), -1, dtype=np.int64)
+    component_shards[component_labels] = np.where(rounds % 2 == 0, positions, shard_count - 1 - positions)
+    return component_shards[components]
+
+
+def split_table_into_shards(
+    table: DataFrame, node_id_dictionary: NodeIdDictionary, node_shards: np.ndarray, shard_count: int
+) -> List[DataFrame]:
+    """Split a mapping table into shards according to the shard of the source node.
+
+    The index of the shard tables is the row position in the input table; rows with a
+    source node without a shard are not assigned.
+
+    :param table: The mapping table to be split.
+    :param node_id_dictionary: The node ID dictionary.
+    :param node_shards: The shard of each node, indexed by node code.
+    :param shard_count: The number of shards.
+    :return: The mapping table of each shard.
+    """
+    source_node_codes = node_id_dictionary.encode(table[COLUMN_SOURCE_ID])
+    row_shards = np.where(source_node_codes >= 0, node_shards[source_node_codes], -1)
+    row_order = np.argsort(row_shards, kind="mergesort")
+    shard_bounds = np.searchsorted(row_shards[row_order], np.arange(shard_count + 1))
+    table_with_positions = table.reset_index(drop=True)
+    return [
+        table_with_positions.iloc[row_order[shard_bounds[shard]:shard_bounds[shard + 1]]]
+        for shard in range(shard_count)
+    ]
+
+
+def align_shard(
+    candidate_mappings: Dict[Tuple[str, str], DataFrame],
+    unmapped_node_ids: np.ndarray,
+    steps: List[Tuple[str, str]],
+) -> Dict[Tuple[str, str], Tuple[int, np.ndarray, np.ndarray]]:
+    """Run the alignment steps on a shard.
+
+    :param candidate_mappings: The candidate mappings of the shard (indexed by row position) for
+    each step.
+    :param unmapped_node_ids: The unmapped nodes of the shard prior to the first step.
+    :param steps: The mapping type group name and source of each step, in the order of the steps.
+    :return: The number of mappings for unmapped nodes, and the row positions of the merge and
+    the dropped mappings for each step.
+    """
+    node_id_dictionary = NodeIdDictionary.from_tables(tables=list(candidate_mappings.values()))
+    is_node_unmapped = np.zeros(len(node_id_dictionary), dtype=bool)
+    unmapped_node_codes = node_id_dictionary.encode(unmapped_node_ids)
+    is_node_unmapped[unmapped_node_codes[unmapped_node_codes >= 0]] = True
+
+    step_results = {}
+    for step in steps:
+        count_mappings, merges, dropped_mappings = mapping_utils.produce_mappings_for_alignment_step(
+            node_id_dictionary=node_id_dictionary,
+            is_node_unmapped=is_node_unmapped,
+            candidate_mappings=candidate_mappings[step],
+        )
+        is_node_unmapped[node_id_dictionary.encode(merges[COLUMN_SOURCE_ID])] = False
+        step_results[step] = (count_mappings, merges.index.values, dropped_mappings.index.values)
+    return step_results
+
+
+def combine_shard_step_results(
+    candidate_mappings: DataFrame, step_results: List[Tuple[int, np.ndarray, np.ndarray]]
+) -> Tuple[int, DataFrame, DataFrame]:
+    """Combine the results of an alignment step from each shard.
+
+    The rows are taken in the candidate mapping order, so the result is the same as
+    the result of the step run on all the candidate mappings.
+
+    :param candidate_mappings: The candidate mappings of the step.
+    :param step_results: The number of mappings for unmapped nodes, and the row positions
+    of the merge and the dropped mappings from each shard.
+    :return: The number of mappings for unmapped nodes, the merge mappings and the dropped mappings.
+    """
+    empty_positions = np.array([], dtype=np.int64)
+    merge_positions = np.sort(np.concatenate([empty_positions] + [result[1] for result in step_results]))
+    dropped_positions = np.sort(np.concatenate([empty_positions] + [result[2] for result in step_results]))
+    return (
+        sum(result[0] for result in step_results),
+        candidate_mappings.iloc[merge_positions],
+        candidate_mappings.iloc[dropped_positions].sort_values([COLUMN_SOURCE_ID, COLUMN_TARGET_ID], kind="mergesort"),
+    )
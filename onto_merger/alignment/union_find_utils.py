@@ -0,0 +1,66 @@
+"""Array backed union-find (disjoint set) data class for clustering integer coded nodes."""
+
+import numpy as np
+
+
+class UnionFind:
+    """Data class for computing connected components over integer coded nodes (0..size-1).
+
+    Unions are performed in batches with vectorised root hooking (each root is linked to the
+    smallest root it is connected to) and pointer jumping, so a component is always labelled
+    with its smallest node code.
+    """
+
+    parent: np.ndarray
+
+    def __init__(self, size: int):
+        """Initialise the UnionFind class, every node is in its own component.
+
+        :param size: The number of nodes.
+        """
+        self.parent = np.arange(size, dtype=np.int64)
+
+    def union(self, nodes_a: np.ndarray, nodes_b: np.ndarray) -> None:
+        """Merge the components of each node pair.
+
+        :param nodes_a: The first node code of each pair.
+        :param nodes_b: The second node code of each pair.
+        :return:
+        """
+        nodes_a = np.asarray(nodes_a, dtype=np.int64)
+        nodes_b = np.asarray(nodes_b, dtype=np.int64)
+        while len(nodes_a) > 0:
+            self._compress()
+            roots_a, roots_b = self.parent[nodes_a], self.parent[nodes_b]
+            is_unmerged = roots_a != roots_b
+            if not is_unmerged.any():
+                break
+            nodes_a, nodes_b = nodes_a[is_unmerged], nodes_b[is_unmerged]
+            roots_a, roots_b = roots_a[is_unmerged], roots_b[is_unmerged]
+            np.minimum.at(self.parent, np.maximum(roots_a, roots_b), np.minimum(roots_a, roots_b))
+        self._compress()
+
+    def find(self, nodes: np.ndarray) -> np.ndarray:
+        """Get the component label (smallest node code in the component) for each node.
+
+        :param nodes: The node codes.
+        :return: The component labels.
+        """
+        self._compress()
+        return self.parent[np.asarray(nodes, dtype=np.int64)]
+
+    def get_components(self) -> np.ndarray:
+        """Get the component label for every node.
+
+        :return: The component labels, indexed by node code.
+        """
+        self._compress()
+        return self.parent.copy()
+
+    def _compress(self) -> None:
+        """Point every node directly to its root (pointer jumping)."""
+        while True:
+            grand_parent = self.parent[self.parent]
+            if np.array_equal(grand_parent, self.parent):
+                break
+            self.parent = grand_parent
@@ -10,6 +10,18 @@ schema = {
         "seed_ontology_name": {"type": "string"},
         "force_through_failed_validation": {"type": "bool"},
         "image_format": {"type": "string", "pattern": "^(png|svg|html)$"},
+        "connectivity_mode": {"type": "string", "pattern": "^(root_path|nearest_terminus)$"},
+        "worker_count": {"type": "integer", "minimum": 1},
+        "sharded_alignment": {"type": "boolean"},
+        "storage_format": {"type": "string", "pattern": "^(csv|parquet|arrow)$"},
+        "csv_export": {"type": "boolean"},
+        "mapping_chunk_size": {"type": "integer", "minimum": 1},
+        "parallel_validation": {"type": "boolean"},
+        "validation_engine": {"type": "string", "pattern": "^(great_expectations|native)$"},
+        "data_docs": {"type": "boolean"},
+        "validation_cache": {"type": "boolean"},
+        "parallel_profiling": {"type": "boolean"},
+        "profiling_cache": {"type": "boolean"},
         "mappings": {
             "type": "object",
             "required": ["type_groups"],
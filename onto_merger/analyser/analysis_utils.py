@@ -14,23 +14,20 @@ from onto_merger.data.constants import (
     COLUMN_SOURCE_TO_TARGET,
     COLUMN_TARGET_ID,
     NODE_ID_COLUMNS,
+    PIPELINE_SUB_STEPS,
     SCHEMA_NODE_NAMESPACE_FREQUENCY_TABLE,
 )
 from onto_merger.data.dataclasses import NamedTable
+from onto_merger.data.derived_columns import (
+    get_namespace_column_name_for_column,
+    get_namespaces_for_node_ids,
+    produce_namespace_pair_column,
+)
 from onto_merger.logger.log import get_logger
 
 logger = get_logger(__name__)
 
 
-def get_namespace_column_name_for_column(node_id_column: str) -> str:
-    """Produce a column name for a given node ID column name.
-
-    :param node_id_column: The name of the node ID column.
-    :return: The namespace column name.
-    """
-    return f"namespace_{node_id_column}"
-
-
 def get_namespace_for_node_id(node_id: str) -> str:
     """Get the namespace part of a node ID.
 
@@ -46,19 +43,21 @@ def produce_table_with_namespace_column_for_node_ids(table: DataFrame) -> DataFr
     In node tables there is only one node ID column. In edge tables
     (hierarchy, mappings, merges) there are always two node ID columns.
 
+    Namespace columns that are already in the table are kept, so tables that have
+    all of them are returned without computation. The namespaces of a named table are
+    memoised by the table, see `get_dataframe_with_namespace_columns`.
+
     :param table: The table to be appended with namespace column(s).
-    :return: A new table with a corresponding namespace column for all node ID columns.
+    :return: A new (shallow copy) table with a corresponding namespace column for all node ID columns.
     """
     if len(table) == 0:
         return table
-    table_copy = table.copy()
-    table_node_id_columns = sorted([col_name for col_name in NODE_ID_COLUMNS if col_name in list(table_copy)])
+    table_copy = table.copy(deep=False)
+    table_node_id_columns = sorted([col_name for col_name in NODE_ID_COLUMNS if col_name in table_copy])
     for node_id_column in table_node_id_columns:
         namespace_column_name = get_namespace_column_name_for_column(node_id_column=node_id_column)
-        if namespace_column_name not in list(table_copy):
-            table_copy[namespace_column_name] = table_copy[node_id_column].apply(
-                lambda node_id: get_namespace_for_node_id(str(node_id))
-            )
+        if namespace_column_name not in table_copy:
+            table_copy[namespace_column_name] = get_namespaces_for_node_ids(node_ids=table_copy[node_id_column])
     return table_copy
 
 
@@ -75,15 +74,39 @@ def produce_table_with_namespace_column_pair(table: DataFrame) -> DataFrame:
         return table
     if COLUMN_SOURCE_TO_TARGET in list(table):
         return table
-    table_copy = table.copy()
-    table_copy[COLUMN_SOURCE_TO_TARGET] = table_copy.apply(
-        lambda x: f"{get_namespace_for_node_id(x[COLUMN_SOURCE_ID])}"
-                  + f" to {get_namespace_for_node_id(x[COLUMN_TARGET_ID])}",
-        axis=1,
+    table_with_namespaces = produce_table_with_namespace_column_for_node_ids(table=table)
+    table_copy = table.copy(deep=False)
+    table_copy[COLUMN_SOURCE_TO_TARGET] = produce_namespace_pair_column(
+        source_namespaces=table_with_namespaces[get_namespace_column_name_for_column(COLUMN_SOURCE_ID)],
+        target_namespaces=table_with_namespaces[get_namespace_column_name_for_column(COLUMN_TARGET_ID)],
     )
     return table_copy
 
 
+def get_dataframe_with_namespace_columns(table: NamedTable) -> DataFrame:
+    """Produce the dataframe of a named table appended with the namespace columns, and namespace pair column.
+
+    The columns are derived (and memoised) by the named table, so repeated calls for the same
+    table do not derive them again.
+
+    :param table: The named table.
+    :return: The dataframe (a shallow copy if columns are appended) with namespace and namespace pair columns.
+    """
+    if len(table.dataframe) == 0:
+        return table.dataframe
+    derivable_column_names = table.get_derivable_column_names()
+    return table.get_dataframe_with_columns(
+        column_names=[
+            column_name
+            for column_name in [
+                get_namespace_column_name_for_column(node_id_column=node_id_column)
+                for node_id_column in NODE_ID_COLUMNS
+            ] + [COLUMN_SOURCE_TO_TARGET]
+            if column_name in derivable_column_names
+        ]
+    )
+
+
 def add_namespace_column_to_loaded_tables(
         tables: List[NamedTable],
 ) -> List[NamedTable]:
@@ -94,30 +117,24 @@ def add_namespace_column_to_loaded_tables(
     columns.
     """
     return [
-        NamedTable(
-            name=table.name,
-            dataframe=produce_table_with_namespace_column_pair(
-                produce_table_with_namespace_column_for_node_ids(table.dataframe)
-            ),
-        )
+        NamedTable(name=table.name, dataframe=get_dataframe_with_namespace_columns(table=table))
         for table in tables
     ]
 
 
-def filter_nodes_for_namespace(nodes: DataFrame, namespace: str) -> DataFrame:
-    """Filter a given node dataframe for a namespace.
+def filter_nodes_for_namespace(nodes: NamedTable, namespace: str) -> DataFrame:
+    """Filter a given node table for a namespace.
 
     :param nodes: The node table to be filtered.
     :param namespace: The ontology ID.
     :return: The node dataframe where all nodes belong to the same ontology (namespace).
     """
-    nodes_copy = nodes.copy()
     default_id_ns = get_namespace_column_name_for_column(COLUMN_DEFAULT_ID)
-    if default_id_ns not in list(nodes_copy):
-        nodes_copy = produce_table_with_namespace_column_for_node_ids(table=nodes_copy)
-    nodes_for_namespace = nodes_copy.query(f'{default_id_ns} == "{namespace}"', inplace=False)
+    nodes_with_ns = nodes.get_dataframe_with_columns(column_names=[default_id_ns])
+    nodes_for_namespace = nodes_with_ns[nodes_with_ns[default_id_ns] == namespace]
     logger.info(
-        f"Found {len(nodes_for_namespace):,d} nodes for namespace " + f"{namespace} from total {len(nodes):,d} nodes."
+        f"Found {len(nodes_for_namespace):,d} nodes for namespace "
+        + f"{namespace} from total {len(nodes.dataframe):,d} nodes."
     )
     return nodes_for_namespace
 
@@ -166,3 +183,15 @@ def produce_table_node_namespace_distribution(
         lambda x: f"{((x[COLUMN_COUNT] / node_table_count) * 100):.2f}%", axis=1
     )
     return namespace_distribution_table[SCHEMA_NODE_NAMESPACE_FREQUENCY_TABLE]
+
+
+def filter_runtime_for_main_steps(runtime: DataFrame) -> DataFrame:
+    """Filter the pipeline runtime table for the main steps, i.e. drop the sub steps nested in them.
+
+    The sub steps (e.g. profiling a table) are recorded within the runtime of their main step (and
+    may run concurrently), so they are excluded when the runtime of the pipeline is aggregated.
+
+    :param runtime: The pipeline runtime table.
+    :return: The runtime table of the main steps.
+    """
+    return runtime[~runtime["task"].str.startswith(tuple(PIPELINE_SUB_STEPS))]
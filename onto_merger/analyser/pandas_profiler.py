@@ -1,30 +1,123 @@
 """Helper methods to use Pandas profiling."""
 
-from typing import List
+import hashlib
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
 
 from pandas_profiling import ProfileReport
 
+from onto_merger.data.constants import PIPELINE_SUB_STEP_PROFILE_TABLE
+from onto_merger.data.content_hash import produce_table_content_hash
 from onto_merger.data.data_manager import DataManager
-from onto_merger.data.dataclasses import NamedTable
+from onto_merger.data.dataclasses import NamedTable, RuntimeData, format_datetime
 from onto_merger.logger.log import get_logger
+from onto_merger.version import __version__
 
 logger = get_logger(__name__)
 
 
-def profile_tables(tables: List[NamedTable], data_manager: DataManager) -> None:
+def profile_tables(tables: List[NamedTable], data_manager: DataManager) -> List[RuntimeData]:
     """Run the Pandas profiling process for a list of tables.
 
+    If configured, the tables are profiled concurrently in worker processes, and the reports are
+    cached by the table content hash (so unchanged tables are not profiled again).
+
     :param tables: The tables to be profiled.
     :param data_manager: The data manager.
-    :return:
+    :return: The runtime of profiling (or restoring the cached report of) each table.
     """
+    base_config = data_manager.config.base_config
     table_names = [table.name for table in tables]
     logger.info(f"Starting Pandas profiling for {len(tables)} tables: '{table_names}'")
+    runtime_data = []
+    cached_report_paths = {}
+    tables_to_profile = []
     for table in tables:
-        logger.info(f"Profiling table '{table.name}'")
-        report = produce_table_report(table=table)
-        report.to_file(output_file=data_manager.get_profiled_table_report_path(table_name=table.name))
+        if base_config.profiling_cache is True:
+            start_date_time = datetime.now()
+            cached_report_paths[table.name] = _get_cached_report_path(
+                data_manager=data_manager, fingerprint=_produce_report_fingerprint(table=table)
+            )
+            if _restore_cached_report(
+                    cache_file_path=cached_report_paths[table.name],
+                    report_path=data_manager.get_profiled_table_report_path(table_name=table.name),
+            ):
+                logger.info(f"Restored the cached profile report of table '{table.name}'.")
+                runtime_data.append(
+                    _produce_runtime_data(
+                        task=f"{PIPELINE_SUB_STEP_PROFILE_TABLE} {table.name} (CACHED)",
+                        start_date_time=start_date_time,
+                        end_date_time=datetime.now(),
+                    )
+                )
+                continue
+        tables_to_profile.append(table)
+
+    for table, (start_date_time, end_date_time) in _profile_tables(
+            tables=tables_to_profile,
+            data_manager=data_manager,
+            worker_count=base_config.worker_count if base_config.parallel_profiling is True else 1,
+    ):
+        logger.info(f"Profiled table '{table.name}' ({len(runtime_data) + 1}/{len(tables)}) in "
+                    + f"{(end_date_time - start_date_time).total_seconds():.1f}s.")
+        runtime_data.append(
+            _produce_runtime_data(
+                task=f"{PIPELINE_SUB_STEP_PROFILE_TABLE} {table.name}",
+                start_date_time=start_date_time,
+                end_date_time=end_date_time,
+            )
+        )
+        if table.name in cached_report_paths:
+            _store_cached_report(
+                cache_file_path=cached_report_paths[table.name],
+                report_path=data_manager.get_profiled_table_report_path(table_name=table.name),
+            )
     logger.info(f"Finished Pandas profiling for tables '{table_names}'.")
+    return runtime_data
+
+
+def _profile_tables(
+    tables: List[NamedTable], data_manager: DataManager, worker_count: Optional[int]
+) -> Iterator[Tuple[NamedTable, Tuple[datetime, datetime]]]:
+    """Profile the tables, concurrently in worker processes if the worker count is not 1.
+
+    :param tables: The tables to be profiled.
+    :param data_manager: The data manager.
+    :param worker_count: The number of worker processes, defaults to the number of CPUs if None.
+    :return: The table and the profiling start and end time of each table, in the order of completion.
+    """
+    if worker_count == 1 or len(tables) <= 1:
+        for table in tables:
+            yield table, profile_table(
+                table=table, report_path=data_manager.get_profiled_table_report_path(table_name=table.name)
+            )
+        return
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        futures = {
+            executor.submit(
+                profile_table,
+                table=table,
+                report_path=data_manager.get_profiled_table_report_path(table_name=table.name),
+            ): table
+            for table in tables
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def profile_table(table: NamedTable, report_path: str) -> Tuple[datetime, datetime]:
+    """Produce and save the profile report of a table.
+
+    :param table: The named table to be profiled.
+    :param report_path: The file path of the report.
+    :return: The start and end time of profiling.
+    """
+    start_date_time = datetime.now()
+    produce_table_report(table=table).to_file(output_file=report_path)
+    return start_date_time, datetime.now()
 
 
 def produce_table_report(table: NamedTable) -> ProfileReport:
@@ -40,3 +133,53 @@ def produce_table_report(table: NamedTable) -> ProfileReport:
         minimal=True,
         n_freq_table_max=250,
     )
+
+
+def _produce_report_fingerprint(table: NamedTable) -> str:
+    """Produce the fingerprint of a profile report: the OntoMerger version, the table name and content hash.
+
+    :param table: The named table to be profiled.
+    :return: The fingerprint as a hex string.
+    """
+    return hashlib.sha256(
+        f"{__version__}:{table.name}:{produce_table_content_hash(table=table.dataframe)}".encode()
+    ).hexdigest()
+
+
+def _get_cached_report_path(data_manager: DataManager, fingerprint: str) -> str:
+    """Produce the file path of a cached profile report."""
+    return os.path.join(data_manager.get_profiling_cache_folder_path(), f"{fingerprint}.html")
+
+
+def _restore_cached_report(cache_file_path: str, report_path: str) -> bool:
+    """Copy the cached profile report (if any) to the report path.
+
+    :param cache_file_path: The file path of the cached report.
+    :param report_path: The file path of the report.
+    :return: True if the report was cached (and restored).
+    """
+    if not os.path.isfile(cache_file_path):
+        return False
+    shutil.copyfile(cache_file_path, report_path)
+    return True
+
+
+def _store_cached_report(cache_file_path: str, report_path: str) -> None:
+    """Copy the profile report to the cache, the file is replaced atomically.
+
+    :param cache_file_path: The file path of the cached report.
+    :param report_path: The file path of the report.
+    :return:
+    """
+    os.makedirs(os.path.dirname(cache_file_path), exist_ok=True)
+    shutil.copyfile(report_path, f"{cache_file_path}.tmp")
+    os.replace(f"{cache_file_path}.tmp", cache_file_path)
+
+
+def _produce_runtime_data(task: str, start_date_time: datetime, end_date_time: datetime) -> RuntimeData:
+    return RuntimeData(
+        task=task,
+        start=format_datetime(start_date_time),
+        end=format_datetime(end_date_time),
+        elapsed=(end_date_time - start_date_time).total_seconds(),
+    )
@@ -8,7 +8,7 @@ from typing import List
 
 from pandas import DataFrame
 
-from onto_merger.analyser import plotly_utils, report_analyser_utils
+from onto_merger.analyser import analysis_utils, plotly_utils, report_analyser_utils
 from onto_merger.analyser.constants import (
     ANALYSIS_CONNECTED_NSS,
     ANALYSIS_CONNECTED_NSS_CHART,
@@ -114,8 +114,12 @@ class ReportAnalyser:
                 self._data_repo.get(table_name=TABLE_NODES),
                 self._data_repo.get(table_name=TABLE_NODES_OBSOLETE)
             ],
-            mappings=self._data_repo.get(table_name=TABLE_MAPPINGS).dataframe,
-            edges_hierarchy=self._data_repo.get(table_name=TABLE_EDGES_HIERARCHY).dataframe,
+            mappings=analysis_utils.get_dataframe_with_namespace_columns(
+                table=self._data_repo.get(table_name=TABLE_MAPPINGS)
+            ),
+            edges_hierarchy=analysis_utils.get_dataframe_with_namespace_columns(
+                table=self._data_repo.get(table_name=TABLE_EDGES_HIERARCHY)
+            ),
         )
 
     def _produce_output_dataset_analysis(self) -> None:
@@ -124,8 +128,12 @@ class ReportAnalyser:
             node_tables=[
                 self._data_repo.get(table_name=TABLE_NODES_DOMAIN),
             ],
-            mappings=self._data_repo.get(table_name=TABLE_MAPPINGS_DOMAIN).dataframe,
-            edges_hierarchy=self._data_repo.get(table_name=TABLE_EDGES_HIERARCHY_POST).dataframe,
+            mappings=analysis_utils.get_dataframe_with_namespace_columns(
+                table=self._data_repo.get(table_name=TABLE_MAPPINGS_DOMAIN)
+            ),
+            edges_hierarchy=analysis_utils.get_dataframe_with_namespace_columns(
+                table=self._data_repo.get(table_name=TABLE_EDGES_HIERARCHY_POST)
+            ),
         )
 
     def _produce_in_or_output_dataset_analysis(
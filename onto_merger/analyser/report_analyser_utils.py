@@ -11,7 +11,7 @@ import pandas as pd
 from pandas import DataFrame
 from pandas_profiling import __version__ as pandas_profiling_version
 
-from onto_merger.alignment import hierarchy_utils
+from onto_merger.alignment import hierarchy_utils, membership_utils
 from onto_merger.analyser import analysis_utils, plotly_utils
 from onto_merger.analyser.constants import (
     ANALYSIS_GENERAL,
@@ -31,6 +31,7 @@ from onto_merger.data.constants import (
     COLUMN_SOURCE_TO_TARGET,
     COLUMN_TARGET_ID,
     DIRECTORY_DOMAIN,
+    DIRECTORY_DOMAIN_ONTOLOGY,
     DIRECTORY_INPUT,
     DIRECTORY_INTERMEDIATE,
     DIRECTORY_OUTPUT,
@@ -93,7 +94,9 @@ def produce_summary_overview(
     :return: The summary as a named table.
     """
     config = data_manager.load_alignment_config()
-    steps_report = data_repo.get(table_name=TABLE_PIPELINE_STEPS_REPORT).dataframe
+    steps_report = analysis_utils.filter_runtime_for_main_steps(
+        runtime=data_repo.get(table_name=TABLE_PIPELINE_STEPS_REPORT).dataframe
+    )
     elapsed_time = timedelta(seconds=int(steps_report['elapsed'].sum()))
     summary = [
         {"metric": "Dataset (folder name)",
@@ -464,29 +467,31 @@ def produce_data_profiling_table_stats(
 ) -> Tuple[DataFrame, List[NamedTable]]:
     """Produce the data profiling analysis.
 
+    The table shapes are read from the stored files (only the metadata of columnar files).
+
     :param data_manager: The data manager instance.
     :return: The merged analysis and one table each for input, intermediate and output data sets.
     """
     input_df = pd.DataFrame(
         _produce_data_profiling_stats_for_directory(
-            tables=data_manager.load_input_tables(),
-            folder_path=data_manager.get_input_folder_path(),
+            table_names=TABLES_INPUT,
+            process_directory=DIRECTORY_INPUT,
             directory=DIRECTORY_INPUT,
             data_manager=data_manager
         )
     )
     intermediate_df = pd.DataFrame(
         _produce_data_profiling_stats_for_directory(
-            tables=data_manager.load_intermediate_tables(),
-            folder_path=data_manager.get_intermediate_folder_path(),
+            table_names=TABLES_INTERMEDIATE,
+            process_directory=f"{DIRECTORY_OUTPUT}/{DIRECTORY_INTERMEDIATE}",
             directory=DIRECTORY_INTERMEDIATE,
             data_manager=data_manager
         )
     )
     output_df = pd.DataFrame(
         _produce_data_profiling_stats_for_directory(
-            tables=data_manager.load_output_tables(),
-            folder_path=data_manager.get_domain_ontology_folder_path(),
+            table_names=TABLES_DOMAIN,
+            process_directory=f"{DIRECTORY_OUTPUT}/{DIRECTORY_DOMAIN_ONTOLOGY}",
             directory=DIRECTORY_OUTPUT,
             data_manager=data_manager
         )
@@ -500,32 +505,34 @@ def produce_data_profiling_table_stats(
     )
 
 
-def _produce_data_profiling_stats_for_directory(tables: List[NamedTable],
-                                                folder_path: str,
+def _produce_data_profiling_stats_for_directory(table_names: List[str],
+                                                process_directory: str,
                                                 directory: str,
                                                 data_manager: DataManager) -> List[dict]:
-    return [
-        {
+    stats = []
+    for table_name in table_names:
+        if "steps_report" in table_name:
+            continue
+        table_name_for_file_store = table_name.replace(DOMAIN_SUFFIX, "")
+        file_paths = data_manager.get_table_file_paths(process_directory=process_directory,
+                                                       table_name=table_name_for_file_store)
+        file_size = sum(os.path.getsize(file_path) for file_path in file_paths)
+        row_count, column_count = data_manager.get_table_shape(table_name=table_name_for_file_store,
+                                                               process_directory=process_directory)
+        stats.append({
             "directory": directory,
-            "type": _get_table_type_for_table_name(table_name=table.name),
-            "name": f'{table.name.replace("_domain", "")}.csv',
-            "rows": len(table.dataframe),
-            "columns": len(list(table.dataframe)),
-            "size": _get_file_size_in_mb_for_named_table(
-                table_name=table.name,
-                folder_path=folder_path
-            ),
-            "size_float": _get_file_size_for_named_table(
-                table_name=table.name,
-                folder_path=folder_path
-            ),
+            "type": _get_table_type_for_table_name(table_name=table_name),
+            "name": os.path.basename(file_paths[0]) if len(file_paths) == 1 else f"{table_name_for_file_store}/",
+            "rows": row_count,
+            "columns": column_count,
+            "size": _get_file_size_in_mb(file_size=file_size),
+            "size_float": file_size,
             "report": data_manager.get_profiled_table_report_path(
-                table_name=table.name,
+                table_name=table_name,
                 relative_path=True
             )
-        }
-        for table in tables if "steps_report" not in table.name
-    ]
+        })
+    return stats
 
 
 # NODE ANALYSIS #
@@ -540,7 +547,7 @@ def produce_node_analyses(
     :return: The analysis result table.
     """
     node_namespace_distribution_df = _produce_node_namespace_distribution_with_type(
-        nodes=node_table.dataframe, metric_name="namespace"
+        nodes=analysis_utils.get_dataframe_with_namespace_columns(table=node_table), metric_name="namespace"
     )
     node_mapping_coverage_df = _produce_node_covered_by_edge_table(nodes=node_table.dataframe,
                                                                    edges=mappings,
@@ -1053,19 +1060,18 @@ def produce_overview_hierarchy_edge_comparison(
     :return: The analysis result tables.
     """
     # input
-    input_edges = analysis_utils.produce_table_with_namespace_column_for_node_ids(
-        table=data_repo.get(TABLE_EDGES_HIERARCHY).dataframe)
+    input_edges = analysis_utils.get_dataframe_with_namespace_columns(table=data_repo.get(TABLE_EDGES_HIERARCHY))
     input_nodes = data_repo.get(TABLE_NODES).dataframe
-    input_nodes_ids = input_nodes[COLUMN_DEFAULT_ID].tolist()
-    input_nodes_connected = hierarchy_utils.produce_named_table_nodes_connected(hierarchy_edges=input_edges) \
-        .dataframe.query(
-        expr=f"{COLUMN_DEFAULT_ID} == @input_nodes_ids", local_dict={"input_nodes_ids": input_nodes_ids}, inplace=False
+    input_nodes_connected = membership_utils.filter_table_for_node_ids(
+        table=hierarchy_utils.produce_named_table_nodes_connected(hierarchy_edges=input_edges).dataframe,
+        node_id_index=membership_utils.produce_node_id_index(node_ids=input_nodes[COLUMN_DEFAULT_ID]),
+        node_id_columns=[COLUMN_DEFAULT_ID],
     )
-    input_nodes_connected_ids = input_nodes_connected[COLUMN_DEFAULT_ID].tolist()
-    input_nodes_dangling = input_nodes.query(
-        expr=f"{COLUMN_DEFAULT_ID} != @input_nodes_connected_ids",
-        local_dict={"input_nodes_connected_ids": input_nodes_connected_ids},
-        inplace=False
+    input_nodes_dangling = membership_utils.filter_table_for_node_ids(
+        table=input_nodes,
+        node_id_index=membership_utils.produce_node_id_index(node_ids=input_nodes_connected[COLUMN_DEFAULT_ID]),
+        node_id_columns=[COLUMN_DEFAULT_ID],
+        is_member=False,
     )
     input_child_nodes, input_parent_nodes = _get_leaf_and_parent_nodes(hierarchy_edges=input_edges)
 
@@ -1285,16 +1291,8 @@ def produce_merge_cluster_analysis(merges_aggregated: DataFrame, data_manager: D
 
 
 # HELPERS: FILE SIZE ANALYSIS #
-def _get_file_size_in_mb_for_named_table(table_name: str,
-                                         folder_path: str) -> str:
-    f_size = _get_file_size_for_named_table(table_name=table_name, folder_path=folder_path)
-    return f"{f_size / float(1 << 20):,.3f}MB"
-
-
-def _get_file_size_for_named_table(table_name: str,
-                                   folder_path: str) -> float:
-    table_name_for_file_store = table_name.replace(DOMAIN_SUFFIX, "")
-    return os.path.getsize(os.path.abspath(f"{folder_path}/{table_name_for_file_store}.csv"))
+def _get_file_size_in_mb(file_size: int) -> str:
+    return f"{file_size / float(1 << 20):,.3f}MB"
 
 
 # HELPERS: ... #
@@ -1345,9 +1343,10 @@ def produce_runtime_tables(
 
 
 def _produce_runtime_overview_named_table(runtime_table: DataFrame) -> NamedTable:
+    main_steps = analysis_utils.filter_runtime_for_main_steps(runtime=runtime_table)
     runtime_overview = [
-        ("Number of steps", len(runtime_table)),
-        ("Total runtime", timedelta(seconds=int(runtime_table['elapsed'].sum()))),
+        ("Number of steps", len(main_steps)),
+        ("Total runtime", timedelta(seconds=int(main_steps['elapsed'].sum()))),
         ("Start", runtime_table["start"].iloc[0]),
         ("End", runtime_table["end"].iloc[len(runtime_table) - 1]),
     ]
@@ -5,6 +5,8 @@ from typing import List
 
 FILE_NAME_CONFIG_JSON = "config.json"
 FILE_NAME_LOG = "onto-merger.logger"
+FILE_NAME_CHECKPOINT = "checkpoint.pkl"
+FILE_NAME_CHECKPOINT_FINGERPRINT = "checkpoint.json"
 
 # PROCESS DIRECTORIES
 DIRECTORY_INPUT = "input"
@@ -18,6 +20,10 @@ DIRECTORY_PROFILED_DATA = "data_profile_reports"
 DIRECTORY_DATA_TESTS = "data_tests"
 DIRECTORY_LOGS = "logs"
 DIRECTORY_ANALYSIS = "analysis"
+DIRECTORY_DELTA = "delta"
+DIRECTORY_PREVIOUS = "previous"
+DIRECTORY_CHECKPOINTS = "checkpoints"
+DIRECTORY_CACHE = "cache"
 
 # COLUMNS
 COLUMN_DEFAULT_ID = "default_id"
@@ -73,6 +79,7 @@ TABLE_MAPPINGS_OBSOLETE_TO_CURRENT = "mappings_obsolete_to_current"
 TABLE_ALIGNMENT_STEPS_REPORT = "alignment_steps_report"
 TABLE_CONNECTIVITY_STEPS_REPORT = "connectivity_steps_report"
 TABLE_PIPELINE_STEPS_REPORT = "pipeline_steps_report"
+TABLE_NODES_REALIGNED = "nodes_realigned"
 
 # DOMAIN ONTOLOGY TABLES
 DOMAIN_SUFFIX = "_domain"
@@ -219,6 +226,14 @@ SCHEMA_PIPELINE_STEPS_REPORT_TABLE: List[str] = [
     "end",
     "elapsed",
 ]
+# the columns parsed as strings when a table is loaded, the other columns keep their inferred types
+SCHEMA_STRING_COLUMNS: List[str] = [
+    COLUMN_DEFAULT_ID,
+    COLUMN_SOURCE_ID,
+    COLUMN_TARGET_ID,
+    COLUMN_RELATION,
+    COLUMN_PROVENANCE,
+]
 TABLE_NAME_TO_TABLE_SCHEMA_MAP = {
     TABLE_NODES: list(SCHEMA_NODE_ID_LIST_TABLE),
     TABLE_NODES_SEED: list(SCHEMA_NODE_ID_LIST_TABLE),
@@ -248,3 +263,23 @@ TABLE_NAME_TO_TABLE_SCHEMA_MAP = {
 # MAPPING_TYPE_GROUPS
 MAPPING_TYPE_GROUP_EQV = "equivalence"
 MAPPING_TYPE_GROUP_XREF = "database_reference"
+
+# CONNECTIVITY MODES
+CONNECTIVITY_MODE_ROOT_PATH = "root_path"
+CONNECTIVITY_MODE_NEAREST_TERMINUS = "nearest_terminus"
+
+# STORAGE FORMATS (of the output tables)
+STORAGE_FORMAT_CSV = "csv"
+STORAGE_FORMAT_PARQUET = "parquet"
+STORAGE_FORMAT_ARROW = "arrow"
+
+# VALIDATION ENGINES (of the data tests)
+VALIDATION_ENGINE_GREAT_EXPECTATIONS = "great_expectations"
+VALIDATION_ENGINE_NATIVE = "native"
+
+# PIPELINE SUB STEPS (the runtime task name prefixes of the steps nested in a main pipeline step)
+PIPELINE_SUB_STEP_PROFILE_TABLE = "PROFILE TABLE"
+PIPELINE_SUB_STEPS = [PIPELINE_SUB_STEP_PROFILE_TABLE]
+
+# INPUT TABLE SHARDS (the file patterns in an input table directory)
+INPUT_SHARD_FILE_PATTERNS = ["*.csv", "*.csv.gz"]
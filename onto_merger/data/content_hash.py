@@ -0,0 +1,20 @@
+"""Content hash of the tables, used to identify unchanged tables between runs (e.g. for caching)."""
+
+import hashlib
+import json
+
+import pandas as pd
+from pandas import DataFrame
+
+
+def produce_table_content_hash(table: DataFrame) -> str:
+    """Produce the content hash of a table: the column names and types, and the (vectorised) row hashes.
+
+    :param table: The table.
+    :return: The content hash as a hex string.
+    """
+    content_hash = hashlib.sha256(
+        json.dumps([[str(column), str(dtype)] for column, dtype in table.dtypes.items()]).encode()
+    )
+    content_hash.update(pd.util.hash_pandas_object(table, index=False).values.tobytes())
+    return content_hash.hexdigest()
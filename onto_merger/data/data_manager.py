@@ -1,43 +1,63 @@
 """Class and helper methods for data loading and serialisation."""
 
+import glob
+import hashlib
 import json
 import os
+import pickle
 import shutil
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from onto_merger.alignment import merge_utils
+from onto_merger.alignment import mapping_utils, merge_utils
+from onto_merger.alignment.membership_utils import produce_node_id_index
 from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
     DIRECTORY_ANALYSIS,
+    DIRECTORY_CACHE,
+    DIRECTORY_CHECKPOINTS,
     DIRECTORY_DATA_TESTS,
+    DIRECTORY_DELTA,
     DIRECTORY_DOMAIN_ONTOLOGY,
     DIRECTORY_DROPPED_MAPPINGS,
     DIRECTORY_INPUT,
     DIRECTORY_INTERMEDIATE,
     DIRECTORY_LOGS,
     DIRECTORY_OUTPUT,
+    DIRECTORY_PREVIOUS,
     DIRECTORY_PROFILED_DATA,
     DIRECTORY_REPORT,
     DOMAIN_SUFFIX,
+    FILE_NAME_CHECKPOINT,
+    FILE_NAME_CHECKPOINT_FINGERPRINT,
     FILE_NAME_CONFIG_JSON,
     FILE_NAME_LOG,
+    INPUT_SHARD_FILE_PATTERNS,
     SCHEMA_EDGE_SOURCE_TO_TARGET_IDS,
     SCHEMA_HIERARCHY_EDGE_TABLE,
     SCHEMA_MAPPING_TABLE,
     SCHEMA_MERGE_TABLE_WITH_META_DATA,
+    SCHEMA_NODE_ID_LIST_TABLE,
+    SCHEMA_STRING_COLUMNS,
+    STORAGE_FORMAT_CSV,
     TABLE_EDGES_HIERARCHY,
     TABLE_EDGES_HIERARCHY_DOMAIN,
     TABLE_EDGES_HIERARCHY_POST,
+    TABLE_MAPPINGS,
     TABLE_MAPPINGS_DOMAIN,
     TABLE_MAPPINGS_UPDATED,
     TABLE_MERGES_AGGREGATED,
     TABLE_MERGES_WITH_META_DATA,
+    TABLE_NAME_TO_TABLE_SCHEMA_MAP,
     TABLE_NODES,
     TABLE_NODES_MERGED,
+    TABLE_NODES_OBSOLETE,
     TABLES_INPUT,
     TABLES_INTERMEDIATE,
     TABLES_OUTPUT,
@@ -46,13 +66,60 @@ from onto_merger.data.dataclasses import (
     AlignmentConfig,
     AlignmentConfigBase,
     AlignmentConfigMappingTypeGroups,
+    AlignmentDelta,
     DataRepository,
     NamedTable,
+    PipelineCheckpoint,
+)
+from onto_merger.data.storage_backends import (
+    STORAGE_BACKENDS,
+    StorageBackend,
+    read_csv_in_chunks,
+    read_csv_shards,
 )
 from onto_merger.logger.log import get_logger
+from onto_merger.version import __version__
 
 logger = get_logger(__name__)
 
+# the size of the file chunks read for fingerprinting
+FINGERPRINT_CHUNK_SIZE = 1 << 20
+
+
+def drop_duplicate_rows(df: DataFrame) -> DataFrame:
+    """Drop the duplicate rows of a table (keeping the first), comparing the rows by an integer row key.
+
+    The row key combines the hash factorised codes of the columns, so the rows are compared
+    exactly without comparing the (string) values row by row.
+
+    :param df: The table.
+    :return: The table without duplicate rows, with a new index.
+    """
+    row_keys = np.zeros(len(df), dtype=np.int64)
+    row_key_count = 1
+    for column_name in df:
+        # missing values get the code -1, shifted to 0
+        codes, uniques = pd.factorize(df[column_name])
+        code_count = len(uniques) + 1
+        if row_key_count * code_count >= 2 ** 62:
+            row_keys, unique_row_keys = pd.factorize(row_keys)
+            row_key_count = len(unique_row_keys)
+        row_keys = row_keys * code_count + (codes + 1)
+        row_key_count *= code_count
+    is_duplicate = pd.Series(row_keys).duplicated(keep="first").values
+    return df[~is_duplicate].reset_index(drop=True)
+
+
+def get_string_columns(table_name: str) -> List[str]:
+    """Get the columns of a table that are parsed as strings when loaded (IDs, relation and provenance).
+
+    :param table_name: The name of the table.
+    :return: The string column names of the table schema.
+    """
+    return [
+        column for column in TABLE_NAME_TO_TABLE_SCHEMA_MAP.get(table_name, []) if column in SCHEMA_STRING_COLUMNS
+    ]
+
 
 class DataManager:
     """Performs file operations: loading and saving data frames, JSONs, and deleting files.
@@ -64,12 +131,14 @@ class DataManager:
         """Initialise the DataManager class.
 
         :param project_folder_path: The project folder path.
+        :param clear_output_directory: If True the output folder (of a previous run) is deleted.
         """
         self._project_folder_path = project_folder_path
         if clear_output_directory is True:
             self._clear_output_directory()
         self._create_output_directory_structure()
         self.config = self.load_alignment_config()
+        self._storage_backend = STORAGE_BACKENDS[self.config.base_config.storage_format]
 
     # CONFIG #
     def load_alignment_config(self) -> AlignmentConfig:
@@ -130,31 +199,127 @@ class DataManager:
         if os.path.exists(output_path):
             shutil.rmtree(output_path, ignore_errors=True)
 
+    def reset_output_directory(self) -> None:
+        """Delete the outputs of a previous run, except the logs (written by the current run).
+
+        The empty directory structure for the output files is produced again.
+        """
+        output_path = os.path.join(self._project_folder_path, DIRECTORY_OUTPUT)
+        log_folder_path = os.path.dirname(self.get_log_file_path())
+        for root, directory_names, file_names in os.walk(output_path):
+            for directory_name in list(directory_names):
+                directory_path = os.path.join(root, directory_name)
+                if directory_path == log_folder_path:
+                    directory_names.remove(directory_name)
+                elif not log_folder_path.startswith(directory_path + os.sep):
+                    shutil.rmtree(directory_path, ignore_errors=True)
+                    directory_names.remove(directory_name)
+            for file_name in file_names:
+                os.remove(os.path.join(root, file_name))
+        self._create_output_directory_structure()
+        logger.info("Deleted the outputs of the previous run.")
+
     # LOADING #
-    def load_table(self, table_name: str, process_directory: str) -> DataFrame:
+    def load_table(self, table_name: str, process_directory: str, columns: Optional[List[str]] = None) -> DataFrame:
         """Load a table as a data frame.
 
         :param process_directory: The process directory (input or output).
         :param table_name: The name of the table.
+        :param columns: The columns to load, all columns are loaded if None.
         :return: The loaded table.
         """
-        file_path = self.get_table_path(process_directory=process_directory, table_name=table_name)
-        df = pd.read_csv(file_path).drop_duplicates(keep="first", ignore_index=True)
+        string_columns = get_string_columns(table_name=table_name)
+        file_paths = self.get_table_file_paths(process_directory=process_directory, table_name=table_name)
+        if len(file_paths) > 1:
+            df = read_csv_shards(file_paths=file_paths, columns=columns, string_columns=string_columns)
+        else:
+            df = self._get_storage_backend(process_directory=process_directory).read(
+                file_paths[0], columns, string_columns
+            )
+        df = drop_duplicate_rows(df=df)
         logger.info(f"Loaded table '{table_name}' with {len(df):,d} row(s).")
         return df
 
+    def get_table_shape(self, table_name: str, process_directory: str) -> Tuple[int, int]:
+        """Get the row and column count of a stored table, without loading it if the storage format allows.
+
+        :param table_name: The name of the table.
+        :param process_directory: The process directory (input or output).
+        :return: The row and the column count.
+        """
+        file_paths = self.get_table_file_paths(process_directory=process_directory, table_name=table_name)
+        if len(file_paths) > 1:
+            return self.load_table(table_name=table_name, process_directory=process_directory).shape
+        return self._get_storage_backend(process_directory=process_directory).read_shape(file_paths[0])
+
     def load_input_tables(self) -> List[NamedTable]:
-        """Load the input csv-s into named tables.
+        """Load the input csv-s into named tables, the tables are loaded concurrently.
+
+        If the mapping chunk size is configured, the mappings are loaded in chunks after the
+        node tables, and only the mappings that can be used by the alignment are kept.
 
         :return: The input named tables.
         """
-        return [
-            NamedTable(
-                table_name,
-                self.load_table(table_name=table_name, process_directory=DIRECTORY_INPUT),
-            )
-            for table_name in TABLES_INPUT
+        mapping_chunk_size = self.config.base_config.mapping_chunk_size
+        table_names = [
+            table_name for table_name in TABLES_INPUT if not (table_name == TABLE_MAPPINGS and mapping_chunk_size)
         ]
+        with ThreadPoolExecutor(max_workers=len(table_names)) as executor:
+            tables = dict(
+                zip(
+                    table_names,
+                    executor.map(
+                        lambda table_name: self.load_table(table_name=table_name, process_directory=DIRECTORY_INPUT),
+                        table_names,
+                    ),
+                )
+            )
+        if mapping_chunk_size:
+            tables[TABLE_MAPPINGS] = self.load_mappings_for_alignment_in_chunks(
+                chunk_size=mapping_chunk_size,
+                nodes=tables[TABLE_NODES],
+                nodes_obsolete=tables[TABLE_NODES_OBSOLETE],
+            )
+        return [NamedTable(table_name, tables[table_name]) for table_name in TABLES_INPUT]
+
+    def load_mappings_for_alignment_in_chunks(
+            self, chunk_size: int, nodes: DataFrame, nodes_obsolete: DataFrame
+    ) -> DataFrame:
+        """Load the input mappings in chunks, keeping only the mappings that can be used by the alignment.
+
+        Each chunk is filtered (for the configured mapping relations and the input and obsolete
+        nodes) and deduplicated while reading, so only the kept mappings are held in memory.
+
+        :param chunk_size: The number of rows per chunk.
+        :param nodes: The input node table.
+        :param nodes_obsolete: The obsolete node table.
+        :return: The kept (unique) mappings.
+        """
+        file_paths = self.get_table_file_paths(process_directory=DIRECTORY_INPUT, table_name=TABLE_MAPPINGS)
+        permitted_mapping_relations = self.config.mapping_type_groups.all_mapping_types
+        input_node_id_index = produce_node_id_index(node_ids=nodes[COLUMN_DEFAULT_ID])
+        obsolete_node_id_index = produce_node_id_index(node_ids=nodes_obsolete[COLUMN_DEFAULT_ID])
+        row_count = 0
+        chunks = []
+        for chunk in read_csv_in_chunks(
+                file_paths=file_paths,
+                chunk_size=chunk_size,
+                string_columns=get_string_columns(table_name=TABLE_MAPPINGS),
+        ):
+            row_count += len(chunk)
+            chunks.append(
+                drop_duplicate_rows(
+                    df=mapping_utils.filter_mappings_for_alignment_inputs(
+                        mappings=chunk,
+                        permitted_mapping_relations=permitted_mapping_relations,
+                        input_node_id_index=input_node_id_index,
+                        obsolete_node_id_index=obsolete_node_id_index,
+                    )
+                )
+            )
+        df = drop_duplicate_rows(df=pd.concat(chunks, ignore_index=True))
+        logger.info(f"Loaded table '{TABLE_MAPPINGS}' with {len(df):,d} row(s) (of {row_count:,d}) in chunks.")
+        return df
 
     def load_output_tables(self) -> List[NamedTable]:
         """Load the output csv-s into named tables.
@@ -199,6 +364,38 @@ class DataManager:
             for table_name in table_names
         ]
 
+    def load_alignment_delta(self) -> AlignmentDelta:
+        """Load the input changes (delta) and the previous run outputs for the incremental alignment.
+
+        The delta tables (nodes, mappings and hierarchy edges) are optional, the previous run
+        outputs (aggregated merges and post connectivity hierarchy edges) are required.
+
+        :return: The AlignmentDelta dataclass.
+        """
+        delta_directory = f"{DIRECTORY_INPUT}/{DIRECTORY_DELTA}"
+        delta_tables = {}
+        for table_name, schema in [
+            (TABLE_NODES, SCHEMA_NODE_ID_LIST_TABLE),
+            (TABLE_MAPPINGS, SCHEMA_MAPPING_TABLE),
+            (TABLE_EDGES_HIERARCHY, SCHEMA_HIERARCHY_EDGE_TABLE),
+        ]:
+            if os.path.isfile(self.get_table_path(process_directory=delta_directory, table_name=table_name)):
+                delta_tables[table_name] = self.load_table(table_name=table_name, process_directory=delta_directory)
+            else:
+                delta_tables[table_name] = pd.DataFrame([], columns=schema)
+        previous_directory = f"{DIRECTORY_INPUT}/{DIRECTORY_PREVIOUS}"
+        return AlignmentDelta(
+            nodes=delta_tables[TABLE_NODES],
+            mappings=delta_tables[TABLE_MAPPINGS],
+            edges_hierarchy=delta_tables[TABLE_EDGES_HIERARCHY],
+            merges_aggregated_previous=self.load_table(
+                table_name=TABLE_MERGES_AGGREGATED, process_directory=previous_directory
+            ),
+            edges_hierarchy_post_previous=self.load_table(
+                table_name=TABLE_EDGES_HIERARCHY_POST, process_directory=previous_directory
+            ),
+        )
+
     def load_analysis_report_table_as_dict(self,
                                            section_name: str,
                                            table_name: str,
@@ -251,8 +448,11 @@ class DataManager:
         """
         # only output tables are saved
         file_path = self.get_table_path(process_directory=process_directory, table_name=table.name)
-        logger.info(f"Saving table '{f'{table.name}.csv'}' with {len(table.dataframe):,d} " + f"row(s) to {file_path}.")
-        table.dataframe.to_csv(file_path, index=False)
+        logger.info(f"Saving table '{table.name}' with {len(table.dataframe):,d} " + f"row(s) to {file_path}.")
+        storage_backend = self._get_storage_backend(process_directory=process_directory)
+        storage_backend.write(table.dataframe, file_path)
+        if self.config.base_config.csv_export is True and storage_backend != STORAGE_BACKENDS[STORAGE_FORMAT_CSV]:
+            STORAGE_BACKENDS[STORAGE_FORMAT_CSV].write(table.dataframe, f"{os.path.splitext(file_path)[0]}.csv")
 
     def save_tables(self, tables: List[NamedTable], process_directory: str = None) -> None:
         """Save a list of named tables Pandas dataframe part as CSVs.
@@ -268,14 +468,18 @@ class DataManager:
                 self.save_table(table=table, process_directory=process_directory)
 
     def save_domain_ontology_tables(self, tables: List[NamedTable]) -> None:
-        """Save the domain ontology files.
+        """Save the domain ontology files, without derived columns.
 
         :param tables: The domain ontology named tables that we are saving.
         :return:
         """
         self.save_tables(
             tables=[
-                NamedTable(name=table.name.replace(DOMAIN_SUFFIX, ""), dataframe=table.dataframe) for table in tables
+                NamedTable(
+                    name=table.name.replace(DOMAIN_SUFFIX, ""),
+                    dataframe=table.drop_derived_columns().dataframe,
+                )
+                for table in tables
             ],
             process_directory=f"{DIRECTORY_OUTPUT}/{DIRECTORY_DOMAIN_ONTOLOGY}",
         )
@@ -356,6 +560,82 @@ class DataManager:
         self._copy_analysis_images_and_report_assets(template_search_path=template_search_path)
         return file_path
 
+    # CHECKPOINTS #
+    def produce_input_fingerprint(self, incremental: bool = False) -> str:
+        """Produce a fingerprint (content hash) of the run inputs: the configuration and the input tables.
+
+        :param incremental: If True the input delta and the previous run outputs are also fingerprinted.
+        :return: The fingerprint as a hex string.
+        """
+        input_folder_path = self.get_input_folder_path()
+        file_paths = [os.path.join(input_folder_path, FILE_NAME_CONFIG_JSON)] + [
+            file_path
+            for table_name in TABLES_INPUT
+            for file_path in self.get_table_file_paths(process_directory=DIRECTORY_INPUT, table_name=table_name)
+        ]
+        if incremental is True:
+            for directory_path in [
+                os.path.join(input_folder_path, DIRECTORY_DELTA),
+                os.path.join(input_folder_path, DIRECTORY_PREVIOUS),
+            ]:
+                if os.path.isdir(directory_path):
+                    file_paths.extend(
+                        os.path.join(directory_path, file_name) for file_name in sorted(os.listdir(directory_path))
+                    )
+        fingerprint = hashlib.sha256(f"{__version__}:{incremental}".encode())
+        for file_path in file_paths:
+            fingerprint.update(os.path.relpath(file_path, input_folder_path).encode())
+            if os.path.isfile(file_path):
+                with open(file_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(FINGERPRINT_CHUNK_SIZE), b""):
+                        fingerprint.update(chunk)
+        return fingerprint.hexdigest()
+
+    def save_checkpoint(self, checkpoint: PipelineCheckpoint) -> None:
+        """Save the pipeline checkpoint, replacing the previous one.
+
+        The files are replaced atomically, so a crash while saving leaves the previous checkpoint.
+
+        :param checkpoint: The pipeline checkpoint.
+        :return:
+        """
+        Path(self.get_checkpoints_folder_path()).mkdir(parents=True, exist_ok=True)
+        for file_name, content in [
+            (FILE_NAME_CHECKPOINT, pickle.dumps(checkpoint, protocol=pickle.HIGHEST_PROTOCOL)),
+            (
+                FILE_NAME_CHECKPOINT_FINGERPRINT,
+                json.dumps({"stage": checkpoint.stage, "fingerprint": checkpoint.fingerprint}).encode(),
+            ),
+        ]:
+            file_path = os.path.join(self.get_checkpoints_folder_path(), file_name)
+            with open(f"{file_path}.tmp", "wb") as f:
+                f.write(content)
+            os.replace(f"{file_path}.tmp", file_path)
+        logger.info(f"Saved checkpoint of stage '{checkpoint.stage}' with {len(checkpoint.tables)} table(s).")
+
+    def load_checkpoint(self, fingerprints: List[str]) -> Optional[PipelineCheckpoint]:
+        """Load the saved pipeline checkpoint if its fingerprint is one of the given fingerprints.
+
+        :param fingerprints: The fingerprints of the stages of the current run.
+        :return: The pipeline checkpoint if it exists and matches, otherwise None.
+        """
+        fingerprint_file_path = os.path.join(self.get_checkpoints_folder_path(), FILE_NAME_CHECKPOINT_FINGERPRINT)
+        if not os.path.isfile(fingerprint_file_path):
+            logger.info("No checkpoint found.")
+            return None
+        with open(fingerprint_file_path) as json_file:
+            checkpoint_fingerprint = json.load(json_file)
+        if checkpoint_fingerprint["fingerprint"] not in fingerprints:
+            logger.info(f"The checkpoint of stage '{checkpoint_fingerprint['stage']}' is outdated.")
+            return None
+        with open(os.path.join(self.get_checkpoints_folder_path(), FILE_NAME_CHECKPOINT), "rb") as f:
+            checkpoint: PipelineCheckpoint = pickle.load(f)
+        if checkpoint.fingerprint != checkpoint_fingerprint["fingerprint"]:
+            logger.info("The checkpoint is incomplete.")
+            return None
+        logger.info(f"Loaded checkpoint of stage '{checkpoint.stage}' with {len(checkpoint.tables)} table(s).")
+        return checkpoint
+
     # COPY & MOVE #
     def _copy_analysis_images_and_report_assets(self, template_search_path: str) -> None:
         """Copy the images and analysis figures that are displayed in the HTML report.
@@ -382,10 +662,11 @@ class DataManager:
         ]
 
     def move_data_docs_to_reports(self) -> None:
-        """Move the data doc files to the report folder."""
+        """Move the data doc files to the report folder (if the data docs were produced)."""
         from_path = os.path.join(self.get_data_tests_path(), "uncommitted/data_docs")
         to_path = os.path.join(self._project_folder_path, DIRECTORY_OUTPUT, DIRECTORY_REPORT, "data_docs")
-        shutil.copytree(from_path, to_path)
+        if os.path.isdir(from_path):
+            shutil.copytree(from_path, to_path, dirs_exist_ok=True)
 
     # PATHS #
     def get_project_folder_path(self) -> str:
@@ -482,7 +763,51 @@ class DataManager:
         :param table_name: The name of the table.
         :return: The project folder path of the given table.
         """
-        return os.path.join(self._project_folder_path, process_directory, f"{table_name}.csv")
+        file_extension = self._get_storage_backend(process_directory=process_directory).file_extension
+        return os.path.join(self._project_folder_path, process_directory, f"{table_name}.{file_extension}")
+
+    def get_table_file_paths(self, process_directory: str, table_name: str) -> List[str]:
+        """Produce the file paths of a given table.
+
+        An input table is either a single file, or a directory (named as the table) of CSV shards
+        (e.g. one file per provider, optionally gzip compressed) that are concatenated when loaded.
+
+        :param process_directory: The process directory (input or output).
+        :param table_name: The name of the table.
+        :return: The file paths of the table (the single table path if the table is not sharded).
+        """
+        file_path = self.get_table_path(process_directory=process_directory, table_name=table_name)
+        shard_directory_path = os.path.join(self._project_folder_path, process_directory, table_name)
+        if process_directory != DIRECTORY_INPUT or os.path.exists(file_path) or not os.path.isdir(
+                shard_directory_path
+        ):
+            return [file_path]
+        shard_file_paths = sorted(
+            {
+                shard_file_path
+                for file_pattern in INPUT_SHARD_FILE_PATTERNS
+                for shard_file_path in glob.glob(os.path.join(shard_directory_path, file_pattern))
+            }
+        )
+        if not shard_file_paths:
+            raise FileNotFoundError(f"No table shards found in '{shard_directory_path}'.")
+        return shard_file_paths
+
+    def _get_storage_backend(self, process_directory: str) -> StorageBackend:
+        """Get the storage backend of a process directory.
+
+        The intermediate and domain ontology tables are stored in the configured format, the
+        input and the analysis tables are always CSV.
+
+        :param process_directory: The process directory (input or output).
+        :return: The storage backend.
+        """
+        if process_directory in [
+            f"{DIRECTORY_OUTPUT}/{DIRECTORY_INTERMEDIATE}",
+            f"{DIRECTORY_OUTPUT}/{DIRECTORY_DOMAIN_ONTOLOGY}",
+        ]:
+            return self._storage_backend
+        return STORAGE_BACKENDS[STORAGE_FORMAT_CSV]
 
     def _get_profiled_report_directory_path(self) -> str:
         """Produce the path for the Pandas profile reports directory."""
@@ -514,6 +839,18 @@ class DataManager:
             return os.path.join(DIRECTORY_PROFILED_DATA, table_html)
         return os.path.join(self._get_profiled_report_directory_path(), table_html)
 
+    def get_checkpoints_folder_path(self) -> str:
+        """Produce the path for the pipeline checkpoints directory."""
+        return os.path.join(self._project_folder_path, DIRECTORY_OUTPUT, DIRECTORY_CHECKPOINTS)
+
+    def get_validation_cache_folder_path(self) -> str:
+        """Produce the path for the validation results cache directory (kept between runs)."""
+        return os.path.join(self._project_folder_path, DIRECTORY_CACHE, DIRECTORY_DATA_TESTS)
+
+    def get_profiling_cache_folder_path(self) -> str:
+        """Produce the path for the data profile reports cache directory (kept between runs)."""
+        return os.path.join(self._project_folder_path, DIRECTORY_CACHE, DIRECTORY_PROFILED_DATA)
+
     def get_log_file_path(self) -> str:
         """Produce the path for log file."""
         return os.path.join(
@@ -1,26 +1,31 @@
 """Data classes and helper methods."""
 
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import pandas as pd
 from dataclasses_json import dataclass_json
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
 from onto_merger.data.constants import (
+    CONNECTIVITY_MODE_ROOT_PATH,
+    NODE_ID_COLUMNS,
     SCHEMA_ALIGNMENT_STEPS_TABLE,
     SCHEMA_CONNECTIVITY_STEPS_REPORT_TABLE,
     SCHEMA_DATA_REPO_SUMMARY,
     SCHEMA_PIPELINE_STEPS_REPORT_TABLE,
+    STORAGE_FORMAT_CSV,
     TABLE_ALIGNMENT_STEPS_REPORT,
     TABLE_CONNECTIVITY_STEPS_REPORT,
     TABLE_PIPELINE_STEPS_REPORT,
     TABLES_DOMAIN,
     TABLES_INPUT,
     TABLES_INTERMEDIATE,
+    VALIDATION_ENGINE_GREAT_EXPECTATIONS,
 )
+from onto_merger.data.derived_columns import DERIVED_COLUMNS
 
 
 @dataclass_json
@@ -56,6 +61,18 @@ class AlignmentConfigBase:
     domain_node_type: str
     seed_ontology_name: str
     force_through_failed_validation: bool = False
+    connectivity_mode: str = CONNECTIVITY_MODE_ROOT_PATH
+    worker_count: Optional[int] = None
+    sharded_alignment: bool = False
+    storage_format: str = STORAGE_FORMAT_CSV
+    csv_export: bool = False
+    mapping_chunk_size: Optional[int] = None
+    parallel_validation: bool = False
+    validation_engine: str = VALIDATION_ENGINE_GREAT_EXPECTATIONS
+    data_docs: bool = True
+    validation_cache: bool = False
+    parallel_profiling: bool = False
+    profiling_cache: bool = False
 
 
 @dataclass
@@ -70,10 +87,72 @@ class AlignmentConfig:
 
 @dataclass
 class NamedTable:
-    """Wrap a Pandas dataframe with its name (identifier) for convenient access and serialisation."""
+    """Wrap a Pandas dataframe with its name (identifier) for convenient access and serialisation.
+
+    Derived columns (see DERIVED_COLUMNS, e.g. node ID namespaces) that are not in the
+    dataframe are produced on first access and memoised, without changing the dataframe.
+    The memoised columns are reset when the dataframe is replaced, so the dataframe must
+    not be changed in place (assign a new dataframe instead).
+    """
 
     name: str
     dataframe: DataFrame
+    _derived_columns: Dict[str, Series] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        """Set an attribute, the memoised derived columns are reset if the dataframe is replaced."""
+        if name == "dataframe":
+            object.__setattr__(self, "_derived_columns", {})
+        object.__setattr__(self, name, value)
+
+    def get_column(self, column_name: str) -> Series:
+        """Return a column of the table, a derived column is produced if the dataframe does not have it.
+
+        :param column_name: The name of the column.
+        :return: The column.
+        """
+        if column_name in self.dataframe:
+            return self.dataframe[column_name]
+        if column_name not in self._derived_columns:
+            if column_name not in self.get_derivable_column_names():
+                raise KeyError(f"Table '{self.name}' does not have, and cannot derive column '{column_name}'.")
+            self._derived_columns[column_name] = DERIVED_COLUMNS[column_name].produce(self.get_column)
+        return self._derived_columns[column_name]
+
+    def get_derivable_column_names(self) -> List[str]:
+        """Return the names of the derived columns that can be produced for the table.
+
+        :return: The derived column names.
+        """
+        return [
+            column_name
+            for column_name, derived_column in DERIVED_COLUMNS.items()
+            if all(required_column in self.dataframe for required_column in derived_column.required_columns)
+        ]
+
+    def get_dataframe_with_columns(self, column_names: List[str]) -> DataFrame:
+        """Return the dataframe appended with the specified (derived) columns.
+
+        :param column_names: The names of the columns that must be in the dataframe.
+        :return: The dataframe (a shallow copy if columns are appended).
+        """
+        columns_to_append = [column_name for column_name in column_names if column_name not in self.dataframe]
+        if not columns_to_append:
+            return self.dataframe
+        dataframe = self.dataframe.copy(deep=False)
+        for column_name in columns_to_append:
+            dataframe[column_name] = self.get_column(column_name=column_name)
+        return dataframe
+
+    def drop_derived_columns(self) -> "NamedTable":
+        """Produce the named table without derived columns.
+
+        :return: The named table with only the non derived columns.
+        """
+        return NamedTable(
+            name=self.name,
+            dataframe=self.dataframe[[column for column in self.dataframe if column not in DERIVED_COLUMNS]],
+        )
 
 
 class DataRepository:
@@ -153,6 +232,41 @@ class DataRepository:
         return summary_df
 
 
+@dataclass
+class AlignmentDelta:
+    """Input changes since the previous run and the previous run outputs, used for incremental alignment.
+
+    The delta tables contain the added and the removed rows of the input tables (nodes,
+    mappings and hierarchy edges).
+    """
+
+    nodes: DataFrame
+    mappings: DataFrame
+    edges_hierarchy: DataFrame
+    merges_aggregated_previous: DataFrame
+    edges_hierarchy_post_previous: DataFrame
+
+    def get_changed_node_ids(self) -> Series:
+        """Return the node IDs of the delta tables, i.e. the nodes affected by the input changes.
+
+        :return: The unique changed node IDs.
+        """
+        return pd.Series(
+            pd.unique(
+                pd.concat(
+                    [
+                        table[column]
+                        for table in [self.nodes, self.mappings, self.edges_hierarchy]
+                        for column in NODE_ID_COLUMNS
+                        if column in table
+                    ] + [pd.Series([], dtype=object)],
+                    ignore_index=True,
+                ).astype(str)
+            ),
+            dtype=object,
+        )
+
+
 @dataclass_json
 @dataclass
 class RuntimeData:
@@ -183,6 +297,21 @@ class RuntimeData:
         self.elapsed = elapsed
 
 
+@dataclass
+class PipelineCheckpoint:
+    """The pipeline state after a completed stage, used to resume the pipeline from the next stage.
+
+    The fingerprint identifies the inputs, configuration and stages that produced the state.
+    """
+
+    stage: str
+    fingerprint: str
+    tables: List[NamedTable]
+    alignment_priority_order: List[str]
+    runtime_data: List[RuntimeData]
+    alignment_delta: Optional[AlignmentDelta] = None
+
+
 @dataclass
 class AlignmentStep:
     """Represent an alignment step metadata as a dataclass."""
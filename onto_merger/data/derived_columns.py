@@ -0,0 +1,117 @@
+"""Columns that can be derived from the node ID columns of a table, and methods to produce them."""
+
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+from pandas import Series
+
+from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
+    COLUMN_MAPPING_HASH,
+    COLUMN_PROVENANCE,
+    COLUMN_RELATION,
+    COLUMN_SOURCE_ID,
+    COLUMN_SOURCE_TO_TARGET,
+    COLUMN_TARGET_ID,
+)
+
+
+def get_namespace_column_name_for_column(node_id_column: str) -> str:
+    """Produce a column name for a given node ID column name.
+
+    :param node_id_column: The name of the node ID column.
+    :return: The namespace column name.
+    """
+    return f"namespace_{node_id_column}"
+
+
+def get_namespaces_for_node_ids(node_ids: Series) -> Series:
+    """Get the namespace part of each node ID in a column.
+
+    The namespace is derived once per unique node ID.
+
+    :param node_ids: The node ID column.
+    :return: The node ID namespace column.
+    """
+    node_id_codes, unique_node_ids = pd.factorize(node_ids)
+    # missing node IDs (code -1) get the namespace of their string form, i.e. the last element
+    unique_namespaces = np.append(
+        pd.Series(unique_node_ids, dtype=object).astype(str).str.split(":", n=1).str[0].values, "nan"
+    )
+    return pd.Series(unique_namespaces[node_id_codes], index=node_ids.index, dtype=object)
+
+
+def produce_namespace_pair_column(source_namespaces: Series, target_namespaces: Series) -> Series:
+    """Produce the source and target node ID namespace pair column (e.g. 'MONDO to SNOMED').
+
+    :param source_namespaces: The source node ID namespace column.
+    :param target_namespaces: The target node ID namespace column.
+    :return: The namespace pair column.
+    """
+    return source_namespaces.astype(str) + " to " + target_namespaces.astype(str)
+
+
+def produce_comparison_hash_column(
+        source_ids: Series, target_ids: Series, relations: Series, provenances: Series
+) -> Series:
+    """Produce a column from the ordered source and target IDs, the relation and the provenance.
+
+    The column values are the same for mappings with different orientation.
+
+    :param source_ids: The source node ID column.
+    :param target_ids: The target node ID column.
+    :param relations: The mapping relation column.
+    :param provenances: The mapping provenance column.
+    :return: The comparison column.
+    """
+    source_ids, target_ids = source_ids.astype(str), target_ids.astype(str)
+    is_ordered = (source_ids <= target_ids).values
+    first_ids = pd.Series(np.where(is_ordered, source_ids, target_ids), index=source_ids.index)
+    second_ids = pd.Series(np.where(is_ordered, target_ids, source_ids), index=source_ids.index)
+    return "['" + first_ids + "', '" + second_ids + "']|" + relations.astype(str) + "|" + provenances.astype(str)
+
+
+@dataclass(frozen=True)
+class DerivedColumn:
+    """Specification of a derived column: the columns it requires and the method producing it.
+
+    The producer gets a column accessor, so it can reuse other (memoised) derived columns.
+    """
+
+    required_columns: List[str]
+    produce: Callable[[Callable[[str], Series]], Series]
+
+
+# in the order they are appended to tables
+DERIVED_COLUMNS: Dict[str, DerivedColumn] = {
+    get_namespace_column_name_for_column(COLUMN_DEFAULT_ID): DerivedColumn(
+        required_columns=[COLUMN_DEFAULT_ID],
+        produce=lambda get_column: get_namespaces_for_node_ids(node_ids=get_column(COLUMN_DEFAULT_ID)),
+    ),
+    get_namespace_column_name_for_column(COLUMN_SOURCE_ID): DerivedColumn(
+        required_columns=[COLUMN_SOURCE_ID],
+        produce=lambda get_column: get_namespaces_for_node_ids(node_ids=get_column(COLUMN_SOURCE_ID)),
+    ),
+    get_namespace_column_name_for_column(COLUMN_TARGET_ID): DerivedColumn(
+        required_columns=[COLUMN_TARGET_ID],
+        produce=lambda get_column: get_namespaces_for_node_ids(node_ids=get_column(COLUMN_TARGET_ID)),
+    ),
+    COLUMN_SOURCE_TO_TARGET: DerivedColumn(
+        required_columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID],
+        produce=lambda get_column: produce_namespace_pair_column(
+            source_namespaces=get_column(get_namespace_column_name_for_column(COLUMN_SOURCE_ID)),
+            target_namespaces=get_column(get_namespace_column_name_for_column(COLUMN_TARGET_ID)),
+        ),
+    ),
+    COLUMN_MAPPING_HASH: DerivedColumn(
+        required_columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID, COLUMN_RELATION, COLUMN_PROVENANCE],
+        produce=lambda get_column: produce_comparison_hash_column(
+            source_ids=get_column(COLUMN_SOURCE_ID),
+            target_ids=get_column(COLUMN_TARGET_ID),
+            relations=get_column(COLUMN_RELATION),
+            provenances=get_column(COLUMN_PROVENANCE),
+        ),
+    ),
+}
@@ -0,0 +1,91 @@
+"""Integer node ID dictionary for the code based node ID lookups of the alignment steps."""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Index, Series
+
+from onto_merger.data.constants import NODE_ID_COLUMNS
+
+
+class NodeIdDictionary:
+    """Data class for encoding node IDs as int32 codes and decoding them back.
+
+    Node codes follow the sorted node ID order (i.e. comparing codes is the same as comparing
+    node IDs), and each node code carries the code of its namespace.
+    """
+
+    def __init__(self, node_ids: Series):
+        """Initialise the NodeIdDictionary class.
+
+        :param node_ids: The node IDs to be encoded (may contain duplicates).
+        """
+        self._node_ids = pd.Index(np.sort(pd.unique(node_ids.astype(str))))
+        namespace_codes, self._namespaces = pd.factorize(self._node_ids.str.split(":", n=1).str[0])
+        self._namespace_codes = namespace_codes.astype(np.int32)
+
+    @classmethod
+    def from_tables(cls, tables: List[DataFrame]) -> "NodeIdDictionary":
+        """Produce a node ID dictionary for all node ID columns of the given tables.
+
+        :param tables: The tables (node, hierarchy edge, mapping or merge tables).
+        :return: The node ID dictionary.
+        """
+        return cls(
+            node_ids=pd.concat(
+                [table[column] for table in tables for column in NODE_ID_COLUMNS if column in table],
+                ignore_index=True,
+            )
+        )
+
+    def __len__(self) -> int:
+        """Return the number of encoded node IDs.
+
+        :return: The number of node IDs.
+        """
+        return len(self._node_ids)
+
+    @property
+    def namespaces(self) -> Index:
+        """Return the namespaces, indexed by namespace code.
+
+        :return: The namespace index.
+        """
+        return self._namespaces
+
+    def encode(self, node_ids: Series) -> np.ndarray:
+        """Encode node IDs.
+
+        :param node_ids: The node IDs to be encoded.
+        :return: The node codes, -1 for node IDs that are not in the dictionary.
+        """
+        return self._node_ids.get_indexer(node_ids).astype(np.int32)
+
+    def decode(self, node_codes: np.ndarray) -> np.ndarray:
+        """Decode node codes.
+
+        :param node_codes: The (valid) node codes to be decoded.
+        :return: The node IDs.
+        """
+        return np.asarray(self._node_ids, dtype=object)[node_codes]
+
+    def get_namespace_codes(self, node_codes: np.ndarray) -> np.ndarray:
+        """Get the namespace code of node codes.
+
+        :param node_codes: The node codes.
+        :return: The namespace codes, -1 for invalid (-1) node codes.
+        """
+        node_codes = np.asarray(node_codes)
+        namespace_codes = np.full(len(node_codes), -1, dtype=np.int32)
+        is_valid = node_codes >= 0
+        namespace_codes[is_valid] = self._namespace_codes[node_codes[is_valid]]
+        return namespace_codes
+
+    def get_namespace_code(self, namespace: str) -> int:
+        """Get the code of a namespace.
+
+        :param namespace: The namespace.
+        :return: The namespace code, -1 if no node ID is from the namespace.
+        """
+        return int(self._namespaces.get_indexer([namespace])[0])
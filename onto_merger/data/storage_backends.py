@@ -0,0 +1,213 @@
+"""Storage backends (file formats) for reading and writing the output tables."""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+from pandas import DataFrame
+
+from onto_merger.data.constants import (
+    NODE_ID_COLUMNS,
+    STORAGE_FORMAT_ARROW,
+    STORAGE_FORMAT_CSV,
+    STORAGE_FORMAT_PARQUET,
+)
+
+
+@dataclass
+class StorageBackend:
+    """A table file format with its read and write methods.
+
+    The read method loads only the given columns (all columns if None), and parses the given
+    string columns without type inference; the shape method returns the row and column count
+    of a stored table.
+    """
+
+    file_extension: str
+    read: Callable[[str, Optional[List[str]], Sequence[str]], DataFrame]
+    write: Callable[[DataFrame, str], None]
+    read_shape: Callable[[str], Tuple[int, int]]
+
+
+def _read_csv(file_path: str, columns: Optional[List[str]] = None, string_columns: Sequence[str] = ()) -> DataFrame:
+    """Read a CSV file, with the multithreaded Arrow CSV parser if pyarrow is installed.
+
+    :param file_path: The CSV file path.
+    :param columns: The columns to read, all columns are read if None.
+    :param string_columns: The columns that are parsed as strings (if present in the file).
+    :return: The dataframe.
+    """
+    return read_csv_shards(file_paths=[file_path], columns=columns, string_columns=string_columns)
+
+
+def read_csv_shards(
+    file_paths: List[str], columns: Optional[List[str]] = None, string_columns: Sequence[str] = ()
+) -> DataFrame:
+    """Read CSV files (shards of a table, optionally gzip compressed) in parallel into one dataframe.
+
+    With pyarrow the shards are concatenated as Arrow tables (without copying the data), and
+    converted to a dataframe once.
+
+    :param file_paths: The CSV file paths.
+    :param columns: The columns to read, all columns are read if None.
+    :param string_columns: The columns that are parsed as strings (if present in the files).
+    :return: The dataframe.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+            return pd.concat(
+                executor.map(
+                    lambda file_path: _read_csv_with_pandas(
+                        file_path=file_path, columns=columns, string_columns=string_columns
+                    ),
+                    file_paths,
+                ),
+                ignore_index=True,
+            )
+    convert_options = pa_csv.ConvertOptions(
+        column_types={column: pa.string() for column in string_columns},
+        include_columns=columns,
+        strings_can_be_null=True,
+    )
+    with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+        arrow_tables = list(
+            executor.map(lambda file_path: pa_csv.read_csv(file_path, convert_options=convert_options), file_paths)
+        )
+    return pa.concat_tables(arrow_tables, promote_options="permissive").to_pandas()
+
+
+def _read_csv_with_pandas(
+    file_path: str, columns: Optional[List[str]] = None, string_columns: Sequence[str] = ()
+) -> DataFrame:
+    header = pd.read_csv(file_path, nrows=0).columns
+    return pd.read_csv(
+        file_path,
+        usecols=columns,
+        dtype={column: str for column in string_columns if column in header},
+    )
+
+
+def read_csv_in_chunks(
+    file_paths: List[str], chunk_size: int, string_columns: Sequence[str] = ()
+) -> Iterator[DataFrame]:
+    """Read CSV files (shards of a table) in chunks, so only one chunk is held in memory at a time.
+
+    :param file_paths: The CSV file paths, read one after the other.
+    :param chunk_size: The number of rows per chunk.
+    :param string_columns: The columns that are parsed as strings (if present in the files).
+    :return: The chunk dataframes.
+    """
+    for file_path in file_paths:
+        header = pd.read_csv(file_path, nrows=0).columns
+        yield from pd.read_csv(
+            file_path,
+            chunksize=chunk_size,
+            dtype={column: str for column in string_columns if column in header},
+        )
+
+
+def _write_csv(table: DataFrame, file_path: str) -> None:
+    table.to_csv(file_path, index=False)
+
+
+def _read_csv_shape(file_path: str) -> Tuple[int, int]:
+    return _read_csv(file_path).drop_duplicates(keep="first", ignore_index=True).shape
+
+
+def _convert_to_arrow_table(table: DataFrame):
+    """Convert a dataframe to an Arrow table, with dictionary encoded node ID columns.
+
+    :param table: The dataframe.
+    :return: The Arrow table.
+    """
+    import pyarrow as pa
+
+    arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+    for column_index, column_name in enumerate(arrow_table.column_names):
+        column_type = arrow_table.schema.field(column_index).type
+        is_string_column = pa.types.is_string(column_type) or pa.types.is_large_string(column_type)
+        if column_name in NODE_ID_COLUMNS and is_string_column:
+            arrow_table = arrow_table.set_column(
+                column_index, column_name, arrow_table.column(column_index).dictionary_encode()
+            )
+    return arrow_table
+
+
+def _convert_from_arrow_table(arrow_table) -> DataFrame:
+    """Convert an Arrow table to a dataframe, dictionary encoded columns are decoded (not categorical).
+
+    :param arrow_table: The Arrow table.
+    :return: The dataframe.
+    """
+    import pyarrow as pa
+
+    for column_index, field in enumerate(arrow_table.schema):
+        if pa.types.is_dictionary(field.type):
+            arrow_table = arrow_table.set_column(
+                column_index, field.name, arrow_table.column(column_index).cast(field.type.value_type)
+            )
+    return arrow_table.to_pandas()
+
+
+def _read_parquet(file_path: str, columns: Optional[List[str]] = None, string_columns: Sequence[str] = ()) -> DataFrame:
+    import pyarrow.parquet as pq
+
+    return _convert_from_arrow_table(pq.read_table(file_path, columns=columns))
+
+
+def _write_parquet(table: DataFrame, file_path: str) -> None:
+    import pyarrow.parquet as pq
+
+    pq.write_table(_convert_to_arrow_table(table), file_path)
+
+
+def _read_parquet_shape(file_path: str) -> Tuple[int, int]:
+    import pyarrow.parquet as pq
+
+    metadata = pq.read_metadata(file_path)
+    return metadata.num_rows, metadata.num_columns
+
+
+def _read_arrow(file_path: str, columns: Optional[List[str]] = None, string_columns: Sequence[str] = ()) -> DataFrame:
+    import pyarrow as pa
+
+    # the file is memory mapped, so only the selected columns are read
+    with pa.memory_map(file_path) as source:
+        arrow_table = pa.ipc.open_file(source).read_all()
+        return _convert_from_arrow_table(arrow_table if columns is None else arrow_table.select(columns))
+
+
+def _write_arrow(table: DataFrame, file_path: str) -> None:
+    import pyarrow as pa
+
+    arrow_table = _convert_to_arrow_table(table)
+    with pa.OSFile(file_path, "wb") as sink, pa.ipc.new_file(sink, arrow_table.schema) as writer:
+        writer.write_table(arrow_table)
+
+
+def _read_arrow_shape(file_path: str) -> Tuple[int, int]:
+    import pyarrow as pa
+
+    with pa.memory_map(file_path) as source:
+        reader = pa.ipc.open_file(source)
+        return (
+            sum(reader.get_batch(batch_index).num_rows for batch_index in range(reader.num_record_batches)),
+            len(reader.schema),
+        )
+
+
+STORAGE_BACKENDS: Dict[str, StorageBackend] = {
+    STORAGE_FORMAT_CSV: StorageBackend(
+        file_extension="csv", read=_read_csv, write=_write_csv, read_shape=_read_csv_shape
+    ),
+    STORAGE_FORMAT_PARQUET: StorageBackend(
+        file_extension="parquet", read=_read_parquet, write=_write_parquet, read_shape=_read_parquet_shape
+    ),
+    STORAGE_FORMAT_ARROW: StorageBackend(
+        file_extension="arrow", read=_read_arrow, write=_write_arrow, read_shape=_read_arrow_shape
+    ),
+}
@@ -130,7 +130,7 @@ def get_column_set_for_edge_table(table_name: str) -> List[str]:
     """
     if table_name not in TABLE_NAME_TO_TABLE_SCHEMA_MAP:
         return []
-    column_set = TABLE_NAME_TO_TABLE_SCHEMA_MAP[table_name]
+    column_set = list(TABLE_NAME_TO_TABLE_SCHEMA_MAP[table_name])
     if not is_domain_table(table_name=table_name):
         column_set.extend(
             [
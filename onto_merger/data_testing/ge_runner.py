@@ -2,25 +2,31 @@
 import logging
 import os
 import sys
-from typing import List, Union
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Set, Union
 
 from great_expectations.core import ExpectationSuite
 from pandas import DataFrame
-from ruamel import yaml
 
 from onto_merger.analyser.report_analyser_utils import (
     produce_ge_validation_analysis_as_table,
 )
+from onto_merger.data.constants import VALIDATION_ENGINE_NATIVE
 from onto_merger.data.data_manager import DataManager
 from onto_merger.data.dataclasses import AlignmentConfig, NamedTable
+from onto_merger.data_testing import native_validator, validation_cache
 from onto_merger.data_testing.ge_expectation_helper import (
     produce_expectations_for_table,
 )
 from onto_merger.data_testing.ge_utils import (
     produce_check_point_config,
+    produce_data_asset_name_for_entity,
     produce_datasource_config_for_entity,
+    produce_datasource_name_for_entity,
     produce_expectation_suite_name_for_entity,
     produce_ge_context,
+    produce_runtime_validation_config_for_entity,
     produce_validation_config_for_entity,
 )
 
@@ -43,6 +49,9 @@ class GERunner:
     def __init__(self, alignment_config: AlignmentConfig, ge_base_directory: str, data_manager: DataManager) -> None:
         """Initialise the class.
 
+        The GE context is created once, so the runner can be reused to test several datasets
+        (e.g. the input, intermediate and domain ontology tables of a pipeline run).
+
         :param alignment_config: The alignment process configuration dataclass.
         :param ge_base_directory: The base directory of the validation framework.
         :param data_manager: The data manager instance.
@@ -52,12 +61,17 @@ class GERunner:
         self._ge_base_directory = ge_base_directory
         self._ge_context = produce_ge_context(ge_base_directory=self._ge_base_directory)
         self._data_manager = data_manager
+        self._datasource_names: Set[str] = set()
 
-    def run_ge_tests(self, named_tables: List[NamedTable], data_origin: str) -> Union[DataFrame, None]:
+    def run_ge_tests(
+            self, named_tables: List[NamedTable], data_origin: str, build_data_docs: bool = True
+    ) -> Union[DataFrame, None]:
         """Run data tests for a list of named tables.
 
         :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
         :param named_tables: The list of named tables.
+        :param build_data_docs: If False the data docs are not built (e.g. so they can be built once
+        after testing several datasets).
         :return:
         """
         # disable print to console (by GE framework)
@@ -74,12 +88,36 @@ class GERunner:
         # configure expectations suites with expectations (data tests)
         self._configure_ge_expectation_suites_for_entity(loaded_tables=named_tables)
 
+        # restore the cached results of the unchanged tables
+        fingerprints = {}
+        if self._alignment_config.base_config.validation_cache is True:
+            fingerprints = self._produce_validation_fingerprints(loaded_tables=named_tables, data_origin=data_origin)
+            named_tables = [
+                named_table
+                for named_table in named_tables
+                if not validation_cache.restore_validation_results(
+                    cache_directory=self._data_manager.get_validation_cache_folder_path(),
+                    fingerprint=fingerprints[named_table.name],
+                    validations_directory=self._get_validations_directory_path(),
+                )
+            ]
+        validation_result_file_paths = self._get_validation_result_file_paths()
+
         # create a checkpoint with validations (each validation links exp suite to a
         # datasource) run tests (via checkpoint)
         self._run_validations(loaded_tables=named_tables, data_origin=data_origin)
 
+        # cache the results of the validated tables
+        if fingerprints:
+            self._store_validation_results(
+                loaded_tables=named_tables,
+                fingerprints=fingerprints,
+                previous_validation_result_file_paths=validation_result_file_paths,
+            )
+
         # produce the data docs
-        self._ge_context.build_data_docs()
+        if build_data_docs is True:
+            self._build_data_docs()
 
         # aggregate results
         results_df = produce_ge_validation_analysis_as_table(data_manager=self._data_manager)
@@ -89,9 +127,25 @@ class GERunner:
         enable_print()
         return results_df
 
+    def build_data_docs(self) -> None:
+        """Build the data docs (of all validation results in the store), if the data docs are configured.
+
+        :return:
+        """
+        block_print()
+        self._build_data_docs()
+        enable_print()
+
+    def _build_data_docs(self) -> None:
+        if self._alignment_config.base_config.data_docs is True:
+            self._ge_context.build_data_docs()
+
     def _configure_ge_context_data_sources(self, loaded_tables: List[NamedTable], data_origin: str) -> None:
         """Update the data test context with the tables that are being tested.
 
+        Each data source is added once (the batches are passed at runtime, so the data source of a
+        table can be used for any data origin).
+
         :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
         :param loaded_tables: The list of named tables.
         :return:
@@ -100,11 +154,12 @@ class GERunner:
             datasource_config = produce_datasource_config_for_entity(
                 entity_name=loaded_table.name, ge_base_directory=self._ge_base_directory, data_origin=data_origin
             )
+            if datasource_config["name"] in self._datasource_names:
+                continue
+
             # add the data source
             self._ge_context.add_datasource(**datasource_config)
-
-            # save the context
-            self._ge_context.test_yaml_config(yaml.dump(datasource_config))
+            self._datasource_names.add(datasource_config["name"])
 
     def _configure_ge_expectation_suites_for_entity(self, loaded_tables: List[NamedTable]) -> None:
         """Configure the data test expectation suites with tables that are being tested.
@@ -139,33 +194,201 @@ class GERunner:
         )
         return suite
 
+    def _produce_validation_fingerprints(self, loaded_tables: List[NamedTable], data_origin: str) -> Dict[str, str]:
+        """Produce the validation fingerprint (the content hash of the table and its expectations) of each table.
+
+        :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
+        :param loaded_tables: The list of tables being tested.
+        :return: The fingerprints by table name.
+        """
+        return {
+            loaded_table.name: validation_cache.produce_table_fingerprint(
+                table_name=loaded_table.name,
+                table=loaded_table.dataframe,
+                expectation_configurations=produce_expectations_for_table(
+                    table_name=loaded_table.name, alignment_config=self._alignment_config
+                ),
+                data_origin=data_origin,
+                validation_engine=self._alignment_config.base_config.validation_engine,
+            )
+            for loaded_table in loaded_tables
+        }
+
+    def _store_validation_results(
+        self,
+        loaded_tables: List[NamedTable],
+        fingerprints: Dict[str, str],
+        previous_validation_result_file_paths: List[str],
+    ) -> None:
+        """Copy the validation results of the validated tables to the validation cache.
+
+        :param loaded_tables: The list of validated tables.
+        :param fingerprints: The validation fingerprints by table name.
+        :param previous_validation_result_file_paths: The result files in the validations store before
+        the tables were validated.
+        :return:
+        """
+        validations_directory_path = self._get_validations_directory_path()
+        new_validation_result_file_paths = set(self._get_validation_result_file_paths()).difference(
+            previous_validation_result_file_paths
+        )
+        for loaded_table in loaded_tables:
+            expectation_suite_name = produce_expectation_suite_name_for_entity(entity_name=loaded_table.name)
+            validation_cache.store_validation_results(
+                cache_directory=self._data_manager.get_validation_cache_folder_path(),
+                fingerprint=fingerprints[loaded_table.name],
+                validations_directory=validations_directory_path,
+                file_paths=[
+                    file_path
+                    for file_path in new_validation_result_file_paths
+                    if os.path.relpath(file_path, validations_directory_path).split(os.sep)[0]
+                    == expectation_suite_name
+                ],
+            )
+
+    def _get_validations_directory_path(self) -> str:
+        return os.path.join(self._ge_base_directory, "uncommitted", "validations")
+
+    def _get_validation_result_file_paths(self) -> List[str]:
+        return [str(path) for path in Path(self._get_validations_directory_path()).rglob("*.json")]
+
     def _run_validations(self, loaded_tables: List[NamedTable], data_origin: str) -> None:
         """Run the data tests for a list of tables.
 
+        If the native validation engine is configured, the tables with supported expectations are
+        validated natively, and the rest with GE. If parallel validation is configured, the tables
+        are validated (with GE) concurrently in worker processes.
+
         :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
         :param loaded_tables: The list of tables being tested.
         :return:
         """
-        for loaded_table in loaded_tables:
-            # create the checkpoint
-            self._ge_context.add_checkpoint(
-                **produce_check_point_config(
-                    checkpoint_name=self.checkpoint_name,
-                    validations=[
-                        produce_validation_config_for_entity(entity_name=loaded_table.name, data_origin=data_origin)
-                    ],
+        if self._alignment_config.base_config.validation_engine == VALIDATION_ENGINE_NATIVE:
+            native_table_names = [
+                loaded_table.name
+                for loaded_table in loaded_tables
+                if native_validator.is_supported(
+                    expectation_configurations=produce_expectations_for_table(
+                        table_name=loaded_table.name, alignment_config=self._alignment_config
+                    )
                 )
+            ]
+            self._run_native_validations(
+                loaded_tables=[table for table in loaded_tables if table.name in native_table_names],
+                data_origin=data_origin,
             )
+            loaded_tables = [table for table in loaded_tables if table.name not in native_table_names]
+        if self._alignment_config.base_config.parallel_validation is True and len(loaded_tables) > 1:
+            self._run_validations_in_parallel(loaded_tables=loaded_tables, data_origin=data_origin)
+            return
+        if len(loaded_tables) == 0:
+            return
+
+        # create a single checkpoint for the dataset, the validations (with the batches) are passed at runtime;
+        # the data docs are built separately (once)
+        self._ge_context.add_checkpoint(
+            **produce_check_point_config(checkpoint_name=self.checkpoint_name, validations=[], update_data_docs=False)
+        )
+
+        # run the checkpoint
+        self._ge_context.run_checkpoint(
+            checkpoint_name=self.checkpoint_name,
+            validations=[
+                produce_runtime_validation_config_for_entity(
+                    entity_name=loaded_table.name, data_origin=data_origin, batch_data=loaded_table.dataframe
+                )
+                for loaded_table in loaded_tables
+            ],
+        )
+
+    def _run_native_validations(self, loaded_tables: List[NamedTable], data_origin: str) -> None:
+        """Run the data tests for a list of tables with the native validator.
 
-            # run the checkpoint todo aggregate and print results
-            self._ge_context.run_checkpoint(
-                checkpoint_name=self.checkpoint_name,
-                batch_request={
-                    "runtime_parameters": {"batch_data": loaded_table.dataframe},
-                    "batch_identifiers": {"default_identifier_name": "default_identifier_name"},
-                },
+        The expectations of the (saved) expectation suites are validated, i.e. the same expectations
+        as validated by GE (the suite keeps one expectation per type and domain, e.g. column). The
+        results are saved to the validations store (in the GE format).
+
+        :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
+        :param loaded_tables: The list of tables being tested.
+        :return:
+        """
+        for loaded_table in loaded_tables:
+            expectation_suite_name = produce_expectation_suite_name_for_entity(entity_name=loaded_table.name)
+            validation_result = native_validator.validate_table(
+                table=loaded_table.dataframe,
+                expectation_configurations=self._ge_context.get_expectation_suite(
+                    expectation_suite_name=expectation_suite_name
+                ).expectations,
+                expectation_suite_name=expectation_suite_name,
+                datasource_name=produce_datasource_name_for_entity(entity_name=loaded_table.name),
+                data_asset_name=produce_data_asset_name_for_entity(
+                    entity_name=loaded_table.name, data_origin=data_origin
+                ),
+                worker_count=self._alignment_config.base_config.worker_count,
+            )
+            native_validator.save_validation_result(
+                validation_result=validation_result, ge_base_directory=self._ge_base_directory
             )
 
+    def _run_validations_in_parallel(self, loaded_tables: List[NamedTable], data_origin: str) -> None:
+        """Run the data tests for a list of tables concurrently, one table per worker process.
+
+        Each worker uses its own context with the same (file system) stores, so the expectation
+        suites are shared, and the validation results are stored together. The data docs are
+        built once all tables are validated.
+
+        :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
+        :param loaded_tables: The list of tables being tested.
+        :return:
+        """
+        with ProcessPoolExecutor(max_workers=self._alignment_config.base_config.worker_count) as executor:
+            futures = [
+                executor.submit(
+                    _run_validation_for_table,
+                    ge_base_directory=self._ge_base_directory,
+                    checkpoint_name=f"{self.checkpoint_name}_{data_origin}_{loaded_table.name}",
+                    loaded_table=loaded_table,
+                    data_origin=data_origin,
+                )
+                for loaded_table in loaded_tables
+            ]
+            for future in futures:
+                future.result()
+
+
+def _run_validation_for_table(
+    ge_base_directory: str, checkpoint_name: str, loaded_table: NamedTable, data_origin: str
+) -> None:
+    """Run the data tests for a table in a new context (in a worker process).
+
+    :param ge_base_directory: The base directory of the validation framework.
+    :param checkpoint_name: The name of the validation checkpoint (unique per table).
+    :param loaded_table: The table being tested.
+    :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
+    :return:
+    """
+    block_print()
+    ge_context = produce_ge_context(ge_base_directory=ge_base_directory)
+    ge_context.add_datasource(
+        **produce_datasource_config_for_entity(
+            entity_name=loaded_table.name, ge_base_directory=ge_base_directory, data_origin=data_origin
+        )
+    )
+    ge_context.add_checkpoint(
+        **produce_check_point_config(
+            checkpoint_name=checkpoint_name,
+            validations=[produce_validation_config_for_entity(entity_name=loaded_table.name, data_origin=data_origin)],
+            update_data_docs=False,
+        )
+    )
+    ge_context.run_checkpoint(
+        checkpoint_name=checkpoint_name,
+        batch_request={
+            "runtime_parameters": {"batch_data": loaded_table.dataframe},
+            "batch_identifiers": {"default_identifier_name": "default_identifier_name"},
+        },
+    )
+
 
 def block_print() -> None:
     """Block outputs to the console (GE produces many debug level outputs)."""
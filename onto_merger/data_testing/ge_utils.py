@@ -7,6 +7,7 @@ from great_expectations.data_context.types.base import (
     DataContextConfig,
     FilesystemStoreBackendDefaults,
 )
+from pandas import DataFrame
 
 
 def produce_ge_context(ge_base_directory: str) -> BaseDataContext:
@@ -78,13 +79,44 @@ def produce_validation_config_for_entity(entity_name: str, data_origin: str) ->
     return validation_config
 
 
-def produce_check_point_config(checkpoint_name: str, validations: List[dict]) -> dict:
+def produce_runtime_validation_config_for_entity(entity_name: str, data_origin: str, batch_data: DataFrame) -> dict:
+    """Produce a validation_config dictionary for a given table, with the table as the runtime batch data.
+
+    :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
+    :param entity_name: The name of the table that is being tested.
+    :param batch_data: The table that is being tested.
+    :return: The validation_config dictionary.
+    """
+    validation_config = produce_validation_config_for_entity(entity_name=entity_name, data_origin=data_origin)
+    validation_config["batch_request"].update(
+        {
+            "runtime_parameters": {"batch_data": batch_data},
+            "batch_identifiers": {"default_identifier_name": "default_identifier_name"},
+        }
+    )
+    return validation_config
+
+
+def produce_check_point_config(checkpoint_name: str, validations: List[dict], update_data_docs: bool = True) -> dict:
     """Produce a validation check point config dictionary for a list of validations.
 
     :param checkpoint_name: The name of the validation checkpoint.
     :param validations: The list of validations.
+    :param update_data_docs: If False the validation results are stored, but the data docs are not
+    updated (e.g. when the checkpoints are run concurrently, and the data docs are built afterwards).
     :return: The validation check point config dictionary.
     """
+    if update_data_docs is False:
+        return {
+            "name": checkpoint_name,
+            "config_version": 1,
+            "class_name": "Checkpoint",
+            "action_list": [
+                {"name": "store_validation_result", "action": {"class_name": "StoreValidationResultAction"}},
+                {"name": "store_evaluation_params", "action": {"class_name": "StoreEvaluationParametersAction"}},
+            ],
+            "validations": validations,
+        }
     checkpoint_config = {
         "name": checkpoint_name,
         "config_version": 1,
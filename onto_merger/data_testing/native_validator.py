@@ -0,0 +1,320 @@
+"""Native (vectorised pandas) validation of the generated expectations, a fast path for the GE execution engine.
+
+The validation results are saved in the GE validation result JSON format (to the GE validations
+store), so they can be aggregated and rendered the same way as the GE validation results.
+"""
+
+import hashlib
+import json
+import os
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+
+PARTIAL_UNEXPECTED_LIST_SIZE = 20
+
+
+def _produce_column_map_result(column: Series, is_unexpected: np.ndarray, mostly: float) -> Tuple[bool, dict]:
+    """Produce the result of a column map expectation (evaluated for each non null value).
+
+    :param column: The column.
+    :param is_unexpected: The mask of the unexpected values (of the non null values).
+    :param mostly: The minimum fraction of the non null values that must be as expected.
+    :return: The success flag and the result dictionary.
+    """
+    element_count = len(column)
+    non_null_values = column.dropna()
+    missing_count = element_count - len(non_null_values)
+    unexpected_values = non_null_values[is_unexpected]
+    unexpected_count = len(unexpected_values)
+    unexpected_percent_nonmissing = 100.0 * unexpected_count / len(non_null_values) if len(non_null_values) else 0.0
+    result = {
+        "element_count": element_count,
+        "missing_count": missing_count,
+        "missing_percent": 100.0 * missing_count / element_count if element_count else None,
+        "unexpected_count": unexpected_count,
+        "unexpected_percent": unexpected_percent_nonmissing,
+        "unexpected_percent_total": 100.0 * unexpected_count / element_count if element_count else None,
+        "unexpected_percent_nonmissing": unexpected_percent_nonmissing,
+        "partial_unexpected_list": unexpected_values.iloc[:PARTIAL_UNEXPECTED_LIST_SIZE].tolist(),
+    }
+    return (100.0 - unexpected_percent_nonmissing) >= 100.0 * mostly, result
+
+
+def _expect_column_to_exist(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    return kwargs["column"] in table.columns, {}
+
+
+def _expect_table_columns_to_match_set(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    columns = list(table.columns)
+    if kwargs.get("exact_match", True) is False:
+        return set(kwargs["column_set"]).issubset(columns), {"observed_value": columns}
+    return set(kwargs["column_set"]) == set(columns), {"observed_value": columns}
+
+
+def _expect_table_columns_to_match_ordered_list(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    columns = list(table.columns)
+    return columns == list(kwargs["column_list"]), {"observed_value": columns}
+
+
+def _expect_column_values_to_be_of_type(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    if kwargs["type_"] == "object":
+        success = pd.api.types.is_object_dtype(column.dtype) or pd.api.types.is_string_dtype(column.dtype)
+    else:
+        success = column.dtype == np.dtype(kwargs["type_"])
+    return bool(success), {"observed_value": str(column.dtype)}
+
+
+def _expect_column_values_to_not_be_null(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    is_null = column.isna().values
+    unexpected_count = int(is_null.sum())
+    unexpected_percent = 100.0 * unexpected_count / len(column) if len(column) else 0.0
+    result = {
+        "element_count": len(column),
+        "unexpected_count": unexpected_count,
+        "unexpected_percent": unexpected_percent,
+        "unexpected_percent_total": unexpected_percent,
+        "partial_unexpected_list": [None] * min(unexpected_count, PARTIAL_UNEXPECTED_LIST_SIZE),
+    }
+    return (100.0 - unexpected_percent) >= 100.0 * kwargs.get("mostly", 1.0), result
+
+
+def _expect_column_values_to_be_unique(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    return _produce_column_map_result(
+        column=column,
+        is_unexpected=column.dropna().duplicated(keep=False).values,
+        mostly=kwargs.get("mostly", 1.0),
+    )
+
+
+def _expect_column_value_lengths_to_be_between(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    lengths = column.dropna().astype(str).str.len().values
+    return _produce_column_map_result(
+        column=column,
+        is_unexpected=_is_outside_range(values=lengths, min_value=kwargs["min_value"], max_value=kwargs["max_value"]),
+        mostly=kwargs.get("mostly", 1.0),
+    )
+
+
+def _expect_column_values_to_match_regex(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    return _produce_column_map_result(
+        column=column,
+        is_unexpected=~column.dropna().astype(str).str.contains(kwargs["regex"], regex=True).values,
+        mostly=kwargs.get("mostly", 1.0),
+    )
+
+
+def _expect_column_values_to_be_in_set(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    return _produce_column_map_result(
+        column=column,
+        is_unexpected=~column.dropna().isin(kwargs["value_set"]).values,
+        mostly=kwargs.get("mostly", 1.0),
+    )
+
+
+def _expect_column_values_to_be_between(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    return _produce_column_map_result(
+        column=column,
+        is_unexpected=_is_outside_range(
+            values=column.dropna().values,
+            min_value=kwargs.get("min_value"),
+            max_value=kwargs.get("max_value"),
+        ),
+        mostly=kwargs.get("mostly", 1.0),
+    )
+
+
+def _expect_column_values_to_be_decreasing(table: DataFrame, kwargs: dict) -> Tuple[bool, dict]:
+    column = table[kwargs["column"]]
+    differences = np.diff(column.dropna().values, prepend=np.nan)
+    is_unexpected = differences >= 0 if kwargs.get("strictly", False) else differences > 0
+    return _produce_column_map_result(column=column, is_unexpected=is_unexpected, mostly=kwargs.get("mostly", 1.0))
+
+
+def _is_outside_range(values: np.ndarray, min_value: Optional[float], max_value: Optional[float]) -> np.ndarray:
+    is_outside_range = np.zeros(len(values), dtype=bool)
+    if min_value is not None:
+        is_outside_range |= values < min_value
+    if max_value is not None:
+        is_outside_range |= values > max_value
+    return is_outside_range
+
+
+EXPECTATION_EVALUATORS: Dict[str, Callable[[DataFrame, dict], Tuple[bool, dict]]] = {
+    "expect_column_to_exist": _expect_column_to_exist,
+    "expect_table_columns_to_match_set": _expect_table_columns_to_match_set,
+    "expect_table_columns_to_match_ordered_list": _expect_table_columns_to_match_ordered_list,
+    "expect_column_values_to_be_of_type": _expect_column_values_to_be_of_type,
+    "expect_column_values_to_not_be_null": _expect_column_values_to_not_be_null,
+    "expect_column_values_to_be_unique": _expect_column_values_to_be_unique,
+    "expect_column_value_lengths_to_be_between": _expect_column_value_lengths_to_be_between,
+    "expect_column_values_to_match_regex": _expect_column_values_to_match_regex,
+    "expect_column_values_to_be_in_set": _expect_column_values_to_be_in_set,
+    "expect_column_values_to_be_between": _expect_column_values_to_be_between,
+    "expect_column_values_to_be_decreasing": _expect_column_values_to_be_decreasing,
+}
+
+
+def is_supported(expectation_configurations: list) -> bool:
+    """Check whether all expectations can be evaluated by the native validator.
+
+    :param expectation_configurations: The list of ExpectationConfiguration-s.
+    :return: True if all expectation types are supported.
+    """
+    return all(
+        expectation_configuration.expectation_type in EXPECTATION_EVALUATORS
+        for expectation_configuration in expectation_configurations
+    )
+
+
+def _evaluate_expectation(table: DataFrame, expectation_configuration) -> dict:
+    """Evaluate an expectation for a table.
+
+    As in GE, an error raised while evaluating the expectation (e.g. comparing values of a different
+    type) fails the expectation, and is recorded in the exception info of the result.
+
+    :param table: The table being tested.
+    :param expectation_configuration: The ExpectationConfiguration.
+    :return: The expectation validation result dictionary.
+    """
+    kwargs = dict(expectation_configuration.kwargs)
+    result: dict
+    exception_info: Dict[str, Any] = {"raised_exception": False, "exception_message": None, "exception_traceback": None}
+    try:
+        if "column" in kwargs and kwargs["column"] not in table.columns \
+                and expectation_configuration.expectation_type != "expect_column_to_exist":
+            raise ValueError(f'Error: The column "{kwargs["column"]}" in BatchData does not exist.')
+        success, result = EXPECTATION_EVALUATORS[expectation_configuration.expectation_type](table, kwargs)
+    except Exception as exception:
+        # the data docs renderer expects the traceback (a string) of a raised exception
+        success, result = False, {}
+        exception_info = {
+            "raised_exception": True,
+            "exception_message": str(exception),
+            "exception_traceback": traceback.format_exc(),
+        }
+    return {
+        "success": bool(success),
+        "expectation_config": {
+            "expectation_type": expectation_configuration.expectation_type,
+            "kwargs": kwargs,
+            "meta": {},
+        },
+        "result": result,
+        "meta": {},
+        "exception_info": exception_info,
+    }
+
+
+def validate_table(
+    table: DataFrame,
+    expectation_configurations: list,
+    expectation_suite_name: str,
+    datasource_name: str,
+    data_asset_name: str,
+    worker_count: Optional[int] = None,
+) -> dict:
+    """Validate a table with a list of expectations, the expectations are evaluated concurrently.
+
+    :param table: The table being tested.
+    :param expectation_configurations: The list of ExpectationConfiguration-s.
+    :param expectation_suite_name: The name of the expectation suite (of the table).
+    :param datasource_name: The name of the datasource (of the table).
+    :param data_asset_name: The name of the data asset (of the table and the data origin).
+    :param worker_count: The number of threads, defaults to the number of CPUs if None.
+    :return: The validation result dictionary (in the GE validation result format).
+    """
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        results = list(
+            executor.map(
+                lambda expectation_configuration: _evaluate_expectation(
+                    table=table, expectation_configuration=expectation_configuration
+                ),
+                expectation_configurations,
+            )
+        )
+    successful_expectations = sum(result["success"] for result in results)
+    run_time = datetime.now(timezone.utc)
+    active_batch_definition = {
+        "datasource_name": datasource_name,
+        "data_connector_name": "default_runtime_data_connector_name",
+        "data_asset_name": data_asset_name,
+        "batch_identifiers": {"default_identifier_name": "default_identifier_name"},
+    }
+    return {
+        "success": successful_expectations == len(results),
+        "results": results,
+        "evaluation_parameters": {},
+        "statistics": {
+            "evaluated_expectations": len(results),
+            "successful_expectations": successful_expectations,
+            "unsuccessful_expectations": len(results) - successful_expectations,
+            "success_percent": 100.0 * successful_expectations / len(results) if results else None,
+        },
+        "meta": {
+            "great_expectations_version": _get_great_expectations_version(),
+            "validation_engine": "native",
+            "expectation_suite_name": expectation_suite_name,
+            "run_id": {
+                "run_name": f"{run_time:%Y%m%d-%H%M%S}-onto-merger-native",
+                "run_time": run_time.isoformat(),
+            },
+            "batch_spec": {"data_asset_name": data_asset_name, "batch_data": "PandasDataFrame"},
+            "batch_markers": {},
+            "active_batch_definition": active_batch_definition,
+            "validation_time": f"{run_time:%Y%m%dT%H%M%S.%fZ}",
+        },
+    }
+
+
+def save_validation_result(validation_result: dict, ge_base_directory: str) -> str:
+    """Save a validation result JSON to the GE validations store.
+
+    The file path follows the GE store layout: suite name / run name / run time / batch ID.
+
+    :param validation_result: The validation result dictionary.
+    :param ge_base_directory: The base directory of the validation framework.
+    :return: The file path of the saved JSON.
+    """
+    meta = validation_result["meta"]
+    batch_id = hashlib.md5(json.dumps(meta["active_batch_definition"], sort_keys=True).encode()).hexdigest()
+    directory_path = os.path.join(
+        ge_base_directory,
+        "uncommitted",
+        "validations",
+        meta["expectation_suite_name"],
+        meta["run_id"]["run_name"],
+        meta["validation_time"],
+    )
+    os.makedirs(directory_path, exist_ok=True)
+    file_path = os.path.join(directory_path, f"{batch_id}.json")
+    with open(file_path, "w") as json_file:
+        json.dump(validation_result, json_file, indent=2, default=_convert_to_json_value)
+    return file_path
+
+
+def _convert_to_json_value(value):
+    """Convert numpy scalars (e.g. in the unexpected value lists) to JSON values."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _get_great_expectations_version() -> Optional[str]:
+    try:
+        import great_expectations
+    except ImportError:
+        return None
+    return great_expectations.__version__
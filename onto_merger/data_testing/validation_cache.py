@@ -0,0 +1,86 @@
+"""Cache of the validation results, so unchanged tables are not validated again in the next runs."""
+
+import hashlib
+import json
+import os
+import shutil
+from typing import List
+
+from pandas import DataFrame
+
+from onto_merger.data.content_hash import produce_table_content_hash
+from onto_merger.version import __version__
+
+
+def produce_table_fingerprint(
+    table_name: str, table: DataFrame, expectation_configurations: list, data_origin: str, validation_engine: str
+) -> str:
+    """Produce the fingerprint of a table validation: the table name, its content hash and its expectation suite.
+
+    The table name is part of the fingerprint, as tables with the same content (e.g. two empty node tables)
+    are validated with different expectation suites (and their results are stored separately).
+
+    :param table_name: The name of the table being tested.
+    :param table: The table being tested.
+    :param expectation_configurations: The list of ExpectationConfiguration-s of the table.
+    :param data_origin: The origin of the tested data (INPUT|INTERMEDIATE|DOMAIN_ONTOLOGY).
+    :param validation_engine: The validation engine.
+    :return: The fingerprint as a hex string.
+    """
+    fingerprint = hashlib.sha256(f"{__version__}:{validation_engine}:{data_origin}:{table_name}".encode())
+    fingerprint.update(
+        json.dumps(
+            [
+                {
+                    "expectation_type": expectation_configuration.expectation_type,
+                    "kwargs": dict(expectation_configuration.kwargs),
+                }
+                for expectation_configuration in expectation_configurations
+            ],
+            sort_keys=True,
+            default=str,
+        ).encode()
+    )
+    fingerprint.update(produce_table_content_hash(table=table).encode())
+    return fingerprint.hexdigest()
+
+
+def restore_validation_results(cache_directory: str, fingerprint: str, validations_directory: str) -> bool:
+    """Copy the cached validation results of a table (if any) to the validations store.
+
+    :param cache_directory: The validation cache directory.
+    :param fingerprint: The fingerprint of the table validation.
+    :param validations_directory: The validations store directory.
+    :return: True if the validation results were cached (and restored).
+    """
+    cached_results_path = os.path.join(cache_directory, fingerprint)
+    if not os.path.isdir(cached_results_path):
+        return False
+    shutil.copytree(cached_results_path, validations_directory, dirs_exist_ok=True)
+    return True
+
+
+def store_validation_results(
+    cache_directory: str, fingerprint: str, validations_directory: str, file_paths: List[str]
+) -> None:
+    """Copy the validation results of a table to the cache.
+
+    The results are copied to a temporary directory first, so an interrupted copy is not used as a cached result.
+
+    :param cache_directory: The validation cache directory.
+    :param fingerprint: The fingerprint of the table validation.
+    :param validations_directory: The validations store directory.
+    :param file_paths: The validation result file paths of the table (in the validations store).
+    :return:
+    """
+    if not file_paths:
+        return
+    cached_results_path = os.path.join(cache_directory, fingerprint)
+    temporary_path = f"{cached_results_path}.tmp"
+    shutil.rmtree(temporary_path, ignore_errors=True)
+    for file_path in file_paths:
+        cached_file_path = os.path.join(temporary_path, os.path.relpath(file_path, validations_directory))
+        os.makedirs(os.path.dirname(cached_file_path), exist_ok=True)
+        shutil.copyfile(file_path, cached_file_path)
+    shutil.rmtree(cached_results_path, ignore_errors=True)
+    os.replace(temporary_path, cached_results_path)
@@ -5,7 +5,7 @@ After deduplication the nodes are connected to form a single directed acyclic hi
 i.e. an ontology class hierarchy.
 
 Usage:
-    main.py -f <FOLDER_PATH>
+    main.py -f <FOLDER_PATH> [--incremental] [--resume]
     main.py -f EXAMPLE_DATASET
     main.py -f EXAMPLE_DATASET_LIGHT
     main.py (-h | --help)
@@ -19,6 +19,8 @@ Arguments:
 Options:
   -h --help         Show this screen.
   -f <FOLDER_PATH>  Run the OntoMerger alignemnt and connectivity process on the specified dataset.
+  --incremental     Only align and connect the nodes affected by the input changes since the previous run.
+  --resume          Skip the stages completed by the previous run (with unchanged inputs and configuration).
   -v                Show version.
 
 """
@@ -31,15 +33,21 @@ from onto_merger.version import __version__
 example_data_sets = {"EXAMPLE_DATASET": "../data/bikg_disease", "EXAMPLE_DATASET_LIGHT": "../tests/test_data"}
 FOLDER_PATH_ARG = "-f"
 VERSION_ARG = "-v"
+INCREMENTAL_ARG = "--incremental"
+RESUME_ARG = "--resume"
 
 
-def main(project_folder_path: str) -> None:
+def main(project_folder_path: str, incremental: bool = False, resume: bool = False) -> None:
     """Run the OntoMerger pipeline for the specified data set.
 
     :param project_folder_path: The data set path.
+    :param incremental: If True only the nodes affected by the input changes are aligned and connected.
+    :param resume: If True the run resumes after the stages completed by the previous run.
     :return:
     """
-    Pipeline(project_folder_path=project_folder_path).run_alignment_and_connection_process()
+    Pipeline(project_folder_path=project_folder_path, resume=resume).run_alignment_and_connection_process(
+        incremental=incremental
+    )
 
 # pipeline = Pipeline(project_folder_path="/Users/ashwinv/Documents/GitHub/onto_merger/data/bikg_disease")
 if __name__ == "__main__":
@@ -48,6 +56,14 @@ if __name__ == "__main__":
         print(f"OntoMerger v. {__version__}")
     elif arguments[FOLDER_PATH_ARG]:
         if arguments[FOLDER_PATH_ARG] in example_data_sets:
-            main(project_folder_path=example_data_sets[arguments[FOLDER_PATH_ARG]])
+            main(
+                project_folder_path=example_data_sets[arguments[FOLDER_PATH_ARG]],
+                incremental=arguments[INCREMENTAL_ARG],
+                resume=arguments[RESUME_ARG],
+            )
         else:
-            main(project_folder_path=arguments[FOLDER_PATH_ARG])
+            main(
+                project_folder_path=arguments[FOLDER_PATH_ARG],
+                incremental=arguments[INCREMENTAL_ARG],
+                resume=arguments[RESUME_ARG],
+            )
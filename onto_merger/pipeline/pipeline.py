@@ -1,6 +1,7 @@
 """Runs the alignment and connection process, input and output validation and produces reports."""
+import hashlib
 from datetime import datetime
-from typing import List
+from typing import Callable, List, Optional
 
 from pandas import DataFrame
 
@@ -14,11 +15,14 @@ from onto_merger.data.constants import (
     DIRECTORY_DOMAIN_ONTOLOGY,
     DIRECTORY_INPUT,
     DIRECTORY_INTERMEDIATE,
+    TABLE_NODES_REALIGNED,
 )
 from onto_merger.data.data_manager import DataManager
 from onto_merger.data.dataclasses import (
+    AlignmentDelta,
     DataRepository,
     NamedTable,
+    PipelineCheckpoint,
     RuntimeData,
     convert_runtime_steps_to_named_table,
     format_datetime,
@@ -35,60 +39,121 @@ class Pipeline:
      corresponding names (types)."""
     _data_repo: DataRepository = DataRepository()
 
-    def __init__(self, project_folder_path: str) -> None:
+    def __init__(self, project_folder_path: str, resume: bool = False) -> None:
         """Initialise the Pipeline class.
 
         :param project_folder_path: The directory path where the project inputs are
         stored.
+        :param resume: If True the outputs of the previous run are kept, and the run
+        resumes after the last stage checkpoint that matches the current inputs (the outputs
+        are deleted if no checkpoint matches).
         """
         self._project_folder_path = DataManager.get_absolute_path(project_folder_path)
         self._short_project_name = self._project_folder_path.split("/")[-1]
-        self._data_manager = DataManager(project_folder_path=self._project_folder_path)
+        self._data_manager = DataManager(
+            project_folder_path=self._project_folder_path, clear_output_directory=not resume
+        )
         self._alignment_config = self._data_manager.load_alignment_config()
         self.logger = setup_logger(module_name=__name__, file_name=self._data_manager.get_log_file_path())
+        self._resume = resume
+        self._incremental = False
         self._alignment_priority_order: List[str] = []
         self._runtime_data: List[RuntimeData] = []
+        self._alignment_delta: Optional[AlignmentDelta] = None
+        self._ge_runner: Optional[GERunner] = None
 
-    def run_alignment_and_connection_process(self) -> None:
+    def run_alignment_and_connection_process(self, incremental: bool = False) -> None:
         """Run the alignment and connectivity process, validate inputs and outputs, produce analysis.
 
+        A checkpoint is saved after each stage; stages already completed (with the same inputs
+        and configuration) by a previous run are skipped if the pipeline is resumed.
+
+        :param incremental: If True only the nodes affected by the input changes since the
+        previous run (provided in the input folder) are aligned and connected.
         :return:
         """
         self.logger.info("Started running alignment and connection process for " + f"'{self._short_project_name}'")
+        self._incremental = incremental
+        stages: List[Callable[[], None]] = [
+            # (1) VALIDATE CONFIG
+            self._validate_alignment_config,
+            # (2) LOAD AND CHECK INPUT DATA
+            self._process_input_data,
+            # (3) RUN ALIGNMENT & POST PROCESSING
+            self._align_nodes,
+            self._post_process_alignment_output,
+            # (4) RUN CONNECTIVITY & POST PROCESSING
+            self._connect_nodes,
+            # (5) FINALISE OUTPUTS
+            self._finalise_outputs,
+            # (6) VALIDATE & PROFILE: intermediate & output data
+            self._validate_and_profile_outputs,
+            # (7) PRODUCE ANALYSIS & REPORT
+            self._produce_report,
+        ]
+        stage_names = [stage.__name__.lstrip("_") for stage in stages]
+        stage_fingerprints = self._produce_stage_fingerprints(stage_names=stage_names)
+        first_stage_index = self._resume_from_checkpoint(stage_fingerprints=stage_fingerprints) if self._resume else 0
+
+        for stage_index in range(first_stage_index, len(stages)):
+            stages[stage_index]()
+            self._save_checkpoint(
+                stage_name=stage_names[stage_index], stage_fingerprint=stage_fingerprints[stage_index]
+            )
 
-        # (1) VALIDATE CONFIG
-        self._validate_alignment_config()
-
-        # (2) LOAD AND CHECK INPUT DATA
-        self._process_input_data()
-
-        # (3) RUN ALIGNMENT & POST PROCESSING
-        self._align_nodes()
-        self._post_process_alignment_output()
-
-        # (4) RUN CONNECTIVITY & POST PROCESSING
-        self._connect_nodes()
+        self.logger.info("Finished running alignment and connection process for " + f"'{self._short_project_name}'")
 
-        # (5) FINALISE OUTPUTS
-        self._finalise_outputs()
+    def _produce_stage_fingerprints(self, stage_names: List[str]) -> List[str]:
+        """Produce the fingerprint of each stage from the run inputs and the preceding stages.
 
-        # (6) VALIDATE & PROFILE: intermediate & output data
-        self._validate_and_profile_dataset(
-            data_origin=DIRECTORY_INTERMEDIATE,
-            data_runtime_name=DIRECTORY_INTERMEDIATE,
-            tables=self._data_repo.get_intermediate_tables()
-        )
-        self._validate_and_profile_dataset(
-            data_origin=DIRECTORY_DOMAIN_ONTOLOGY,
-            data_runtime_name="output",
-            tables=self._data_repo.get_domain_tables()
+        :param stage_names: The names of the stages in run order.
+        :return: The stage fingerprints.
+        """
+        fingerprint = self._data_manager.produce_input_fingerprint(incremental=self._incremental)
+        stage_fingerprints = []
+        for stage_name in stage_names:
+            fingerprint = hashlib.sha256(f"{fingerprint}:{stage_name}".encode()).hexdigest()
+            stage_fingerprints.append(fingerprint)
+        return stage_fingerprints
+
+    def _resume_from_checkpoint(self, stage_fingerprints: List[str]) -> int:
+        """Restore the pipeline state from the checkpoint of the previous run, if it matches the run inputs.
+
+        :param stage_fingerprints: The stage fingerprints of the current run.
+        :return: The index of the first stage to run.
+        """
+        checkpoint = self._data_manager.load_checkpoint(fingerprints=stage_fingerprints)
+        if checkpoint is None:
+            # the outputs of the previous run are outdated, and would be aggregated into the report
+            self._data_manager.reset_output_directory()
+            self.logger.info("Resuming from the first stage.")
+            return 0
+        self._data_repo = DataRepository()
+        self._data_repo.update(tables=checkpoint.tables)
+        self._alignment_priority_order = checkpoint.alignment_priority_order
+        self._runtime_data = checkpoint.runtime_data
+        self._alignment_delta = checkpoint.alignment_delta
+        self.logger.info(f"Resuming after the completed stage '{checkpoint.stage}'.")
+        return stage_fingerprints.index(checkpoint.fingerprint) + 1
+
+    def _save_checkpoint(self, stage_name: str, stage_fingerprint: str) -> None:
+        """Save the pipeline state after a completed stage.
+
+        :param stage_name: The name of the completed stage.
+        :param stage_fingerprint: The fingerprint of the completed stage.
+        :return:
+        """
+        self._data_manager.save_checkpoint(
+            checkpoint=PipelineCheckpoint(
+                stage=stage_name,
+                fingerprint=stage_fingerprint,
+                tables=[NamedTable(table.name, table.dataframe) for table in self._data_repo.data.values()],
+                alignment_priority_order=self._alignment_priority_order,
+                runtime_data=self._runtime_data,
+                alignment_delta=self._alignment_delta,
+            )
         )
 
-        # (7) PRODUCE ANALYSIS & REPORT
-        self._produce_report()
-
-        self.logger.info("Finished running alignment and connection process for " + f"'{self._short_project_name}'")
-
     def _validate_alignment_config(self) -> None:
         """Run the alignment configuration JSON schema validator.
 
@@ -114,19 +179,18 @@ class Pipeline:
         """
         self.logger.info("Started processing input data...")
 
-        # load  and preprocess input tables: add namespaces for downstream processing
-        self._data_repo.update(
-            tables=analysis_utils.add_namespace_column_to_loaded_tables(tables=self._data_manager.load_input_tables())
-        )
+        # load input tables: the namespaces are derived (and memoised) by the tables when used downstream
+        self._data_repo.update(tables=self._data_manager.load_input_tables())
 
-        # profile input tables
+        # profile and validate input tables (with namespaces)
         results_df = self._validate_and_profile_dataset(
             data_origin=DIRECTORY_INPUT,
             data_runtime_name=DIRECTORY_INPUT,
-            tables=self._data_repo.get_input_tables()
+            tables=analysis_utils.add_namespace_column_to_loaded_tables(tables=self._data_repo.get_input_tables())
         )
         errors = results_df["nb_failed_validations"].sum()
         if errors > 0:
+            self._get_ge_runner().build_data_docs()
             self.logger.error(f"The INPUT data validation found {errors} errors. Terminating process. "
                               + "Please resolve the errors, or force skipping errors in the config (see report "
                               + f"'{self._data_manager.get_ge_data_docs_index_path_for_input()}').")
@@ -135,6 +199,9 @@ class Pipeline:
             else:
                 self.logger.info("Process will carry on due 'force_through_failed_validation' is ON")
 
+        if self._incremental is True:
+            self._alignment_delta = self._data_manager.load_alignment_delta()
+
         self.logger.info("Finished processing input data.")
 
     def _align_nodes(self) -> None:
@@ -150,7 +217,13 @@ class Pipeline:
             alignment_config=self._alignment_config,
             data_repo=self._data_repo,
             data_manager=self._data_manager,
+            alignment_delta=self._alignment_delta,
         ).align_nodes()
+        if TABLE_NODES_REALIGNED in alignment_results.data:
+            self._data_repo.update(table=alignment_results.get(TABLE_NODES_REALIGNED))
+        else:
+            # all nodes were aligned (e.g. the source alignment order changed)
+            self._alignment_delta = None
         self._data_repo.update(tables=alignment_results.get_intermediate_tables())
         self._data_manager.save_tables(tables=alignment_results.get_intermediate_tables())
         self._alignment_priority_order.extend(source_alignment_order)
@@ -169,7 +242,10 @@ class Pipeline:
         tables = merge_utils.post_process_alignment_results(
             data_repo=self._data_repo,
             seed_id=self._alignment_config.base_config.seed_ontology_name,
-            alignment_priority_order=self._alignment_priority_order
+            alignment_priority_order=self._alignment_priority_order,
+            merges_aggregated_previous=(
+                self._alignment_delta.merges_aggregated_previous if self._alignment_delta is not None else None
+            ),
         )
         self._data_repo.update(tables=tables)
         self._data_manager.save_tables(tables=tables)
@@ -190,6 +266,7 @@ class Pipeline:
                 alignment_config=self._alignment_config,
                 source_alignment_order=self._alignment_priority_order,
                 data_repo=self._data_repo,
+                alignment_delta=self._alignment_delta,
             )
         )
         self._data_repo.update(
@@ -227,6 +304,27 @@ class Pipeline:
         self._record_runtime(start_date_time=start_date_time, task_name="FINALISING OUTPUTS")
         self.logger.info("Finished finalising outputs.")
 
+    def _validate_and_profile_outputs(self) -> None:
+        """Profile and validate the intermediate and the domain ontology tables.
+
+        :return:
+        """
+        self._validate_and_profile_dataset(
+            data_origin=DIRECTORY_INTERMEDIATE,
+            data_runtime_name=DIRECTORY_INTERMEDIATE,
+            tables=self._data_repo.get_intermediate_tables()
+        )
+        self._validate_and_profile_dataset(
+            data_origin=DIRECTORY_DOMAIN_ONTOLOGY,
+            data_runtime_name="output",
+            tables=self._data_repo.get_domain_tables()
+        )
+
+        # build the data docs once, for all validated datasets
+        start_date_time = datetime.now()
+        self._get_ge_runner().build_data_docs()
+        self._record_runtime(start_date_time=start_date_time, task_name="VALIDATION DATA DOCS")
+
     def _validate_and_profile_dataset(
             self, data_origin: str, data_runtime_name: str, tables: List[NamedTable]
     ) -> DataFrame:
@@ -238,21 +336,32 @@ class Pipeline:
 
         # profile outputs
         start_date_time = datetime.now()
-        pandas_profiler.profile_tables(tables=tables, data_manager=self._data_manager)
+        self._runtime_data.extend(pandas_profiler.profile_tables(tables=tables, data_manager=self._data_manager))
         self._record_runtime(start_date_time=start_date_time, task_name=f"PROFILING {data_runtime_name} DATA")
 
         # run data tests
         start_date_time = datetime.now()
-        results_df = GERunner(
-            alignment_config=self._alignment_config,
-            ge_base_directory=self._data_manager.get_data_tests_path(),
-            data_manager=self._data_manager,
-        ).run_ge_tests(named_tables=tables, data_origin=data_origin)
+        results_df = self._get_ge_runner().run_ge_tests(
+            named_tables=tables, data_origin=data_origin, build_data_docs=False
+        )
         self._record_runtime(start_date_time=start_date_time, task_name=f"VALIDATION {data_runtime_name} DATA")
 
         self.logger.info(f"Finished validating {data_runtime_name} data.")
         return results_df
 
+    def _get_ge_runner(self) -> GERunner:
+        """Get the data test runner, it is created once per run (so the GE context is reused).
+
+        :return: The data test runner.
+        """
+        if self._ge_runner is None:
+            self._ge_runner = GERunner(
+                alignment_config=self._alignment_config,
+                ge_base_directory=self._data_manager.get_data_tests_path(),
+                data_manager=self._data_manager,
+            )
+        return self._ge_runner
+
     def _produce_report(self) -> None:
         """Run the alignment and connectivity evaluation process.
 
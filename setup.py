@@ -31,6 +31,7 @@ tests_require = ["pytest", "pytest-cov"]
 
 extras_require = {
     "tests": tests_require,
+    "columnar": ["pyarrow"],
     "docs": [
         "sphinx",
         "sphinx-rtd-theme",
@@ -2,9 +2,11 @@
 import os
 from typing import List
 
+import pandas as pd
 import pytest
 
 from onto_merger.alignment.alignment_manager import AlignmentManager
+from onto_merger.analyser.analysis_utils import produce_table_with_namespace_column_for_node_ids
 from onto_merger.data.constants import (
     DIRECTORY_ANALYSIS,
     DIRECTORY_DATA_TESTS,
@@ -57,3 +59,72 @@ def test_align_nodes(
         assert len(actual.dataframe) > 0
     assert source_alignment_order == source_alignment_priority_order
     assert isinstance(output_data_repo, DataRepository)
+
+
+def test_align_nodes_sharded(
+    alignment_config: AlignmentConfig,
+    data_repo: DataRepository,
+    data_manager: DataManager,
+):
+    serial_output_data_repo, serial_source_alignment_order = AlignmentManager(
+        alignment_config=alignment_config,
+        data_repo=data_repo,
+        data_manager=data_manager,
+    ).align_nodes()
+    alignment_config.base_config.sharded_alignment = True
+    alignment_config.base_config.worker_count = 2
+    sharded_output_data_repo, sharded_source_alignment_order = AlignmentManager(
+        alignment_config=alignment_config,
+        data_repo=data_repo,
+        data_manager=data_manager,
+    ).align_nodes()
+
+    assert sharded_source_alignment_order == serial_source_alignment_order
+    pd.testing.assert_frame_equal(
+        sharded_output_data_repo.get(TABLE_MERGES_WITH_META_DATA).dataframe,
+        serial_output_data_repo.get(TABLE_MERGES_WITH_META_DATA).dataframe,
+    )
+    step_count_columns = [
+        "mapping_type_group",
+        "source",
+        "step_counter",
+        "count_unmapped_nodes",
+        "count_mappings",
+        "count_nodes_one_source_to_many_target",
+        "count_merged_nodes",
+    ]
+    pd.testing.assert_frame_equal(
+        sharded_output_data_repo.get(TABLE_ALIGNMENT_STEPS_REPORT).dataframe[step_count_columns],
+        serial_output_data_repo.get(TABLE_ALIGNMENT_STEPS_REPORT).dataframe[step_count_columns],
+    )
+
+
+def test_align_nodes_with_mapping_chunks(
+    alignment_config: AlignmentConfig,
+    data_repo: DataRepository,
+    data_manager: DataManager,
+):
+    full_output_data_repo, full_source_alignment_order = AlignmentManager(
+        alignment_config=alignment_config,
+        data_repo=data_repo,
+        data_manager=data_manager,
+    ).align_nodes()
+    data_manager.config.base_config.mapping_chunk_size = 50
+    chunked_data_repo = DataRepository()
+    chunked_data_repo.update(
+        tables=[
+            NamedTable(name=table.name, dataframe=produce_table_with_namespace_column_for_node_ids(table.dataframe))
+            for table in data_manager.load_input_tables()
+        ]
+    )
+    chunked_output_data_repo, chunked_source_alignment_order = AlignmentManager(
+        alignment_config=alignment_config,
+        data_repo=chunked_data_repo,
+        data_manager=data_manager,
+    ).align_nodes()
+
+    assert chunked_source_alignment_order == full_source_alignment_order
+    pd.testing.assert_frame_equal(
+        chunked_output_data_repo.get(TABLE_MERGES_WITH_META_DATA).dataframe.reset_index(drop=True),
+        full_output_data_repo.get(TABLE_MERGES_WITH_META_DATA).dataframe.reset_index(drop=True),
+    )
@@ -0,0 +1,118 @@
+"""Tests for the incremental (delta based) alignment and connectivity."""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from onto_merger.alignment import merge_utils
+from onto_merger.alignment.alignment_manager import AlignmentManager
+from onto_merger.alignment.hierarchy_utils import HierarchyManager
+from onto_merger.data.constants import (
+    COLUMN_PROVENANCE,
+    COLUMN_SOURCE_ID,
+    SCHEMA_HIERARCHY_EDGE_TABLE,
+    TABLE_EDGES_HIERARCHY,
+    TABLE_EDGES_HIERARCHY_POST,
+    TABLE_MAPPINGS,
+    TABLE_MERGES_AGGREGATED,
+    TABLE_NODES,
+    TABLE_NODES_REALIGNED,
+)
+from onto_merger.data.data_manager import DataManager
+from onto_merger.data.dataclasses import AlignmentConfig, AlignmentDelta, DataRepository, NamedTable
+from tests.fixtures import alignment_config, data_manager, data_repo
+
+
+def _run_alignment_and_connectivity(
+        input_tables: Dict[str, DataFrame],
+        alignment_config: AlignmentConfig,
+        data_manager: DataManager,
+        alignment_delta: Optional[AlignmentDelta] = None,
+) -> DataRepository:
+    data_repo = DataRepository()
+    data_repo.update(tables=[NamedTable(name, table) for name, table in input_tables.items()])
+    alignment_results, source_alignment_order = AlignmentManager(
+        alignment_config=alignment_config,
+        data_repo=data_repo,
+        data_manager=data_manager,
+        alignment_delta=alignment_delta,
+    ).align_nodes()
+    if alignment_delta is not None:
+        data_repo.update(table=alignment_results.get(TABLE_NODES_REALIGNED))
+    data_repo.update(tables=alignment_results.get_intermediate_tables())
+    data_repo.update(
+        tables=merge_utils.post_process_alignment_results(
+            data_repo=data_repo,
+            seed_id=alignment_config.base_config.seed_ontology_name,
+            alignment_priority_order=source_alignment_order,
+            merges_aggregated_previous=(
+                alignment_delta.merges_aggregated_previous if alignment_delta is not None else None
+            ),
+        )
+    )
+    data_repo.update(
+        tables=HierarchyManager(data_manager=data_manager).connect_nodes(
+            alignment_config=alignment_config,
+            source_alignment_order=source_alignment_order,
+            data_repo=data_repo,
+            alignment_delta=alignment_delta,
+        )
+    )
+    return data_repo
+
+
+def test_incremental_alignment(
+        alignment_config: AlignmentConfig,
+        data_repo: DataRepository,
+        data_manager: DataManager,
+):
+    current_tables = {table.name: table.dataframe for table in data_repo.get_input_tables()}
+    # hierarchy edges are used for the namespace of their provenance
+    current_tables[TABLE_EDGES_HIERARCHY] = current_tables[TABLE_EDGES_HIERARCHY].assign(
+        **{COLUMN_PROVENANCE: current_tables[TABLE_EDGES_HIERARCHY][COLUMN_SOURCE_ID].str.split(":").str[0]}
+    )
+
+    # the previous inputs: some current rows are added since, some previous rows are removed since
+    random_generator = np.random.default_rng(seed=0)
+    previous_tables = dict(current_tables)
+    delta_tables = {}
+    for table_name in [TABLE_NODES, TABLE_MAPPINGS, TABLE_EDGES_HIERARCHY]:
+        is_added = random_generator.random(len(current_tables[table_name])) < 0.003
+        is_removed = random_generator.random(len(current_tables[table_name])) < 0.002
+        previous_tables[table_name] = current_tables[table_name][~is_added]
+        current_tables[table_name] = current_tables[table_name][~is_removed]
+        delta_tables[table_name] = pd.concat([
+            previous_tables[table_name][is_removed[~is_added]], current_tables[table_name][is_added[~is_removed]]
+        ])
+
+    previous_data_repo = _run_alignment_and_connectivity(
+        input_tables=previous_tables, alignment_config=alignment_config, data_manager=data_manager,
+    )
+    expected_data_repo = _run_alignment_and_connectivity(
+        input_tables=current_tables, alignment_config=alignment_config, data_manager=data_manager,
+    )
+    actual_data_repo = _run_alignment_and_connectivity(
+        input_tables=current_tables,
+        alignment_config=alignment_config,
+        data_manager=data_manager,
+        alignment_delta=AlignmentDelta(
+            nodes=delta_tables[TABLE_NODES],
+            mappings=delta_tables[TABLE_MAPPINGS],
+            edges_hierarchy=delta_tables[TABLE_EDGES_HIERARCHY],
+            merges_aggregated_previous=previous_data_repo.get(TABLE_MERGES_AGGREGATED).dataframe,
+            edges_hierarchy_post_previous=previous_data_repo.get(TABLE_EDGES_HIERARCHY_POST).dataframe,
+        ),
+    )
+
+    assert len(actual_data_repo.get(TABLE_NODES_REALIGNED).dataframe) < len(current_tables[TABLE_NODES])
+    pd.testing.assert_frame_equal(
+        actual_data_repo.get(TABLE_MERGES_AGGREGATED).dataframe.reset_index(drop=True),
+        expected_data_repo.get(TABLE_MERGES_AGGREGATED).dataframe.reset_index(drop=True),
+    )
+    pd.testing.assert_frame_equal(
+        actual_data_repo.get(TABLE_EDGES_HIERARCHY_POST).dataframe
+        .sort_values(SCHEMA_HIERARCHY_EDGE_TABLE, ignore_index=True),
+        expected_data_repo.get(TABLE_EDGES_HIERARCHY_POST).dataframe
+        .sort_values(SCHEMA_HIERARCHY_EDGE_TABLE, ignore_index=True),
+    )
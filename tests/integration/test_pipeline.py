@@ -8,6 +8,7 @@ import pandas as pd
 import pytest
 
 from onto_merger.data.constants import (
+    DIRECTORY_CHECKPOINTS,
     DIRECTORY_DOMAIN_ONTOLOGY,
     DIRECTORY_INTERMEDIATE,
     DIRECTORY_OUTPUT,
@@ -82,6 +83,20 @@ def test_run_alignment_and_connection_process():
     perform_evaluation_for_pipeline_run()
 
 
+def test_run_alignment_and_connection_process_resume():
+    assert os.path.exists(TEST_FOLDER_OUTPUT_PATH) is False
+
+    Pipeline(project_folder_path=TEST_FOLDER_PATH).run_alignment_and_connection_process()
+    merges_path = os.path.join(TEST_FOLDER_OUTPUT_PATH, DIRECTORY_INTERMEDIATE, "merges_aggregated.csv")
+    merges_modified_time = os.path.getmtime(merges_path)
+
+    # all stages are completed with the same inputs, so none is run again
+    Pipeline(project_folder_path=TEST_FOLDER_PATH, resume=True).run_alignment_and_connection_process()
+    assert os.path.getmtime(merges_path) == merges_modified_time
+
+    perform_evaluation_for_pipeline_run()
+
+
 def test_run_alignment_and_connection_process_invalid():
     test_folder_invalid = os.path.abspath("../test_data_invalid")
     test_folder_invalid_output = os.path.abspath(f"../test_data_invalid/{DIRECTORY_OUTPUT}")
@@ -91,6 +106,7 @@ def test_run_alignment_and_connection_process_invalid():
 
     assert os.path.exists(test_folder_invalid_output) is True
     expected_outputs = {
+        DIRECTORY_CHECKPOINTS,
         DIRECTORY_DOMAIN_ONTOLOGY,
         DIRECTORY_INTERMEDIATE,
         DIRECTORY_REPORT,
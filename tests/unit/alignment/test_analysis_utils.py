@@ -5,7 +5,8 @@ from pandas import DataFrame
 
 from onto_merger.analyser import analysis_utils
 from onto_merger.analyser.analysis_utils import get_namespace_column_name_for_column
-from onto_merger.data.constants import COLUMN_DEFAULT_ID
+from onto_merger.data.constants import COLUMN_DEFAULT_ID, TABLE_NODES
+from onto_merger.data.dataclasses import NamedTable
 
 
 def test_filter_nodes_for_namespace():
@@ -17,6 +18,14 @@ def test_filter_nodes_for_namespace():
             get_namespace_column_name_for_column(COLUMN_DEFAULT_ID),
         ],
     )
-    actual = analysis_utils.filter_nodes_for_namespace(nodes=input_nodes, namespace="MONDO")
+    nodes = NamedTable(name=TABLE_NODES, dataframe=input_nodes)
+    actual = analysis_utils.filter_nodes_for_namespace(nodes=nodes, namespace="MONDO")
     assert isinstance(actual, DataFrame)
     assert np.array_equal(actual.values, expected.values) is True
+
+    # the namespaces are memoised by the table, its dataframe is not changed
+    namespaces = nodes.get_column(column_name=get_namespace_column_name_for_column(COLUMN_DEFAULT_ID))
+    assert analysis_utils.filter_nodes_for_namespace(nodes=nodes, namespace="SNOMED")[COLUMN_DEFAULT_ID].tolist() \
+        == ["SNOMED:001"]
+    assert nodes.get_column(column_name=get_namespace_column_name_for_column(COLUMN_DEFAULT_ID)) is namespaces
+    assert list(nodes.dataframe) == [COLUMN_DEFAULT_ID]
@@ -0,0 +1,58 @@
+"""Tests for the delta_utils."""
+import pandas as pd
+
+from onto_merger.alignment import delta_utils
+from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
+    COLUMN_PROVENANCE,
+    COLUMN_RELATION,
+    COLUMN_SOURCE_ID,
+    COLUMN_TARGET_ID,
+    ONTO_MERGER,
+)
+
+
+def test_get_node_ids_in_components_of_node_ids():
+    mappings = pd.DataFrame(
+        [("A:1", "B:1"), ("B:1", "C:1"), ("A:2", "B:2")], columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID]
+    )
+    merges = pd.DataFrame([("B:2", "C:2"), ("A:3", "C:3")], columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID])
+    actual = delta_utils.get_node_ids_in_components_of_node_ids(
+        edge_tables=[mappings, merges], node_ids=pd.Series(["C:2", "D:1"])
+    )
+    assert sorted(actual.tolist()) == ["A:2", "B:2", "C:2", "D:1"]
+
+
+def test_produce_nodes_before_delta():
+    nodes = pd.DataFrame({COLUMN_DEFAULT_ID: ["A:1", "A:2", "B:1"]})
+    nodes_delta = pd.DataFrame({COLUMN_DEFAULT_ID: ["A:2", "B:2"]})
+    actual = delta_utils.produce_nodes_before_delta(nodes=nodes, nodes_delta=nodes_delta)
+    assert actual[COLUMN_DEFAULT_ID].tolist() == ["A:1", "B:1", "B:2"]
+
+
+def test_produce_table_merges_aggregated_with_delta():
+    merges_aggregated_previous = pd.DataFrame(
+        [("B:1", "A:1"), ("C:1", "A:1"), ("C:2", "B:2")], columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID]
+    )
+    merges_aggregated_realigned = pd.DataFrame([("C:1", "B:1")], columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID])
+    actual = delta_utils.produce_table_merges_aggregated_with_delta(
+        merges_aggregated_previous=merges_aggregated_previous,
+        merges_aggregated_realigned=merges_aggregated_realigned,
+        realigned_node_ids=pd.Index(["A:1", "B:1", "C:1"]),
+    )
+    assert actual.values.tolist() == [["C:1", "B:1"], ["C:2", "B:2"]]
+
+
+def test_produce_table_hierarchy_edges_with_delta():
+    columns = [COLUMN_SOURCE_ID, COLUMN_TARGET_ID, COLUMN_RELATION, COLUMN_PROVENANCE]
+    edges_hierarchy_post_previous = pd.DataFrame(
+        [("A:1", "A:0", "sub", "A"), ("B:1", "A:1", "sub", ONTO_MERGER), ("B:2", "A:1", "sub", ONTO_MERGER)],
+        columns=columns,
+    )
+    edges_hierarchy_reconnected = pd.DataFrame([("B:1", "A:0", "sub", ONTO_MERGER)], columns=columns)
+    actual = delta_utils.produce_table_hierarchy_edges_with_delta(
+        edges_hierarchy_post_previous=edges_hierarchy_post_previous,
+        edges_hierarchy_reconnected=edges_hierarchy_reconnected,
+        reconnected_node_ids=pd.Index(["B:1", "A:0"]),
+    )
+    assert actual[[COLUMN_SOURCE_ID, COLUMN_TARGET_ID]].values.tolist() == [["B:2", "A:1"], ["B:1", "A:0"]]
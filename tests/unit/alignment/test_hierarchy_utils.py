@@ -4,8 +4,19 @@ import pytest
 from pandas import DataFrame
 
 from onto_merger.alignment import hierarchy_utils
-from onto_merger.data.constants import COLUMN_DEFAULT_ID, SCHEMA_HIERARCHY_EDGE_TABLE
+from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
+    COLUMN_SOURCE_ID,
+    COLUMN_TARGET_ID,
+    CONNECTIVITY_MODE_NEAREST_TERMINUS,
+    CONNECTIVITY_MODE_ROOT_PATH,
+    SCHEMA_HIERARCHY_EDGE_TABLE,
+    SCHEMA_MERGE_TABLE,
+    TABLE_NODES,
+    TABLE_NODES_UNMAPPED,
+)
 from onto_merger.data.dataclasses import NamedTable
+from tests.fixtures import data_manager
 
 
 @pytest.fixture()
@@ -21,7 +32,9 @@ def example_hierarchy_edges():
 
 
 def test_produce_seed_ontology_hierarchy_table(example_hierarchy_edges):
-    nodes = pd.DataFrame(["MONDO:001", "MONDO:002", "MONDO:003"], columns=[COLUMN_DEFAULT_ID])
+    nodes = NamedTable(
+        name=TABLE_NODES, dataframe=pd.DataFrame(["MONDO:001", "MONDO:002", "MONDO:003"], columns=[COLUMN_DEFAULT_ID])
+    )
     actual = hierarchy_utils._produce_table_seed_ontology_hierarchy(
         seed_ontology_name="MONDO",
         nodes=nodes,
@@ -52,3 +65,50 @@ def test_produce_table_nodes_dangling():
     assert isinstance(actual, NamedTable)
     assert isinstance(actual.dataframe, DataFrame)
     assert np.array_equal(actual.dataframe.values, expected.values) is True
+
+
+@pytest.mark.parametrize(
+    "connectivity_mode, expected_edges",
+    [
+        (
+            CONNECTIVITY_MODE_ROOT_PATH,
+            [("FOO:1", "FOO:2"), ("FOO:2", "MONDO:2"), ("FOO:5", "FOO:6"), ("FOO:6", "MONDO:2")],
+        ),
+        (
+            CONNECTIVITY_MODE_NEAREST_TERMINUS,
+            [("FOO:1", "MONDO:1"), ("FOO:2", "MONDO:2"), ("FOO:5", "FOO:6"), ("FOO:6", "MONDO:2")],
+        ),
+    ],
+)
+def test_produce_hierarchy_edges_for_unmapped_nodes(data_manager, connectivity_mode, expected_edges):
+    hierarchy_edges = pd.DataFrame(
+        [
+            ("FOO:1", "FOO:2", "sub", "FOO"),
+            ("FOO:2", "FOO:3", "sub", "FOO"),
+            ("FOO:1", "FOO:4", "sub", "FOO"),
+            ("FOO:4", "FOO:5", "sub", "FOO"),
+            ("FOO:5", "FOO:6", "sub", "FOO"),
+            ("FOO:6", "FOO:3", "sub", "FOO"),
+        ],
+        columns=SCHEMA_HIERARCHY_EDGE_TABLE,
+    )
+    merges = pd.DataFrame([("FOO:4", "MONDO:1"), ("FOO:3", "MONDO:2")], columns=SCHEMA_MERGE_TABLE)
+    unmapped_nodes = NamedTable(
+        name=TABLE_NODES_UNMAPPED,
+        dataframe=pd.DataFrame(["FOO:1", "FOO:2", "FOO:5", "FOO:6"], columns=[COLUMN_DEFAULT_ID]),
+    )
+
+    actual, connectivity_steps = hierarchy_utils.HierarchyManager(
+        data_manager=data_manager
+    )._produce_hierarchy_edges_for_unmapped_nodes(
+        unmapped_nodes=unmapped_nodes,
+        merges=merges,
+        source_alignment_order=["MONDO", "FOO"],
+        hierarchy_edges=hierarchy_edges,
+        connectivity_mode=connectivity_mode,
+    )
+    assert isinstance(actual, DataFrame)
+    actual_edges = sorted(set(zip(actual[COLUMN_SOURCE_ID], actual[COLUMN_TARGET_ID])))
+    assert actual_edges == expected_edges
+    assert len(connectivity_steps) == 1
+    assert connectivity_steps[0].count_reachable_unmapped_nodes == 4
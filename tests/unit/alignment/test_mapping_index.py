@@ -0,0 +1,39 @@
+"""Tests for the mapping index class."""
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from onto_merger.alignment.mapping_index import MappingIndex
+from onto_merger.data.constants import SCHEMA_MAPPING_TABLE
+
+
+def test_mapping_index():
+    # input
+    input_mappings = pd.DataFrame(
+        [
+            ("MONDO:0000123", "FOOBAR:0000004", "equivalent_to", "MONDO"),
+            ("UMLS:0000005", "SNOMED:0000456", "equivalent_to", "MONDO"),
+            ("SNOMED:0000789", "MONDO:0000456", "xref", "MONDO"),
+            ("MONDO:0000001", "MONDO:0000002", "equivalent_to", "MONDO"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+    mapping_index = MappingIndex(mappings=input_mappings)
+
+    # run
+    actual = mapping_index.get_mappings_for_namespace(namespace="MONDO")
+    actual_missing = mapping_index.get_mappings_for_namespace(namespace="FOO")
+
+    # evaluate
+    expected = pd.DataFrame(
+        [
+            ("MONDO:0000123", "FOOBAR:0000004", "equivalent_to", "MONDO"),
+            ("SNOMED:0000789", "MONDO:0000456", "xref", "MONDO"),
+            ("MONDO:0000001", "MONDO:0000002", "equivalent_to", "MONDO"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+    assert isinstance(actual, DataFrame)
+    assert np.array_equal(actual.values, expected.values) is True
+    assert list(actual_missing) == SCHEMA_MAPPING_TABLE
+    assert len(actual_missing) == 0
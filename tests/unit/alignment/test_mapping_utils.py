@@ -10,7 +10,11 @@ from onto_merger.data.constants import (
     COLUMN_SOURCE_ID,
     COLUMN_TARGET_ID,
     SCHEMA_MAPPING_TABLE,
+    TABLE_MAPPINGS,
+    TABLE_NODES,
 )
+from onto_merger.data.dataclasses import NamedTable
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
 
 
 def test_get_mappings_internal_node_reassignment():
@@ -22,7 +26,9 @@ def test_get_mappings_internal_node_reassignment():
         ],
         columns=SCHEMA_MAPPING_TABLE,
     )
-    actual = mapping_utils.get_mappings_internal_node_reassignment(mappings=input_mappings)
+    actual = mapping_utils.get_mappings_internal_node_reassignment(
+        mappings=NamedTable(name=TABLE_MAPPINGS, dataframe=input_mappings)
+    )
     data = [
         ("MONDO:0000004", "MONDO:0000123", "equivalent_to", "MONDO"),
         ("MONDO:0000005", "MONDO:0000456", "equivalent_to", "MONDO"),
@@ -44,7 +50,7 @@ def test_get_mappings_obsolete_to_current_node_id():
     )
     actual = mapping_utils.get_mappings_obsolete_to_current_node_id(
         nodes_obsolete=input_nodes_obsolete,
-        mappings=input_mappings
+        mappings=NamedTable(name=TABLE_MAPPINGS, dataframe=input_mappings)
     )
     data = [
         ("MONDO:0000123", "MONDO:0000004", "equivalent_to", "MONDO"),
@@ -253,6 +259,58 @@ def test_filter_mappings_for_node_set():
     assert np.array_equal(actual.values, expected.values) is True
 
 
+def test_filter_mappings_for_alignment_inputs():
+    input_mappings = pd.DataFrame(
+        [
+            ("SNOMED:001", "MONDO:0000123", "equivalent_to", "TEST"),
+            ("SNOMED:001", "MONDO:0000123", "related_to", "TEST"),
+            ("SNOMED:002", "MONDO:0000123", "equivalent_to", "TEST"),
+            ("MONDO:0000456", "MONDO:0000789", "equivalent_to", "TEST"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+    expected = pd.DataFrame(
+        [
+            ("SNOMED:001", "MONDO:0000123", "equivalent_to", "TEST"),
+            ("MONDO:0000456", "MONDO:0000789", "equivalent_to", "TEST"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+    actual = mapping_utils.filter_mappings_for_alignment_inputs(
+        mappings=input_mappings,
+        permitted_mapping_relations=["equivalent_to"],
+        input_node_id_index=pd.Index(["SNOMED:001", "MONDO:0000123", "MONDO:0000789"]),
+        obsolete_node_id_index=pd.Index(["MONDO:0000456"]),
+    )
+    assert isinstance(actual, DataFrame)
+    assert np.array_equal(actual.values, expected.values) is True
+
+
+def test_filter_mappings_for_unmapped_nodes():
+    # codes: FOOBAR:1234, MONDO:0000123, MONDO:0000234, SNOMED:001, SNOMED:002
+    input_node_id_dictionary = NodeIdDictionary(
+        node_ids=pd.Series(["SNOMED:001", "SNOMED:002", "FOOBAR:1234", "MONDO:0000123", "MONDO:0000234"])
+    )
+    input_is_node_unmapped = np.array([True, False, False, True, False])
+    input_mappings = pd.DataFrame(
+        [
+            ("SNOMED:001", "MONDO:0000123", "foo", "TEST"),
+            ("SNOMED:002", "MONDO:0000234", "foo", "TEST"),
+            ("SNOMED:003", "MONDO:0000345", "foo", "TEST"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+    expected = pd.DataFrame(
+        [("SNOMED:001", "MONDO:0000123", "foo", "TEST")],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+    actual = mapping_utils.filter_mappings_for_unmapped_nodes(
+        node_id_dictionary=input_node_id_dictionary, is_node_unmapped=input_is_node_unmapped, mappings=input_mappings
+    )
+    assert isinstance(actual, DataFrame)
+    assert np.array_equal(actual.values, expected.values) is True
+
+
 def test_deduplicate_mappings_for_type_group():
     input_mappings = pd.DataFrame(
         [
@@ -291,7 +349,7 @@ def test_produce_self_merges_for_seed_nodes():
 
     # run
     actual = mapping_utils.produce_self_merges_for_seed_nodes(
-        seed_id="MONDO", nodes=nodes, nodes_obsolete=nodes_obsolete
+        seed_id="MONDO", nodes=NamedTable(name=TABLE_NODES, dataframe=nodes), nodes_obsolete=nodes_obsolete
     ).dataframe
 
     # expected
@@ -307,3 +365,33 @@ def test_produce_self_merges_for_seed_nodes():
     # evaluate
     assert isinstance(actual, DataFrame)
     assert np.array_equal(actual.values, expected.values) is True
+
+
+def test_produce_candidate_mappings_for_source():
+    # input
+    input_mappings = pd.DataFrame(
+        [
+            ("MONDO:0000123", "FOOBAR:0000004", "equivalent_to", "MONDO"),
+            ("FOOBAR:0000004", "MONDO:0000123", "exact_match", "MONDO"),
+            ("FOOBAR:0000005", "MONDO:0000456", "xref", "MONDO"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+
+    # run
+    actual = mapping_utils.produce_candidate_mappings_for_source(
+        source_id="MONDO",
+        mapping_type_group_name="equivalence",
+        mapping_types=["equivalent_to", "exact_match"],
+        mappings_for_ns=input_mappings,
+    )
+
+    # expected
+    expected = pd.DataFrame(
+        [("FOOBAR:0000004", "MONDO:0000123", "equivalence", "MONDO")],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+
+    # evaluate
+    assert isinstance(actual, DataFrame)
+    assert np.array_equal(actual.values, expected.values) is True
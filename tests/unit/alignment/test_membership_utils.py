@@ -0,0 +1,102 @@
+"""Tests for the membership_utils."""
+import timeit
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from onto_merger.alignment import membership_utils
+from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
+    COLUMN_SOURCE_ID,
+    COLUMN_TARGET_ID,
+    SCHEMA_MAPPING_TABLE,
+)
+
+
+def test_produce_node_id_index():
+    actual = membership_utils.produce_node_id_index(node_ids=pd.Series(["FOO:1", "BAR:1", "FOO:1"]))
+    assert isinstance(actual, pd.Index)
+    assert actual.tolist() == ["FOO:1", "BAR:1"]
+
+
+def test_is_node_id_in_index():
+    node_id_index = membership_utils.produce_node_id_index(node_ids=pd.Series(["FOO:1", "BAR:1"]))
+    actual = membership_utils.is_node_id_in_index(
+        node_ids=pd.Series(["BAR:1", "BAZ:1", "FOO:1"]), node_id_index=node_id_index
+    )
+    assert actual.tolist() == [True, False, True]
+
+
+def test_filter_table_for_node_ids():
+    # input
+    input_mappings = pd.DataFrame(
+        [
+            ("FOO:1", "BAR:1", "equivalent_to", "MONDO"),
+            ("FOO:1", "BAZ:1", "equivalent_to", "MONDO"),
+            ("BAZ:1", "BAZ:2", "equivalent_to", "MONDO"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+    node_id_index = membership_utils.produce_node_id_index(node_ids=pd.Series(["FOO:1", "BAR:1"]))
+
+    # run
+    actual_members = membership_utils.filter_table_for_node_ids(
+        table=input_mappings, node_id_index=node_id_index, node_id_columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID]
+    )
+    actual_non_members = membership_utils.filter_table_for_node_ids(
+        table=input_mappings, node_id_index=node_id_index, node_id_columns=[COLUMN_SOURCE_ID], is_member=False
+    )
+
+    # evaluate
+    assert actual_members.index.tolist() == [0]
+    assert actual_non_members.index.tolist() == [2]
+
+
+@pytest.fixture()
+def large_filter_inputs() -> Tuple[pd.DataFrame, pd.DataFrame]:
+    rng = np.random.default_rng(seed=0)
+    nodes = pd.DataFrame({COLUMN_DEFAULT_ID: [f"FOO:{i}" for i in range(200_000)]})
+    mappings = pd.DataFrame(
+        {
+            COLUMN_SOURCE_ID: [f"FOO:{i}" for i in rng.integers(0, 400_000, 200_000)],
+            COLUMN_TARGET_ID: [f"FOO:{i}" for i in rng.integers(0, 400_000, 200_000)],
+        }
+    )
+    return nodes, mappings
+
+
+def _run_query(nodes: pd.DataFrame, mappings: pd.DataFrame) -> pd.DataFrame:
+    # the node ID list local (as previously passed to the query at each call site)
+    return mappings.query(
+        f"({COLUMN_SOURCE_ID} == @node_ids) and ({COLUMN_TARGET_ID} == @node_ids)",
+        local_dict={"node_ids": list(nodes[COLUMN_DEFAULT_ID])},
+        inplace=False,
+    )
+
+
+def _run_filter(node_id_index: pd.Index, mappings: pd.DataFrame) -> pd.DataFrame:
+    # the node ID index is built once and reused
+    return membership_utils.filter_table_for_node_ids(
+        table=mappings, node_id_index=node_id_index, node_id_columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID]
+    )
+
+
+def test_filter_table_for_node_ids_large(large_filter_inputs: Tuple[pd.DataFrame, pd.DataFrame]):
+    nodes, mappings = large_filter_inputs
+    node_id_index = membership_utils.produce_node_id_index(node_ids=nodes[COLUMN_DEFAULT_ID])
+    actual = _run_filter(node_id_index=node_id_index, mappings=mappings)
+    assert len(actual) > 0
+    assert actual.equals(_run_query(nodes=nodes, mappings=mappings))
+
+
+@pytest.mark.benchmark
+def test_filter_table_for_node_ids_benchmark(large_filter_inputs: Tuple[pd.DataFrame, pd.DataFrame]):
+    nodes, mappings = large_filter_inputs
+    node_id_index = membership_utils.produce_node_id_index(node_ids=nodes[COLUMN_DEFAULT_ID])
+    time_query = min(timeit.repeat(lambda: _run_query(nodes=nodes, mappings=mappings), number=1, repeat=5))
+    time_filter = min(
+        timeit.repeat(lambda: _run_filter(node_id_index=node_id_index, mappings=mappings), number=1, repeat=5)
+    )
+    assert time_filter < time_query
@@ -0,0 +1,28 @@
+"""Tests for the merge log class."""
+
+import pandas as pd
+
+from onto_merger.alignment.merge_log import MergeLog
+from onto_merger.data.constants import (
+    SCHEMA_EDGE_SOURCE_TO_TARGET_IDS,
+    SCHEMA_MERGE_TABLE_WITH_META_DATA,
+    TABLE_MERGES_WITH_META_DATA,
+)
+
+
+def test_merge_log():
+    merge_log = MergeLog()
+    actual_empty = merge_log.produce_named_table_merges()
+    assert actual_empty.name == TABLE_MERGES_WITH_META_DATA
+    assert list(actual_empty.dataframe) == SCHEMA_MERGE_TABLE_WITH_META_DATA
+    assert len(actual_empty.dataframe) == 0
+
+    merge_log.append(merges=pd.DataFrame([("A:1", "B:1"), ("C:1", "B:1")], columns=SCHEMA_EDGE_SOURCE_TO_TARGET_IDS))
+    merge_log.append(merges=pd.DataFrame([("D:1", "B:1"), ("A:1", "B:1")], columns=SCHEMA_EDGE_SOURCE_TO_TARGET_IDS))
+
+    # most recent merges first, without duplicates
+    actual = merge_log.produce_named_table_merges().dataframe
+    assert actual.values.tolist() == [["D:1", "B:1"], ["A:1", "B:1"], ["C:1", "B:1"]]
+
+    merge_log.clear()
+    assert len(merge_log.produce_named_table_merges().dataframe) == 0
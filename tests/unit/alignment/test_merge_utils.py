@@ -17,6 +17,7 @@ from onto_merger.data.constants import (
     TABLE_NODES_MERGED,
 )
 from onto_merger.data.dataclasses import NamedTable
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
 
 
 @pytest.fixture()
@@ -42,25 +43,41 @@ def test_aggregate_merges(example_merges):
     assert isinstance(actual, DataFrame)
     assert np.array_equal(actual.values, expected.values) is True
 
-
-def test_get_canonical_node_for_merge_cluster():
-    # canonical exits
-    canonical_node = "C:1"
-    input_cluster = ["A:1", "B:1", canonical_node]
-    input_alignment_priority_order = ["C", "B", "A"]
-    actual = merge_utils._get_canonical_node_for_merge_cluster(
-        merge_cluster=input_cluster,
-        alignment_priority_order=input_alignment_priority_order,
+    # with a node ID dictionary that covers more node IDs than the merges
+    actual_with_dictionary = merge_utils._produce_named_table_aggregated_merges(
+        merges=example_merges,
+        alignment_priority_order=alignment_priority_order,
+        node_id_dictionary=NodeIdDictionary(node_ids=pd.Series(["F:1", "E:2", "D:2", "C:1", "B:1", "A:1"])),
+    ).dataframe
+    assert np.array_equal(actual_with_dictionary.values, expected.values) is True
+
+
+def test_get_canonical_node_codes_for_merge_clusters():
+    # nodes: "A:1", "B:1", "C:1", "X:1", "X:2"; clusters {A:1, B:1, C:1} and {X:1, X:2}
+    node_namespace_codes = np.array([0, 1, 2, 3, 3])
+    namespaces = pd.Index(["A", "B", "C", "X"])
+    merge_clusters = np.array([0, 0, 0, 3, 3])
+    merge_source_node_codes = np.array([0, 1, 3])
+
+    # canonical exists for the first cluster, cannot be found for the second
+    actual = merge_utils._get_canonical_node_codes_for_merge_clusters(
+        node_namespace_codes=node_namespace_codes,
+        namespaces=namespaces,
+        merge_clusters=merge_clusters,
+        merge_source_node_codes=merge_source_node_codes,
+        alignment_priority_order=["C", "B", "A"],
     )
-    assert isinstance(actual, str)
-    assert actual == canonical_node
-
-    # canonical cannot be found
-    actual_no_canonical = merge_utils._get_canonical_node_for_merge_cluster(
-        merge_cluster=input_cluster,
-        alignment_priority_order=["X"],
+    assert actual.tolist() == [2, 2, 2, -1, -1]
+
+    # same namespace tie: the node that is only a merge target is preferred
+    actual_same_namespace = merge_utils._get_canonical_node_codes_for_merge_clusters(
+        node_namespace_codes=node_namespace_codes,
+        namespaces=namespaces,
+        merge_clusters=merge_clusters,
+        merge_source_node_codes=merge_source_node_codes,
+        alignment_priority_order=["X", "B", "A"],
     )
-    assert actual_no_canonical is None
+    assert actual_same_namespace.tolist() == [1, 1, 1, 4, 4]
 
 
 def test_produce_named_table_merged_nodes(example_merges):
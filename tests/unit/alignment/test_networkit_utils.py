@@ -1,3 +1,5 @@
+import networkit as nk
+import numpy as np
 import pandas as pd
 
 from onto_merger.alignment.networkit_utils import NetworkitGraph
@@ -34,3 +36,99 @@ def test_get_hierarchy_edge_for_unmapped_node():
     )
     assert isinstance(actual_3, list)
     assert actual_3 == []
+
+
+def test_get_paths_for_nodes():
+    background_knowledge_hierarchy_edges = pd.DataFrame(
+        [
+            ("FOO:001", "FOO:002"),
+            ("FOO:002", "FOO:003"),
+            ("FOO:003", "FOO:004"),
+            ("FOO:001", "FOO:005"),
+            ("FOO:006", "FOO:007"),
+        ],
+        columns=SCHEMA_EDGE_SOURCE_TO_TARGET_IDS)
+    hierarchy_graph = NetworkitGraph(edges=background_knowledge_hierarchy_edges)
+
+    actual = hierarchy_graph.get_paths_for_nodes(
+        node_ids=["FOO:001", "FOO:003", "FOO:006", "FOO:004", "FOO:00345"],
+    )
+    assert isinstance(actual, dict)
+    assert actual == {
+        # shortest path to the nearest root
+        "FOO:001": ["FOO:001", "FOO:005"],
+        "FOO:003": ["FOO:003", "FOO:004"],
+        "FOO:006": ["FOO:006", "FOO:007"],
+        # no path: root node
+        "FOO:004": [],
+        # no path: no edges for input node ID
+        "FOO:00345": [],
+    }
+
+
+def test_get_paths_to_nearest_terminus():
+    background_knowledge_hierarchy_edges = pd.DataFrame(
+        [
+            ("FOO:001", "FOO:002"),
+            ("FOO:002", "FOO:003"),
+            ("FOO:003", "FOO:004"),
+            ("FOO:005", "FOO:004"),
+        ],
+        columns=SCHEMA_EDGE_SOURCE_TO_TARGET_IDS)
+    hierarchy_graph = NetworkitGraph(edges=background_knowledge_hierarchy_edges)
+
+    actual = hierarchy_graph.get_paths_to_nearest_terminus(
+        node_ids=["FOO:001", "FOO:002", "FOO:003", "FOO:005"],
+        terminus_node_ids={"FOO:003", "FOO:999"},
+    )
+    assert isinstance(actual, dict)
+    assert actual == {
+        # the path ends at the first terminus instead of the root
+        "FOO:001": ["FOO:001", "FOO:002", "FOO:003"],
+        "FOO:002": ["FOO:002", "FOO:003"],
+        # no path: terminus node
+        "FOO:003": [],
+        # no path: no terminus can be reached
+        "FOO:005": [],
+    }
+
+
+def test_create_networkit_graph(monkeypatch):
+    src_indices = np.array([0, 1, 1, 3])
+    trg_indices = np.array([1, 2, 4, 4])
+    expected_edges = [(0, 1), (1, 2), (1, 4), (3, 4)]
+
+    # bulk construction
+    actual = NetworkitGraph._create_networkit_graph(src_indices=src_indices, trg_indices=trg_indices, node_count=6)
+    assert actual.isDirected() is True
+    assert actual.numberOfNodes() == 6
+    assert sorted(actual.iterEdges()) == expected_edges
+
+    # edge by edge construction (networkit versions without bulk construction)
+    monkeypatch.delattr(nk, "GraphFromCoo")
+    actual = NetworkitGraph._create_networkit_graph(src_indices=src_indices, trg_indices=trg_indices, node_count=6)
+    assert actual.isDirected() is True
+    assert actual.numberOfNodes() == 6
+    assert sorted(actual.iterEdges()) == expected_edges
+
+
+def test_produce_root_nodes():
+    background_knowledge_hierarchy_edges = pd.DataFrame(
+        [
+            ("FOO:001", "FOO:002"),
+            ("FOO:002", "FOO:003"),
+            ("FOO:004", "FOO:003"),
+            # isolated edge: source only and target only node
+            ("BAR:001", "BAR:002"),
+        ],
+        columns=SCHEMA_EDGE_SOURCE_TO_TARGET_IDS)
+    hierarchy_graph = NetworkitGraph(edges=background_knowledge_hierarchy_edges)
+
+    assert sorted(hierarchy_graph.root_nodes) == ["BAR:002", "FOO:003"]
+    assert hierarchy_graph.graph.numberOfNodes() == 6
+    assert hierarchy_graph.graph.numberOfEdges() == 4
+    assert hierarchy_graph.get_paths_for_nodes(node_ids=["BAR:001", "BAR:002", "FOO:004"]) == {
+        "BAR:001": ["BAR:001", "BAR:002"],
+        "BAR:002": [],
+        "FOO:004": ["FOO:004", "FOO:003"],
+    }
@@ -0,0 +1,80 @@
+"""Tests for the alignment shard helper methods."""
+
+import numpy as np
+import pandas as pd
+
+from onto_merger.alignment import mapping_utils, shard_utils
+from onto_merger.data.constants import COLUMN_PROVENANCE, COLUMN_RELATION, COLUMN_SOURCE_ID, COLUMN_TARGET_ID
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
+
+
+def _produce_mappings(source_and_target_ids):
+    return pd.DataFrame(
+        [(source_id, target_id, "eqv", "FOO") for source_id, target_id in source_and_target_ids],
+        columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID, COLUMN_RELATION, COLUMN_PROVENANCE],
+    )
+
+
+def test_produce_node_shards():
+    mappings = _produce_mappings([("A:1", "B:1"), ("B:1", "C:1"), ("A:2", "B:2"), ("A:3", "C:3")])
+    node_id_dictionary = NodeIdDictionary(node_ids=pd.Series(["A:1", "A:2", "A:3", "B:1", "B:2", "C:1", "C:3", "D:1"]))
+    node_shards = shard_utils.produce_node_shards(
+        node_id_dictionary=node_id_dictionary, mappings=mappings, shard_count=2
+    )
+    # the largest component goes to the first shard, the others are dealt back and forth
+    assert node_shards.tolist() == [0, 1, 1, 0, 1, 0, 1, -1]
+
+
+def test_align_shards():
+    steps = [("eqv", "B"), ("eqv", "C")]
+    candidate_mappings = {
+        ("eqv", "B"): _produce_mappings([("A:1", "B:1"), ("A:2", "B:2"), ("A:2", "B:3")]),
+        ("eqv", "C"): _produce_mappings([("A:2", "C:2"), ("B:1", "C:1"), ("A:1", "C:1")]),
+    }
+    node_id_dictionary = NodeIdDictionary.from_tables(tables=list(candidate_mappings.values()))
+    unmapped_node_ids = pd.Series(["A:1", "A:2", "B:1", "B:2", "B:3"])
+
+    # serial run
+    is_node_unmapped = np.zeros(len(node_id_dictionary), dtype=bool)
+    is_node_unmapped[node_id_dictionary.encode(unmapped_node_ids)] = True
+    expected = {}
+    for step in steps:
+        expected[step] = mapping_utils.produce_mappings_for_alignment_step(
+            node_id_dictionary=node_id_dictionary,
+            is_node_unmapped=is_node_unmapped,
+            candidate_mappings=candidate_mappings[step],
+        )
+        is_node_unmapped[node_id_dictionary.encode(expected[step][1][COLUMN_SOURCE_ID])] = False
+
+    # sharded run
+    shard_count = 3
+    node_shards = shard_utils.produce_node_shards(
+        node_id_dictionary=node_id_dictionary,
+        mappings=pd.concat(list(candidate_mappings.values())),
+        shard_count=shard_count,
+    )
+    candidate_mappings_for_shards = {
+        step: shard_utils.split_table_into_shards(
+            table=table, node_id_dictionary=node_id_dictionary, node_shards=node_shards, shard_count=shard_count
+        )
+        for step, table in candidate_mappings.items()
+    }
+    unmapped_node_codes = node_id_dictionary.encode(unmapped_node_ids)
+    shard_step_results = [
+        shard_utils.align_shard(
+            candidate_mappings={step: tables[shard] for step, tables in candidate_mappings_for_shards.items()},
+            unmapped_node_ids=node_id_dictionary.decode(unmapped_node_codes[node_shards[unmapped_node_codes] == shard]),
+            steps=steps,
+        )
+        for shard in range(shard_count)
+    ]
+    for step in steps:
+        count_mappings, merges, dropped_mappings = shard_utils.combine_shard_step_results(
+            candidate_mappings=candidate_mappings[step],
+            step_results=[step_results[step] for step_results in shard_step_results],
+        )
+        assert count_mappings == expected[step][0]
+        pd.testing.assert_frame_equal(merges, expected[step][1])
+        pd.testing.assert_frame_equal(dropped_mappings, expected[step][2])
+    assert expected[("eqv", "B")][1][COLUMN_SOURCE_ID].tolist() == ["A:1"]
+    assert expected[("eqv", "C")][1][COLUMN_SOURCE_ID].tolist() == ["A:2", "B:1"]
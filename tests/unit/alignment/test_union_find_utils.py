@@ -0,0 +1,24 @@
+"""Tests for the union-find helper class."""
+
+import numpy as np
+
+from onto_merger.alignment.union_find_utils import UnionFind
+
+
+def test_union_find():
+    union_find = UnionFind(size=7)
+    union_find.union(nodes_a=np.array([4, 1, 6, 5]), nodes_b=np.array([1, 2, 5, 3]))
+
+    assert union_find.get_components().tolist() == [0, 1, 1, 3, 1, 3, 3]
+    assert union_find.find(nodes=np.array([2, 6])).tolist() == [1, 3]
+
+    # merging two existing components
+    union_find.union(nodes_a=np.array([6]), nodes_b=np.array([4]))
+    assert union_find.get_components().tolist() == [0, 1, 1, 1, 1, 1, 1]
+
+
+def test_union_find_long_chain():
+    size = 1000
+    union_find = UnionFind(size=size)
+    union_find.union(nodes_a=np.arange(1, size), nodes_b=np.arange(0, size - 1))
+    assert (union_find.get_components() == 0).all()
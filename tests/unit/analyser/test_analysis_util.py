@@ -14,7 +14,11 @@ from onto_merger.data.constants import (
     SCHEMA_MAPPING_TABLE,
     SCHEMA_NODE_NAMESPACE_FREQUENCY_TABLE,
 )
-from onto_merger.data.dataclasses import NamedTable
+from onto_merger.data.dataclasses import (
+    NamedTable,
+    RuntimeData,
+    convert_runtime_steps_to_named_table,
+)
 
 
 @pytest.fixture()
@@ -52,6 +56,27 @@ def test_get_namespace_for_node_id():
     assert actual == "FOO"
 
 
+def test_get_namespaces_for_node_ids():
+    actual = analysis_utils.get_namespaces_for_node_ids(
+        node_ids=pd.Series(["FOO:123", "BAR:1:2", "BAZ", "FOO:456", np.nan], index=[5, 4, 3, 2, 1])
+    )
+    assert isinstance(actual, pd.Series)
+    assert actual.tolist() == ["FOO", "BAR", "BAZ", "FOO", "nan"]
+    assert actual.index.tolist() == [5, 4, 3, 2, 1]
+
+
+def test_produce_table_with_namespace_column_for_node_ids_repeated():
+    input_data = pd.DataFrame([("FOO:1", "BAR:1")], columns=[COLUMN_SOURCE_ID, COLUMN_TARGET_ID])
+    table_with_namespaces = analysis_utils.produce_table_with_namespace_column_for_node_ids(table=input_data)
+    actual = analysis_utils.produce_table_with_namespace_column_for_node_ids(table=table_with_namespaces)
+
+    # the input table is not changed, and the namespace columns are reused (not copied)
+    assert list(input_data) == [COLUMN_SOURCE_ID, COLUMN_TARGET_ID]
+    assert list(actual) == list(table_with_namespaces)
+    namespace_column = analysis_utils.get_namespace_column_name_for_column(node_id_column=COLUMN_SOURCE_ID)
+    assert np.shares_memory(actual[namespace_column].values, table_with_namespaces[namespace_column].values)
+
+
 def test_produce_table_with_namespace_column_for_node_ids():
     input_data = pd.DataFrame(
         [("MONDO:0000004", "MONDO:0000123", "equivalent_to", "MONDO")],
@@ -136,6 +161,24 @@ def test_add_namespace_column_to_loaded_tables(
     )
 
 
+def test_get_dataframe_with_namespace_columns(expected_edge_column_with_node_ids_ns_pair: DataFrame):
+    input_data = NamedTable(
+        "FOO",
+        pd.DataFrame(
+            [("MONDO:0000004", "MONDO:0000123", "equivalent_to", "MONDO")],
+            columns=SCHEMA_MAPPING_TABLE,
+        ),
+    )
+    actual = analysis_utils.get_dataframe_with_namespace_columns(table=input_data)
+    assert np.array_equal(actual.values, expected_edge_column_with_node_ids_ns_pair.values) is True
+    assert list(input_data.dataframe) == SCHEMA_MAPPING_TABLE
+
+    # the namespaces are derived once
+    namespace_pairs = input_data.get_column(column_name=COLUMN_SOURCE_TO_TARGET)
+    analysis_utils.get_dataframe_with_namespace_columns(table=input_data)
+    assert input_data.get_column(column_name=COLUMN_SOURCE_TO_TARGET) is namespace_pairs
+
+
 def test_produce_table_node_namespace_distribution():
     input_nodes = pd.DataFrame(["MONDO:0000001", "SNOMED:001", "MONDO:1234"], columns=[COLUMN_DEFAULT_ID])
     expected_1 = pd.DataFrame(
@@ -155,3 +198,17 @@ def test_produce_table_node_namespace_distribution():
     )
     assert isinstance(actual_2, DataFrame)
     assert np.array_equal(actual_2.values, expected_2.values) is True
+
+
+def test_filter_runtime_for_main_steps():
+    runtime = convert_runtime_steps_to_named_table(
+        steps=[
+            RuntimeData(task="ALIGNMENT", start="", end="", elapsed=2.0),
+            RuntimeData(task="PROFILE TABLE nodes", start="", end="", elapsed=3.0),
+            RuntimeData(task="PROFILE TABLE mappings (CACHED)", start="", end="", elapsed=0.5),
+            RuntimeData(task="PROFILING input DATA", start="", end="", elapsed=3.5),
+        ]
+    ).dataframe
+    actual = analysis_utils.filter_runtime_for_main_steps(runtime=runtime)
+    assert actual["task"].tolist() == ["ALIGNMENT", "PROFILING input DATA"]
+    assert actual["elapsed"].sum() == 5.5
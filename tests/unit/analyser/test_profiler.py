@@ -1,5 +1,6 @@
 """Tests for the Profiler class."""
 import os
+import shutil
 
 from pandas_profiling import ProfileReport
 
@@ -19,6 +20,28 @@ def test_profile_tables(data_manager: DataManager):
         assert os.stat(report_path).st_size > 100
 
 
+def test_profile_tables_parallel_with_cache(data_manager: DataManager):
+    data_manager.config.base_config.parallel_profiling = True
+    data_manager.config.base_config.worker_count = 2
+    data_manager.config.base_config.profiling_cache = True
+    tables = data_manager.load_input_tables()[0:2]
+
+    runtime_data = pandas_profiler.profile_tables(tables=tables, data_manager=data_manager)
+    assert sorted(runtime.task for runtime in runtime_data) == sorted(
+        f"PROFILE TABLE {table_name}" for table_name in TABLES_INPUT[0:2]
+    )
+    assert len(os.listdir(data_manager.get_profiling_cache_folder_path())) == 2
+
+    # the unchanged tables are not profiled again
+    runtime_data = pandas_profiler.profile_tables(tables=tables, data_manager=data_manager)
+    assert [runtime.task for runtime in runtime_data] == [
+        f"PROFILE TABLE {table_name} (CACHED)" for table_name in TABLES_INPUT[0:2]
+    ]
+    for table_name in TABLES_INPUT[0:2]:
+        assert os.path.isfile(data_manager.get_profiled_table_report_path(table_name=table_name))
+    shutil.rmtree(os.path.dirname(data_manager.get_profiling_cache_folder_path()))
+
+
 def test_produce_table_report(data_manager: DataManager):
     actual = pandas_profiler.produce_table_report(table=data_manager.load_input_tables()[0])
     assert isinstance(actual, ProfileReport)
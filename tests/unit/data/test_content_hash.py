@@ -0,0 +1,13 @@
+"""Tests for the table content hash."""
+import pandas as pd
+
+from onto_merger.data.constants import COLUMN_SOURCE_ID, COLUMN_TARGET_ID
+from onto_merger.data.content_hash import produce_table_content_hash
+
+
+def test_produce_table_content_hash():
+    table = pd.DataFrame({COLUMN_SOURCE_ID: ["A:1", "A:2"], COLUMN_TARGET_ID: ["B:1", "B:2"]})
+    actual = produce_table_content_hash(table=table)
+    assert actual == produce_table_content_hash(table=table.copy().set_axis([5, 6]))
+    assert actual != produce_table_content_hash(table=table.iloc[::-1])
+    assert actual != produce_table_content_hash(table=table.rename(columns={COLUMN_TARGET_ID: "foo"}))
@@ -1,5 +1,6 @@
 """Tests for the DataManager class."""
 import os
+import shutil
 from pathlib import Path
 
 import numpy as np
@@ -8,6 +9,10 @@ import pytest
 from pandas import DataFrame
 
 from onto_merger.data.constants import (
+    COLUMN_RELATION,
+    COLUMN_SOURCE_ID,
+    COLUMN_STEP_COUNTER,
+    COLUMN_TARGET_ID,
     DIRECTORY_DOMAIN_ONTOLOGY,
     DIRECTORY_DROPPED_MAPPINGS,
     DIRECTORY_INPUT,
@@ -25,9 +30,10 @@ from onto_merger.data.constants import (
     TABLE_MAPPINGS,
     TABLE_MERGES,
     TABLE_MERGES_WITH_META_DATA,
+    TABLES_INPUT,
 )
-from onto_merger.data.data_manager import DataManager
-from onto_merger.data.dataclasses import AlignmentConfig, NamedTable
+from onto_merger.data.data_manager import DataManager, drop_duplicate_rows
+from onto_merger.data.dataclasses import AlignmentConfig, NamedTable, PipelineCheckpoint, RuntimeData
 from tests.fixtures import TEST_FOLDER_OUTPUT_PATH, data_manager
 
 
@@ -48,6 +54,77 @@ def test_load_table(data_manager: DataManager):
     assert len(actual) > 0
 
 
+def test_load_table_dtypes(data_manager: DataManager):
+    data_manager.save_table(
+        table=NamedTable(
+            TABLE_MERGES_WITH_META_DATA,
+            pd.DataFrame(
+                [("MONDO:0000004", "0001", 1, "MONDO", "equivalence")],
+                columns=SCHEMA_MERGE_TABLE_WITH_META_DATA,
+            ),
+        )
+    )
+    actual = data_manager.load_table(
+        table_name=TABLE_MERGES_WITH_META_DATA, process_directory=f"{DIRECTORY_OUTPUT}/{DIRECTORY_INTERMEDIATE}"
+    )
+    assert actual[COLUMN_TARGET_ID].tolist() == ["0001"]
+    assert actual[COLUMN_STEP_COUNTER].dtype == np.int64
+
+
+def test_load_input_tables(data_manager: DataManager):
+    actual = data_manager.load_input_tables()
+    assert [table.name for table in actual] == TABLES_INPUT
+    for table in actual:
+        pd.testing.assert_frame_equal(
+            table.dataframe, data_manager.load_table(table_name=table.name, process_directory=DIRECTORY_INPUT)
+        )
+
+
+def test_load_table_shards(data_manager: DataManager, tmp_path):
+    mappings = data_manager.load_table(table_name=TABLE_MAPPINGS, process_directory=DIRECTORY_INPUT)
+    shutil.copytree(data_manager.get_input_folder_path(), os.path.join(tmp_path, DIRECTORY_INPUT))
+    os.remove(os.path.join(tmp_path, DIRECTORY_INPUT, f"{TABLE_MAPPINGS}.csv"))
+    shard_directory_path = os.path.join(tmp_path, DIRECTORY_INPUT, TABLE_MAPPINGS)
+    os.mkdir(shard_directory_path)
+    mappings.iloc[:100].to_csv(os.path.join(shard_directory_path, "provider_a.csv.gz"), index=False)
+    mappings.iloc[100:].to_csv(os.path.join(shard_directory_path, "provider_b.csv"), index=False)
+    sharded_data_manager = DataManager(project_folder_path=str(tmp_path))
+
+    assert sharded_data_manager.get_table_file_paths(process_directory=DIRECTORY_INPUT, table_name=TABLE_MAPPINGS) == [
+        os.path.join(shard_directory_path, "provider_a.csv.gz"),
+        os.path.join(shard_directory_path, "provider_b.csv"),
+    ]
+    pd.testing.assert_frame_equal(
+        sharded_data_manager.load_table(table_name=TABLE_MAPPINGS, process_directory=DIRECTORY_INPUT), mappings
+    )
+    assert sharded_data_manager.get_table_shape(
+        table_name=TABLE_MAPPINGS, process_directory=DIRECTORY_INPUT
+    ) == mappings.shape
+
+
+def test_load_input_tables_with_mapping_chunks(data_manager: DataManager):
+    mappings = data_manager.load_table(table_name=TABLE_MAPPINGS, process_directory=DIRECTORY_INPUT)
+    data_manager.config.base_config.mapping_chunk_size = 100
+    actual = {table.name: table.dataframe for table in data_manager.load_input_tables()}
+    assert list(actual) == TABLES_INPUT
+    assert 0 < len(actual[TABLE_MAPPINGS]) <= len(mappings)
+    assert actual[TABLE_MAPPINGS][COLUMN_RELATION].isin(data_manager.config.mapping_type_groups.all_mapping_types).all()
+    assert not actual[TABLE_MAPPINGS].duplicated().any()
+
+
+def test_drop_duplicate_rows():
+    table = pd.DataFrame(
+        {
+            COLUMN_SOURCE_ID: ["A:1", "A:2", "A:1", np.nan, np.nan, "A:1"],
+            COLUMN_TARGET_ID: ["B:1", "B:2", "B:1", np.nan, np.nan, "B:2"],
+        },
+        index=[5, 4, 3, 2, 1, 0],
+    )
+    actual = drop_duplicate_rows(df=table)
+    pd.testing.assert_frame_equal(actual, table.drop_duplicates(keep="first", ignore_index=True))
+    assert len(actual) == 4
+
+
 def test_convert_config_json_to_dataclass(data_manager: DataManager):
     config_json_dic = {
         "domain_node_type": "Disease",
@@ -162,6 +239,58 @@ def test_save_dropped_mappings_table(data_manager: DataManager):
     )
 
 
+def test_produce_input_fingerprint(data_manager: DataManager):
+    actual = data_manager.produce_input_fingerprint()
+    assert actual == data_manager.produce_input_fingerprint()
+    assert actual != data_manager.produce_input_fingerprint(incremental=True)
+
+
+def test_save_and_load_checkpoint(data_manager: DataManager, loaded_table_mappings: NamedTable):
+    assert data_manager.load_checkpoint(fingerprints=["foo"]) is None
+    data_manager.save_checkpoint(
+        checkpoint=PipelineCheckpoint(
+            stage="align_nodes",
+            fingerprint="foo",
+            tables=[loaded_table_mappings],
+            alignment_priority_order=["MONDO", "ORPHANET"],
+            runtime_data=[RuntimeData(task="ALIGNMENT", start="", end="", elapsed=1.0)],
+        )
+    )
+    assert data_manager.load_checkpoint(fingerprints=["bar"]) is None
+    actual = data_manager.load_checkpoint(fingerprints=["bar", "foo"])
+    assert actual is not None
+    assert actual.stage == "align_nodes"
+    assert actual.alignment_priority_order == ["MONDO", "ORPHANET"]
+    assert actual.runtime_data[0].task == "ALIGNMENT"
+    pd.testing.assert_frame_equal(actual.tables[0].dataframe, loaded_table_mappings.dataframe)
+
+
+def test_reset_output_directory(data_manager: DataManager, loaded_table_mappings: NamedTable):
+    data_manager.save_table(table=loaded_table_mappings)
+    table_path = data_manager.get_table_path(
+        process_directory=f"{DIRECTORY_OUTPUT}/{DIRECTORY_INTERMEDIATE}", table_name=TABLE_MAPPINGS
+    )
+    assert os.path.isfile(table_path)
+    data_manager.save_checkpoint(
+        checkpoint=PipelineCheckpoint(
+            stage="align_nodes",
+            fingerprint="foo",
+            tables=[loaded_table_mappings],
+            alignment_priority_order=[],
+            runtime_data=[],
+        )
+    )
+    log_file_path = data_manager.get_log_file_path()
+    Path(log_file_path).write_text("foo")
+
+    data_manager.reset_output_directory()
+    assert data_manager.load_checkpoint(fingerprints=["foo"]) is None
+    assert os.path.exists(table_path) is False
+    assert os.path.isdir(data_manager.get_analysis_folder_path())
+    assert os.path.isdir(data_manager.get_domain_ontology_folder_path())
+    assert Path(log_file_path).read_text() == "foo"
+
+
 def test_merge_tables(loaded_table_mappings: NamedTable):
     table_2 = NamedTable(
         TABLE_MAPPINGS,
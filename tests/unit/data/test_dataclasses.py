@@ -3,9 +3,13 @@ from typing import List
 
 import numpy as np
 import pandas as pd
+import pytest
 from pandas import DataFrame
 
 from onto_merger.data.constants import (
+    COLUMN_DEFAULT_ID,
+    COLUMN_MAPPING_HASH,
+    COLUMN_SOURCE_TO_TARGET,
     SCHEMA_ALIGNMENT_STEPS_TABLE,
     SCHEMA_DATA_REPO_SUMMARY,
     SCHEMA_MAPPING_TABLE,
@@ -126,3 +130,39 @@ def test_convert_alignment_steps_to_named_table():
     assert actual.name == TABLE_ALIGNMENT_STEPS_REPORT
     assert isinstance(actual.dataframe, DataFrame)
     assert np.array_equal(actual.dataframe[SCHEMA_NO_DATES].values, expected[SCHEMA_NO_DATES].values) is True
+
+
+def test_named_table_derived_columns():
+    table = NamedTable(
+        name="foo",
+        dataframe=pd.DataFrame([("FOO:2", "BAR:1", "equivalent_to", "MONDO")], columns=SCHEMA_MAPPING_TABLE),
+    )
+    assert table.get_derivable_column_names() == [
+        "namespace_source_id", "namespace_target_id", COLUMN_SOURCE_TO_TARGET, COLUMN_MAPPING_HASH
+    ]
+
+    # produced on first access and memoised, the dataframe is not changed
+    actual_pair = table.get_column(column_name=COLUMN_SOURCE_TO_TARGET)
+    assert actual_pair.tolist() == ["FOO to BAR"]
+    assert table.get_column(column_name=COLUMN_SOURCE_TO_TARGET) is actual_pair
+    assert table.get_column(column_name=COLUMN_MAPPING_HASH).tolist() == ["['BAR:1', 'FOO:2']|equivalent_to|MONDO"]
+    assert list(table.dataframe) == SCHEMA_MAPPING_TABLE
+    with pytest.raises(KeyError):
+        table.get_column(column_name="namespace_default_id")
+
+    # appended and dropped
+    dataframe_with_pair = table.get_dataframe_with_columns(column_names=[COLUMN_SOURCE_TO_TARGET])
+    assert list(dataframe_with_pair) == SCHEMA_MAPPING_TABLE + [COLUMN_SOURCE_TO_TARGET]
+    assert table.get_dataframe_with_columns(column_names=[]) is table.dataframe
+    actual_dropped = NamedTable(name="foo", dataframe=dataframe_with_pair).drop_derived_columns()
+    assert list(actual_dropped.dataframe) == SCHEMA_MAPPING_TABLE
+
+    # reset when the dataframe is replaced
+    table.dataframe = pd.DataFrame([("FOO:2", "BAZ:1", "equivalent_to", "MONDO")], columns=SCHEMA_MAPPING_TABLE)
+    assert table.get_column(column_name=COLUMN_SOURCE_TO_TARGET).tolist() == ["FOO to BAZ"]
+
+
+def test_named_table_existing_column_is_not_derived():
+    dataframe = pd.DataFrame([("FOO:1", "BAR")], columns=[COLUMN_DEFAULT_ID, "namespace_default_id"])
+    table = NamedTable(name="foo", dataframe=dataframe)
+    assert table.get_column(column_name="namespace_default_id").tolist() == ["BAR"]
@@ -0,0 +1,32 @@
+"""Tests for the node ID dictionary class."""
+
+import pandas as pd
+
+from onto_merger.data.constants import COLUMN_DEFAULT_ID, SCHEMA_EDGE_SOURCE_TO_TARGET_IDS
+from onto_merger.data.node_id_dictionary import NodeIdDictionary
+
+
+def test_node_id_dictionary():
+    node_id_dictionary = NodeIdDictionary.from_tables(
+        tables=[
+            pd.DataFrame(["MONDO:2", "FOO:1"], columns=[COLUMN_DEFAULT_ID]),
+            pd.DataFrame([("MONDO:1", "MONDO:2")], columns=SCHEMA_EDGE_SOURCE_TO_TARGET_IDS),
+        ]
+    )
+    assert len(node_id_dictionary) == 3
+
+    # codes follow the sorted node ID order
+    actual_codes = node_id_dictionary.encode(pd.Series(["MONDO:2", "BAR:1", "FOO:1", "MONDO:1"]))
+    assert actual_codes.tolist() == [2, -1, 0, 1]
+    assert node_id_dictionary.decode(node_codes=actual_codes[actual_codes >= 0]).tolist() == [
+        "MONDO:2", "FOO:1", "MONDO:1"
+    ]
+
+    # namespaces
+    actual_namespace_codes = node_id_dictionary.get_namespace_codes(node_codes=actual_codes)
+    assert [node_id_dictionary.namespaces[code] for code in actual_namespace_codes if code >= 0] == [
+        "MONDO", "FOO", "MONDO"
+    ]
+    assert actual_namespace_codes[1] == -1
+    assert node_id_dictionary.get_namespace_code(namespace="MONDO") == actual_namespace_codes[0]
+    assert node_id_dictionary.get_namespace_code(namespace="BAR") == -1
@@ -0,0 +1,61 @@
+"""Tests for the storage backends."""
+import os
+
+import pandas as pd
+import pytest
+
+from onto_merger.data.constants import (
+    COLUMN_PROVENANCE,
+    COLUMN_RELATION,
+    COLUMN_SOURCE_ID,
+    COLUMN_TARGET_ID,
+    SCHEMA_MAPPING_TABLE,
+    STORAGE_FORMAT_ARROW,
+    STORAGE_FORMAT_CSV,
+    STORAGE_FORMAT_PARQUET,
+)
+from onto_merger.data.storage_backends import STORAGE_BACKENDS
+
+
+@pytest.fixture()
+def mappings() -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            ("MONDO:0000004", "MONDO:0000123", "equivalent_to", "MONDO"),
+            ("MONDO:0000005", "MONDO:0000123", "equivalent_to", "MONDO"),
+        ],
+        columns=SCHEMA_MAPPING_TABLE,
+    )
+
+
+@pytest.mark.parametrize("storage_format", [STORAGE_FORMAT_CSV, STORAGE_FORMAT_PARQUET, STORAGE_FORMAT_ARROW])
+def test_storage_backend(storage_format: str, mappings: pd.DataFrame, tmp_path):
+    if storage_format != STORAGE_FORMAT_CSV:
+        pytest.importorskip("pyarrow")
+    storage_backend = STORAGE_BACKENDS[storage_format]
+    file_path = os.path.join(tmp_path, f"mappings.{storage_backend.file_extension}")
+    storage_backend.write(mappings, file_path)
+
+    pd.testing.assert_frame_equal(storage_backend.read(file_path, None, ()), mappings)
+    pd.testing.assert_frame_equal(
+        storage_backend.read(file_path, [COLUMN_SOURCE_ID, COLUMN_TARGET_ID], ()),
+        mappings[[COLUMN_SOURCE_ID, COLUMN_TARGET_ID]],
+    )
+    assert storage_backend.read_shape(file_path) == (2, 4)
+
+
+def test_storage_backend_dictionary_encoding(mappings: pd.DataFrame, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    file_path = os.path.join(tmp_path, "mappings.arrow")
+    STORAGE_BACKENDS[STORAGE_FORMAT_ARROW].write(mappings, file_path)
+    with pa.memory_map(file_path) as source:
+        schema = pa.ipc.open_file(source).schema
+    assert pa.types.is_dictionary(schema.field(COLUMN_SOURCE_ID).type)
+    assert pa.types.is_dictionary(schema.field(COLUMN_TARGET_ID).type)
+    assert not pa.types.is_dictionary(schema.field(COLUMN_RELATION).type)
+
+    file_path = os.path.join(tmp_path, "mappings.parquet")
+    STORAGE_BACKENDS[STORAGE_FORMAT_PARQUET].write(mappings, file_path)
+    assert pa.types.is_dictionary(pq.read_schema(file_path).field(COLUMN_SOURCE_ID).type)
+    assert not pa.types.is_dictionary(pq.read_schema(file_path).field(COLUMN_PROVENANCE).type)
@@ -80,6 +80,7 @@ def test_get_column_set_for_edge_table():
     actual_1 = ge_expectation_helper.get_column_set_for_edge_table(table_name=TABLE_EDGES_HIERARCHY)
     assert isinstance(actual_1, List)
     assert set(actual_1) == set(column_set)
+    assert ge_expectation_helper.get_column_set_for_edge_table(table_name=TABLE_EDGES_HIERARCHY) == actual_1
 
     # DOMAIN
     actual_2 = ge_expectation_helper.get_column_set_for_edge_table(table_name=TABLE_MAPPINGS_DOMAIN)
@@ -1,7 +1,9 @@
 """Tests for the GE runner class."""
 
 import os
+import shutil
 
+from onto_merger.data.constants import VALIDATION_ENGINE_NATIVE
 from onto_merger.data.data_manager import DataManager
 from onto_merger.data.dataclasses import AlignmentConfig
 from onto_merger.data_testing.ge_runner import GERunner
@@ -38,3 +40,94 @@ def test_run_ge_tests(
     assert len(os.listdir(os.path.join(ge_test_folder_path, "checkpoints"))) == 1
     assert len(os.listdir(os.path.join(ge_test_folder_path, "uncommitted/validations"))) > 1
     assert len(os.listdir(os.path.join(ge_test_folder_path, "uncommitted/data_docs/local_site"))) > 1
+
+
+def test_run_ge_tests_parallel(
+        alignment_config: AlignmentConfig,
+        ge_test_folder_path: str,
+        data_manager: DataManager,
+):
+    alignment_config.base_config.parallel_validation = True
+    alignment_config.base_config.worker_count = 2
+    GERunner(
+        alignment_config=alignment_config,
+        ge_base_directory=ge_test_folder_path,
+        data_manager=data_manager
+    ) \
+        .run_ge_tests(
+        named_tables=data_manager.load_input_tables()[0:2],
+        data_origin="FOO"
+    )
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "uncommitted/validations"))) > 2
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "checkpoints"))) == 2
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "uncommitted/data_docs/local_site"))) > 1
+
+
+def test_run_ge_tests_native(
+        alignment_config: AlignmentConfig,
+        ge_test_folder_path: str,
+        data_manager: DataManager,
+):
+    alignment_config.base_config.validation_engine = VALIDATION_ENGINE_NATIVE
+    alignment_config.base_config.data_docs = False
+    GERunner(
+        alignment_config=alignment_config,
+        ge_base_directory=ge_test_folder_path,
+        data_manager=data_manager
+    ) \
+        .run_ge_tests(
+        named_tables=data_manager.load_input_tables()[0:1],
+        data_origin="FOO"
+    )
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "expectations"))) > 1
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "checkpoints"))) == 0
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "uncommitted/validations"))) > 1
+    assert not os.path.exists(os.path.join(ge_test_folder_path, "uncommitted/data_docs/local_site"))
+
+
+def test_run_ge_tests_with_validation_cache(
+        alignment_config: AlignmentConfig,
+        ge_test_folder_path: str,
+        data_manager: DataManager,
+        tmp_path,
+):
+    alignment_config.base_config.validation_cache = True
+    named_tables = data_manager.load_input_tables()[0:1]
+    GERunner(
+        alignment_config=alignment_config,
+        ge_base_directory=ge_test_folder_path,
+        data_manager=data_manager
+    ) \
+        .run_ge_tests(named_tables=named_tables, data_origin="FOO")
+    assert len(os.listdir(data_manager.get_validation_cache_folder_path())) == 1
+
+    # the unchanged table is not validated again, its cached result is used
+    GERunner(
+        alignment_config=alignment_config,
+        ge_base_directory=str(tmp_path),
+        data_manager=data_manager
+    ) \
+        .run_ge_tests(named_tables=named_tables, data_origin="FOO")
+    assert len(os.listdir(os.path.join(tmp_path, "checkpoints"))) == 0
+    assert len(os.listdir(os.path.join(tmp_path, "uncommitted/validations"))) > 1
+    shutil.rmtree(os.path.dirname(data_manager.get_validation_cache_folder_path()))
+
+
+def test_run_ge_tests_reused_runner(
+        alignment_config: AlignmentConfig,
+        ge_test_folder_path: str,
+        data_manager: DataManager,
+):
+    ge_runner = GERunner(
+        alignment_config=alignment_config,
+        ge_base_directory=ge_test_folder_path,
+        data_manager=data_manager
+    )
+    named_tables = data_manager.load_input_tables()[0:2]
+    ge_runner.run_ge_tests(named_tables=named_tables, data_origin="FOO", build_data_docs=False)
+    ge_runner.run_ge_tests(named_tables=named_tables, data_origin="BAR", build_data_docs=False)
+    assert not os.path.exists(os.path.join(ge_test_folder_path, "uncommitted/data_docs/local_site"))
+    ge_runner.build_data_docs()
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "checkpoints"))) == 1
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "uncommitted/validations"))) > 2
+    assert len(os.listdir(os.path.join(ge_test_folder_path, "uncommitted/data_docs/local_site"))) > 1
@@ -1,4 +1,5 @@
 """Tests for the GE utils methods."""
+import pandas as pd
 from great_expectations.data_context import BaseDataContext
 
 from onto_merger.data_testing.ge_utils import (
@@ -8,6 +9,7 @@ from onto_merger.data_testing.ge_utils import (
     produce_datasource_name_for_entity,
     produce_expectation_suite_name_for_entity,
     produce_ge_context,
+    produce_runtime_validation_config_for_entity,
     produce_validation_config_for_entity,
 )
 from tests.fixtures import ge_test_folder_path
@@ -62,6 +64,18 @@ def test_produce_validation_config_for_entity():
     assert actual == expected
 
 
+def test_produce_runtime_validation_config_for_entity():
+    batch_data = pd.DataFrame({"foo": ["bar"]})
+    actual = produce_runtime_validation_config_for_entity(
+        entity_name="foo", data_origin="OUTPUT", batch_data=batch_data
+    )
+    assert isinstance(actual, dict)
+    assert actual["batch_request"]["datasource_name"] == "foo_datasource"
+    assert actual["batch_request"]["runtime_parameters"]["batch_data"] is batch_data
+    assert actual["batch_request"]["batch_identifiers"] == {"default_identifier_name": "default_identifier_name"}
+    assert actual["expectation_suite_name"] == "foo_table"
+
+
 def test_produce_check_point_config():
     expected = {
         "name": "foo",
@@ -74,6 +88,17 @@ def test_produce_check_point_config():
     assert actual == expected
 
 
+def test_produce_check_point_config_without_data_docs_update():
+    actual = produce_check_point_config(checkpoint_name="foo", validations=[{"foo": "bar"}], update_data_docs=False)
+    assert isinstance(actual, dict)
+    assert actual["class_name"] == "Checkpoint"
+    assert [action["name"] for action in actual["action_list"]] == [
+        "store_validation_result",
+        "store_evaluation_params",
+    ]
+    assert actual["validations"] == [{"foo": "bar"}]
+
+
 def test_produce_datasource_name_for_entity():
     actual = produce_datasource_name_for_entity(entity_name="foo")
     assert isinstance(actual, str)
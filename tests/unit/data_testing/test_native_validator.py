@@ -0,0 +1,159 @@
+"""Tests for the native validator."""
+import json
+import os
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from onto_merger.data.constants import COLUMN_DEFAULT_ID, COLUMN_NAMESPACE
+from onto_merger.data_testing import native_validator
+
+
+def _produce_expectation(expectation_type: str, **kwargs) -> SimpleNamespace:
+    return SimpleNamespace(expectation_type=expectation_type, kwargs=kwargs)
+
+
+@pytest.fixture()
+def nodes() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            COLUMN_DEFAULT_ID: ["MONDO:0000001", "MONDO:0000002", "MONDO:0000002", "foo", np.nan],
+            COLUMN_NAMESPACE: ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "expectation, expected_success, expected_unexpected_count",
+    [
+        (_produce_expectation("expect_column_to_exist", column=COLUMN_DEFAULT_ID), True, None),
+        (_produce_expectation("expect_column_to_exist", column="foo"), False, None),
+        (
+            _produce_expectation(
+                "expect_table_columns_to_match_set", column_set=[COLUMN_NAMESPACE, COLUMN_DEFAULT_ID],
+                exact_match=True
+            ),
+            True,
+            None,
+        ),
+        (
+            _produce_expectation(
+                "expect_table_columns_to_match_ordered_list", column_list=[COLUMN_NAMESPACE, COLUMN_DEFAULT_ID]
+            ),
+            False,
+            None,
+        ),
+        (_produce_expectation("expect_column_values_to_be_of_type", column=COLUMN_DEFAULT_ID, type_="object"), True,
+         None),
+        (_produce_expectation("expect_column_values_to_not_be_null", column=COLUMN_DEFAULT_ID, mostly=1.0), False, 1),
+        (_produce_expectation("expect_column_values_to_be_unique", column=COLUMN_DEFAULT_ID, mostly=1.0), False, 2),
+        (
+            _produce_expectation(
+                "expect_column_value_lengths_to_be_between", column=COLUMN_DEFAULT_ID, min_value=4, max_value=25,
+                mostly=1.0
+            ),
+            False,
+            1,
+        ),
+        (
+            _produce_expectation(
+                "expect_column_values_to_match_regex", column=COLUMN_DEFAULT_ID, regex="^[A-Za-z][\\w]*:\\S+$",
+                mostly=1.0
+            ),
+            False,
+            1,
+        ),
+        (
+            _produce_expectation(
+                "expect_column_values_to_be_in_set", column=COLUMN_NAMESPACE, value_set=["a", "b", "c", "d", "e"],
+                mostly=1.0
+            ),
+            True,
+            0,
+        ),
+        (
+            _produce_expectation("expect_column_values_to_match_regex", column="foo", regex="^a$", mostly=1.0),
+            False,
+            None,
+        ),
+    ],
+)
+def test_evaluate_expectation(nodes: pd.DataFrame, expectation, expected_success: bool, expected_unexpected_count):
+    actual = native_validator._evaluate_expectation(table=nodes, expectation_configuration=expectation)
+    assert actual["success"] is expected_success
+    assert actual["result"].get("unexpected_count") == expected_unexpected_count
+
+
+def test_evaluate_count_column_expectations():
+    steps = pd.DataFrame({"count_unmapped_nodes": [10, 8, 8, 9]})
+    for expectation_type, kwargs, expected_success, expected_unexpected_count in [
+        ("expect_column_values_to_be_of_type", {"type_": "int64"}, True, None),
+        ("expect_column_values_to_be_between", {"min_value": 0, "max_value": None}, True, 0),
+        ("expect_column_values_to_be_between", {"min_value": 9, "max_value": None}, False, 2),
+        ("expect_column_values_to_be_decreasing", {}, False, 1),
+    ]:
+        actual = native_validator._evaluate_expectation(
+            table=steps,
+            expectation_configuration=_produce_expectation(
+                expectation_type, column="count_unmapped_nodes", mostly=1.0, **kwargs
+            ),
+        )
+        assert actual["success"] is expected_success
+        assert actual["result"].get("unexpected_count") == expected_unexpected_count
+
+
+def test_evaluate_expectation_raising_exception():
+    steps = pd.DataFrame({"task": ["ALIGNMENT"], "start_date_time": pd.to_datetime(["2022-01-01"])})
+    for column in ["task", "start_date_time", "foo"]:
+        actual = native_validator._evaluate_expectation(
+            table=steps,
+            expectation_configuration=_produce_expectation(
+                "expect_column_values_to_be_between", column=column, min_value=0, max_value=None, mostly=1.0
+            ),
+        )
+        assert actual["success"] is False
+        assert actual["result"] == {}
+        assert actual["exception_info"]["raised_exception"] is True
+        assert actual["exception_info"]["exception_message"]
+        assert isinstance(actual["exception_info"]["exception_traceback"], str)
+
+
+def test_is_supported():
+    assert native_validator.is_supported(
+        expectation_configurations=[_produce_expectation("expect_column_to_exist", column="foo")]
+    ) is True
+    assert native_validator.is_supported(
+        expectation_configurations=[_produce_expectation("expect_column_kl_divergence_to_be_less_than", column="foo")]
+    ) is False
+
+
+def test_validate_table_and_save_validation_result(nodes: pd.DataFrame, tmp_path):
+    validation_result = native_validator.validate_table(
+        table=nodes,
+        expectation_configurations=[
+            _produce_expectation("expect_column_to_exist", column=COLUMN_DEFAULT_ID),
+            _produce_expectation("expect_column_values_to_be_unique", column=COLUMN_DEFAULT_ID, mostly=1.0),
+        ],
+        expectation_suite_name="nodes_table",
+        datasource_name="nodes_datasource",
+        data_asset_name="input_nodes_data_asset",
+    )
+    assert validation_result["success"] is False
+    assert validation_result["statistics"] == {
+        "evaluated_expectations": 2,
+        "successful_expectations": 1,
+        "unsuccessful_expectations": 1,
+        "success_percent": 50.0,
+    }
+
+    file_path = native_validator.save_validation_result(
+        validation_result=validation_result, ge_base_directory=str(tmp_path)
+    )
+    assert file_path.startswith(os.path.join(str(tmp_path), "uncommitted", "validations", "nodes_table"))
+    with open(file_path) as json_file:
+        validation_json = json.load(json_file)
+    assert validation_json["meta"]["active_batch_definition"]["datasource_name"] == "nodes_datasource"
+    assert validation_json["meta"]["active_batch_definition"]["data_asset_name"] == "input_nodes_data_asset"
+    assert validation_json["results"][1]["result"]["partial_unexpected_list"] == ["MONDO:0000002", "MONDO:0000002"]
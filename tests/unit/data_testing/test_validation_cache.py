@@ -0,0 +1,60 @@
+"""Tests for the validation cache."""
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+
+from onto_merger.data.constants import COLUMN_DEFAULT_ID, VALIDATION_ENGINE_NATIVE
+from onto_merger.data_testing import validation_cache
+
+
+def test_produce_table_fingerprint():
+    nodes = pd.DataFrame({COLUMN_DEFAULT_ID: ["MONDO:0000001", "MONDO:0000002"]})
+    expectations = [SimpleNamespace(expectation_type="expect_column_to_exist", kwargs={"column": COLUMN_DEFAULT_ID})]
+    fingerprint = validation_cache.produce_table_fingerprint(
+        table_name="nodes", table=nodes, expectation_configurations=expectations, data_origin="input",
+        validation_engine=VALIDATION_ENGINE_NATIVE,
+    )
+    assert fingerprint == validation_cache.produce_table_fingerprint(
+        table_name="nodes", table=nodes.copy(), expectation_configurations=expectations, data_origin="input",
+        validation_engine=VALIDATION_ENGINE_NATIVE,
+    )
+    assert fingerprint != validation_cache.produce_table_fingerprint(
+        table_name="nodes", table=nodes.iloc[:1], expectation_configurations=expectations, data_origin="input",
+        validation_engine=VALIDATION_ENGINE_NATIVE,
+    )
+    assert fingerprint != validation_cache.produce_table_fingerprint(
+        table_name="nodes", table=nodes, expectation_configurations=[], data_origin="input",
+        validation_engine=VALIDATION_ENGINE_NATIVE,
+    )
+    assert fingerprint != validation_cache.produce_table_fingerprint(
+        table_name="nodes", table=nodes, expectation_configurations=expectations, data_origin="intermediate",
+        validation_engine=VALIDATION_ENGINE_NATIVE,
+    )
+    assert fingerprint != validation_cache.produce_table_fingerprint(
+        table_name="nodes_seed", table=nodes, expectation_configurations=expectations, data_origin="input",
+        validation_engine=VALIDATION_ENGINE_NATIVE,
+    )
+
+
+def test_store_and_restore_validation_results(tmp_path):
+    cache_directory = os.path.join(tmp_path, "cache")
+    validations_directory = os.path.join(tmp_path, "validations")
+    file_path = os.path.join(validations_directory, "nodes_table", "run", "time", "batch.json")
+    os.makedirs(os.path.dirname(file_path))
+    with open(file_path, "w") as f:
+        f.write("{}")
+    assert validation_cache.restore_validation_results(
+        cache_directory=cache_directory, fingerprint="foo", validations_directory=validations_directory
+    ) is False
+
+    validation_cache.store_validation_results(
+        cache_directory=cache_directory, fingerprint="foo", validations_directory=validations_directory,
+        file_paths=[file_path],
+    )
+    restored_validations_directory = os.path.join(tmp_path, "restored_validations")
+    assert validation_cache.restore_validation_results(
+        cache_directory=cache_directory, fingerprint="foo", validations_directory=restored_validations_directory
+    ) is True
+    assert os.path.isfile(os.path.join(restored_validations_directory, "nodes_table", "run", "time", "batch.json"))
+    assert os.listdir(cache_directory) == ["foo"]